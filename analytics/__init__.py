@@ -0,0 +1,110 @@
+"""Streamlit-free analytics shared by the app, scripts and worker processes."""
+
+from analytics.captains import summarize_captains
+from analytics.dashboard import compute_gw_highlights, summarize_league
+from analytics.differentials import (
+    build_ownership_vectors,
+    compute_differentials,
+    compute_swings,
+    count_league_ownership,
+    manager_differentials,
+)
+from analytics.expected_points import (
+    build_expected_points_table,
+    build_squad_matrix,
+    player_projections,
+    squad_expected_points,
+)
+from analytics.head_to_head import (
+    align_histories,
+    build_head_to_head_table,
+    compute_head_to_head,
+    head_to_head_record,
+    season_summary,
+)
+from analytics.leagues import (
+    build_combined_standings,
+    build_league_overlap,
+    build_membership,
+    build_shared_rivals,
+)
+from analytics.lineups import compute_hindsight_lineups, position_points, summarize_lineup_efficiency
+from analytics.players import build_player_table, summarize_season
+from analytics.similarity import (
+    build_similarity_report,
+    cluster_squads,
+    jaccard,
+    nearest_rivals,
+    squad_bitsets,
+    template_squad,
+)
+from analytics.squad import merge_player_data, merge_player_points, select_best_squad, select_starting_xi
+from analytics.standings import build_sort_orders, build_standings_table
+from analytics.transfers import (
+    build_gameweek_costs,
+    build_manager_transfer_table,
+    build_transfer_analysis,
+    build_transfers_table,
+    compute_transfer_roi,
+    count_hit_costs,
+    count_transferred_players,
+    count_transfers_by_gameweek,
+    summarize_league_transfers,
+    top_transferred,
+)
+from analytics.trends import build_gameweek_matrix, league_rank_matrix, percentile_bands, sample_rows
+
+__all__ = [
+    "summarize_captains",
+    "compute_gw_highlights",
+    "summarize_league",
+    "build_ownership_vectors",
+    "compute_differentials",
+    "compute_swings",
+    "count_league_ownership",
+    "manager_differentials",
+    "build_expected_points_table",
+    "build_squad_matrix",
+    "player_projections",
+    "squad_expected_points",
+    "align_histories",
+    "build_head_to_head_table",
+    "compute_head_to_head",
+    "head_to_head_record",
+    "season_summary",
+    "build_combined_standings",
+    "build_league_overlap",
+    "build_membership",
+    "build_shared_rivals",
+    "compute_hindsight_lineups",
+    "position_points",
+    "summarize_lineup_efficiency",
+    "build_player_table",
+    "summarize_season",
+    "build_similarity_report",
+    "cluster_squads",
+    "jaccard",
+    "nearest_rivals",
+    "squad_bitsets",
+    "template_squad",
+    "merge_player_data",
+    "merge_player_points",
+    "select_best_squad",
+    "select_starting_xi",
+    "build_sort_orders",
+    "build_standings_table",
+    "build_gameweek_costs",
+    "build_manager_transfer_table",
+    "build_transfer_analysis",
+    "build_transfers_table",
+    "compute_transfer_roi",
+    "count_hit_costs",
+    "count_transferred_players",
+    "count_transfers_by_gameweek",
+    "summarize_league_transfers",
+    "top_transferred",
+    "build_gameweek_matrix",
+    "league_rank_matrix",
+    "percentile_bands",
+    "sample_rows",
+]
@@ -0,0 +1,31 @@
+"""Captain choices across a league for one gameweek."""
+
+import pandas as pd
+
+
+def summarize_captains(picks: dict, points: dict, names: dict) -> pd.DataFrame:
+    """Count each captain's pickers and what the armband returned.
+
+    Args:
+        picks: Gameweek picks keyed by entry ID (None when missing).
+        points: Element ID → points scored in the gameweek.
+        names: Element ID → player name.
+
+    Returns:
+        DataFrame with one row per captain, most picked first: element,
+        Captain, Picked by Managers and Points (x2).
+    """
+    captains = pd.Series([
+        next((p["element"] for p in (entry_picks or {}).get("picks", []) if p.get("is_captain")), None)
+        for entry_picks in picks.values()
+    ], dtype="Int64").dropna()
+
+    counts = captains.value_counts(sort=False)
+    table = pd.DataFrame({
+        "element": counts.index.astype(int),
+        "Captain": [names.get(e, "Unknown") for e in counts.index],
+        "Picked by Managers": counts.to_numpy(),
+        "Points (x2)": [points.get(e, 0) * 2 for e in counts.index],
+    })
+    # Ties keep the order captains were first picked in
+    return table.sort_values("Picked by Managers", ascending=False, kind="stable").reset_index(drop=True)
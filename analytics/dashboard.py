@@ -0,0 +1,67 @@
+"""Dashboard figures — league summary and this gameweek's highlights."""
+
+from collections import Counter
+
+
+def summarize_league(standings: list) -> dict:
+    """Count the managers shown and find their average total and leader.
+
+    Returns:
+        Dict with managers, avg_points and leader (the first standings row,
+        or None).
+    """
+    return {
+        "managers": len(standings),
+        "avg_points": sum(s["total"] for s in standings) / len(standings) if standings else 0,
+        "leader": standings[0] if standings else None,
+    }
+
+
+def compute_gw_highlights(standings: list, picks: dict, points: dict, names: dict) -> dict:
+    """Find this gameweek's biggest movers, top score and best captain.
+
+    Args:
+        standings: League standings rows.
+        picks: Current gameweek picks keyed by entry ID (None when missing).
+        points: Element ID → points scored this gameweek.
+        names: Element ID → player name.
+
+    Returns:
+        Dict with ``biggest_rise`` and ``biggest_drop`` ({team, places} or
+        None), ``highest_gw`` ({team, points} or None) and ``best_captain``
+        ({name, points, managers} or None). Managers new to the league
+        (no previous rank) don't count as movers.
+    """
+    biggest_rise = biggest_drop = None
+    max_rise = max_drop = 0
+    for s in standings:
+        if s["last_rank"] == 0:
+            continue
+        change = s["last_rank"] - s["rank"]
+        if change > max_rise:
+            max_rise, biggest_rise = change, s
+        if change < max_drop:
+            max_drop, biggest_drop = change, s
+
+    highest = max(standings, key=lambda s: s["event_total"]) if standings else None
+
+    captains = [
+        next((p["element"] for p in (picks.get(s["entry"]) or {}).get("picks", []) if p.get("is_captain")), None)
+        for s in standings
+    ]
+    captains = [c for c in captains if c is not None]
+    best_captain = None
+    if captains:
+        best_id = max(captains, key=lambda c: points.get(c, 0))
+        best_captain = {
+            "name": names.get(best_id, "Unknown"),
+            "points": points.get(best_id, 0),
+            "managers": Counter(captains)[best_id],
+        }
+
+    return {
+        "biggest_rise": {"team": biggest_rise["entry_name"], "places": max_rise} if biggest_rise else None,
+        "biggest_drop": {"team": biggest_drop["entry_name"], "places": -max_drop} if biggest_drop else None,
+        "highest_gw": {"team": highest["entry_name"], "points": highest["event_total"]} if highest else None,
+        "best_captain": best_captain,
+    }
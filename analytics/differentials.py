@@ -0,0 +1,154 @@
+"""League effective ownership, global ownership and per-manager differentials.
+
+A player only moves a manager up or down the league by the gap between
+how much the manager owns them and how much the league does. With every
+squad as a row of the sparse weight matrix from analytics.expected_points,
+the league's effective ownership of every player is one column sum, and
+every manager's swing on every player is one subtraction over the
+matrix's coordinates.
+"""
+
+import numpy as np
+import pandas as pd
+
+from analytics.expected_points import build_squad_matrix, player_projections
+from analytics.squad import POSITION_NAMES
+
+POSITION_SHORT_NAMES = {1: "GKP", 2: "DEF", 3: "MID", 4: "FWD"}
+
+
+def build_ownership_vectors(squad: dict, bootstrap_data: dict, expected: np.ndarray) -> pd.DataFrame:
+    """Align league and global ownership for every player.
+
+    Args:
+        squad: Output of analytics.expected_points.build_squad_matrix.
+        bootstrap_data: Bootstrap data with ``selected_by_percent`` per player.
+        expected: ``expected`` array from player_projections, which covers
+            every element ID in ``bootstrap_data``.
+
+    Returns:
+        DataFrame indexed by element ID with Player, Team, Pos, xP, League
+        EO % (expected multiplier per manager, so a universal captain is
+        200%), League Owned %, Global Owned % and Gap (league minus global
+        owned, in points of percentage).
+    """
+    elements = bootstrap_data.get("elements", [])
+    ids = np.array([el["id"] for el in elements], dtype=np.int64)
+    managers = max(len(squad["entries"]), 1)
+
+    league_eo = np.bincount(squad["cols"], weights=squad["weights"], minlength=len(expected))[ids] / managers
+    league_owned = np.bincount(squad["cols"], minlength=len(expected))[ids] / managers
+    global_owned = np.array([float(el.get("selected_by_percent") or 0) for el in elements]) / 100
+
+    teams = {t["id"]: t["short_name"] for t in bootstrap_data.get("teams", [])}
+    table = pd.DataFrame({
+        "Player": [el["web_name"] for el in elements],
+        "Team": [teams.get(el["team"], "") for el in elements],
+        "Pos": [POSITION_SHORT_NAMES.get(el["element_type"], "") for el in elements],
+        "xP": expected[ids],
+        "League EO %": league_eo * 100,
+        "League Owned %": league_owned * 100,
+        "Global Owned %": global_owned * 100,
+    }, index=pd.Index(ids, name="element"))
+    table["Gap"] = table["League Owned %"] - table["Global Owned %"]
+    return table
+
+
+def compute_swings(squad: dict, ownership: pd.DataFrame) -> pd.DataFrame:
+    """Score every manager's players by how far they can move them in the league.
+
+    A player's swing for a manager is the manager's expected multiplier on
+    the player minus the league's effective ownership, times the player's
+    expected points: what the manager gains on the average rival if the
+    player returns their expectation. Negative swings are players the
+    manager is under-exposed to.
+
+    Args:
+        squad: Output of analytics.expected_points.build_squad_matrix.
+        ownership: Output of build_ownership_vectors.
+
+    Returns:
+        DataFrame with one row per pick: entry, element, Weight, League EO %
+        and Swing, sorted by entry then Swing descending.
+    """
+    eo = ownership["League EO %"].reindex(squad["cols"], fill_value=0).to_numpy() / 100
+    xp = ownership["xP"].reindex(squad["cols"], fill_value=0).to_numpy()
+    entries = np.asarray(squad["entries"])
+
+    swings = pd.DataFrame({
+        "entry": entries[squad["rows"]] if len(entries) else np.array([], dtype=np.int64),
+        "element": squad["cols"],
+        "Weight": squad["weights"],
+        "League EO %": eo * 100,
+        "Swing": (squad["weights"] - eo) * xp,
+    })
+    return swings.sort_values(["entry", "Swing"], ascending=[True, False], kind="stable").reset_index(drop=True)
+
+
+def compute_differentials(picks: dict, bootstrap_data: dict) -> dict:
+    """Build the ownership vectors and every manager's swings from their picks.
+
+    Args:
+        picks: Latest gameweek picks keyed by entry ID (None when missing).
+        bootstrap_data: Bootstrap data with per-player projections and ownership.
+
+    Returns:
+        Dict with ``ownership`` (build_ownership_vectors) and ``swings``
+        (compute_swings).
+    """
+    projections = player_projections(bootstrap_data)
+    squad = build_squad_matrix(picks, projections["availability"])
+    ownership = build_ownership_vectors(squad, bootstrap_data, projections["expected"])
+    return {"ownership": ownership, "swings": compute_swings(squad, ownership)}
+
+
+def manager_differentials(differentials: dict, entry_id: int, n: int = 10) -> dict:
+    """Pick one manager's report out of compute_differentials.
+
+    Returns:
+        Dict with ``edges`` (the manager's players by swing, best first) and
+        ``threats`` (the league's highest-EO players the manager doesn't
+        own, with their negative swing), both joined to player details.
+    """
+    ownership = differentials["ownership"]
+    swings = differentials["swings"]
+    picks = swings[swings["entry"] == entry_id]
+    details = ["Player", "Team", "Pos", "xP", "Global Owned %"]
+
+    edges = picks.join(ownership[details], on="element")
+    threats = ownership[~ownership.index.isin(picks["element"])]
+    threats = threats.assign(Swing=-threats["League EO %"] / 100 * threats["xP"]).nsmallest(n, "Swing")
+    return {
+        "edges": edges[["Player", "Team", "Pos", "xP", "Weight", "League EO %", "Global Owned %", "Swing"]],
+        "threats": threats[["Player", "Team", "Pos", "xP", "League EO %", "Global Owned %", "Swing"]],
+    }
+
+
+def count_league_ownership(picks: dict, bootstrap_data: dict) -> pd.DataFrame:
+    """Count how many of the league's squads own each player.
+
+    Args:
+        picks: Gameweek picks keyed by entry ID (None when missing).
+        bootstrap_data: Bootstrap data with player names and positions.
+
+    Returns:
+        DataFrame of owned players, most owned first: element, Player,
+        Position ("Goalkeeper" ... "Forward"), Owned By and Ownership % (of
+        managers with picks).
+    """
+    squads = [p["picks"] for p in picks.values() if p and p.get("picks")]
+    owned = pd.Series([pick["element"] for squad in squads for pick in squad], dtype=np.int64)
+    counts = owned.value_counts(sort=False)
+    players = pd.DataFrame(bootstrap_data.get("elements", []), columns=["id", "web_name", "element_type"]).set_index("id")
+    players = players.reindex(counts.index)
+
+    table = pd.DataFrame({
+        "element": counts.index,
+        "Player": players["web_name"].fillna("Unknown").to_numpy(),
+        "Position": players["element_type"].map(
+            {k: name.capitalize() for k, name in POSITION_NAMES.items()}
+        ).fillna("Unknown").to_numpy(),
+        "Owned By": counts.to_numpy(),
+        "Ownership %": (counts.to_numpy() / max(len(squads), 1) * 100).round(1),
+    })
+    return table.sort_values("Ownership %", ascending=False, kind="stable").reset_index(drop=True)
@@ -0,0 +1,162 @@
+"""Next-gameweek expected points for every manager's squad at once.
+
+Each manager's latest picks become one row of a sparse managers × players
+weight matrix: 1 for a starter, 2 for the captain, and fractional weights
+for the vice-captain and bench, which only score when someone ahead of
+them doesn't play. Expected points for the whole league are then a single
+sparse matrix-vector product with the bootstrap player projections.
+"""
+
+import numpy as np
+import pandas as pd
+
+SQUAD_SIZE = 15
+STARTERS = 11
+# Pick slots (0-based positions) by role; FPL always lists the starting
+# goalkeeper first and the bench goalkeeper first on the bench
+_STARTING_GK = 0
+_OUTFIELD_STARTERS = slice(1, STARTERS)
+_BENCH_GK = STARTERS
+_OUTFIELD_BENCH = slice(STARTERS + 1, SQUAD_SIZE)
+
+
+def player_projections(bootstrap_data: dict) -> dict:
+    """Collect per-player projections as dense arrays indexed by element ID.
+
+    Args:
+        bootstrap_data: Bootstrap data with ``ep_next``, ``ep_this``,
+            ``form`` and ``chance_of_playing_next_round`` per player.
+
+    Returns:
+        Dict with ``expected`` (expected points next gameweek: ``ep_next``,
+        falling back to ``ep_this`` then ``form``) and ``availability``
+        (chance of playing, 0–1; no news counts as certain). Index 0 and
+        unknown IDs are 0 points and always available.
+    """
+    elements = bootstrap_data.get("elements", [])
+    size = max((el["id"] for el in elements), default=0) + 1
+    expected = np.zeros(size)
+    availability = np.ones(size)
+    for el in elements:
+        expected[el["id"]] = float(el.get("ep_next") or el.get("ep_this") or el.get("form") or 0)
+        chance = el.get("chance_of_playing_next_round")
+        if chance is not None:
+            availability[el["id"]] = chance / 100
+    return {"expected": expected, "availability": availability}
+
+
+def build_squad_matrix(picks: dict, availability: np.ndarray) -> dict:
+    """Turn managers' picks into a sparse managers × players weight matrix.
+
+    Weights are for a future gameweek, so chips from the picked gameweek
+    are not carried over. The vice-captain's extra weight and the bench
+    weights are the chances they are called on, assuming starters miss
+    independently: the bench goalkeeper covers the starting goalkeeper,
+    and the n-th outfield substitute comes on when at least n outfield
+    starters miss.
+
+    Args:
+        picks: Picks keyed by entry ID (None when missing).
+        availability: ``availability`` array from player_projections.
+
+    Returns:
+        Dict with ``entries`` (entry IDs with picks, in row order) and the
+        matrix in coordinate form: ``rows``, ``cols`` (element IDs) and
+        ``weights``, plus ``bench`` marking bench coordinates.
+    """
+    entries = [e for e, p in picks.items() if p and p.get("picks")]
+    elements = np.zeros((len(entries), SQUAD_SIZE), dtype=np.int64)
+    captain = np.zeros(elements.shape, dtype=bool)
+    vice = np.zeros(elements.shape, dtype=bool)
+    for row, entry_id in enumerate(entries):
+        for pick in picks[entry_id]["picks"]:
+            slot = pick.get("position", 0) - 1
+            if 0 <= slot < SQUAD_SIZE:
+                elements[row, slot] = pick["element"]
+                captain[row, slot] = pick.get("is_captain", False)
+                vice[row, slot] = pick.get("is_vice_captain", False)
+
+    known = elements < len(availability)
+    missing = np.where(known, 1 - availability[np.where(known, elements, 0)], 0)
+
+    # misses[:, k] = chance that exactly k outfield starters don't play
+    misses = np.zeros((len(entries), STARTERS))
+    misses[:, 0] = 1
+    for q in missing[:, _OUTFIELD_STARTERS].T:
+        misses[:, 1:] = misses[:, 1:] * (1 - q[:, None]) + misses[:, :-1] * q[:, None]
+        misses[:, 0] *= 1 - q
+    at_least = 1 - np.cumsum(misses, axis=1)
+
+    weights = np.zeros(elements.shape)
+    weights[:, :STARTERS] = 1
+    weights[captain] += 1
+    weights[vice] += (missing * captain).sum(axis=1)[vice.any(axis=1)]
+    weights[:, _BENCH_GK] = missing[:, _STARTING_GK]
+    weights[:, _OUTFIELD_BENCH] = at_least[:, :SQUAD_SIZE - STARTERS - 1]
+
+    filled = elements.ravel() > 0
+    return {
+        "entries": entries,
+        "rows": np.repeat(np.arange(len(entries)), SQUAD_SIZE)[filled],
+        "cols": elements.ravel()[filled],
+        "weights": weights.ravel()[filled],
+        "bench": np.tile(np.arange(SQUAD_SIZE) >= STARTERS, len(entries))[filled],
+    }
+
+
+def squad_expected_points(squad: dict, expected: np.ndarray, bench_only: bool = False) -> np.ndarray:
+    """Multiply the squad matrix by the player projections.
+
+    Args:
+        squad: Output of build_squad_matrix.
+        expected: ``expected`` array from player_projections.
+        bench_only: Only count the bench coordinates.
+
+    Returns:
+        Expected points per manager, in ``squad["entries"]`` order.
+    """
+    cols = squad["cols"]
+    values = np.where(cols < len(expected), expected[np.minimum(cols, len(expected) - 1)], 0)
+    weights = squad["weights"] * squad["bench"] if bench_only else squad["weights"]
+    return np.bincount(squad["rows"], weights=weights * values, minlength=len(squad["entries"]))
+
+
+def build_expected_points_table(standings: list, picks: dict, bootstrap_data: dict) -> pd.DataFrame:
+    """Project next gameweek's points and the league order after it.
+
+    Args:
+        standings: League standings rows for the managers to project.
+        picks: Latest gameweek picks keyed by entry ID (None when missing).
+        bootstrap_data: Bootstrap data with per-player projections.
+
+    Returns:
+        DataFrame indexed by entry and sorted by expected points, with Team,
+        Captain, Total, xP, Bench xP, xP Rank, Pos, Projected Pos and Move
+        (places gained). Managers without picks are left out.
+    """
+    projections = player_projections(bootstrap_data)
+    squad = build_squad_matrix(picks, projections["availability"])
+    names = {el["id"]: el["web_name"] for el in bootstrap_data.get("elements", [])}
+    standing = {s["entry"]: s for s in standings}
+
+    entries = [e for e in squad["entries"] if e in standing]
+    rows = [squad["entries"].index(e) for e in entries]
+    expected = squad_expected_points(squad, projections["expected"])[rows]
+    bench = squad_expected_points(squad, projections["expected"], bench_only=True)[rows]
+
+    table = pd.DataFrame({
+        "Team": [standing[e]["entry_name"] for e in entries],
+        "Captain": [
+            next((names.get(p["element"], "") for p in picks[e]["picks"] if p.get("is_captain")), "")
+            for e in entries
+        ],
+        "Total": [standing[e].get("total", 0) for e in entries],
+        "xP": np.round(expected, 1),
+        "Bench xP": np.round(bench, 1),
+    }, index=pd.Index(entries, name="entry"))
+
+    table["xP Rank"] = table["xP"].rank(ascending=False, method="min").astype(int)
+    table["Pos"] = table["Total"].rank(ascending=False, method="min").astype(int)
+    table["Projected Pos"] = (table["Total"] + expected).rank(ascending=False, method="min").astype(int)
+    table["Move"] = table["Pos"] - table["Projected Pos"]
+    return table.sort_values(["xP Rank", "Pos"])
@@ -0,0 +1,155 @@
+"""Head-to-head records — gameweek-aligned pair comparisons and league-wide matrices.
+
+Managers are compared only on gameweeks both of them played, so a manager
+who joined late is never matched against someone else's earlier weeks.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def align_histories(history1: list, history2: list) -> pd.DataFrame:
+    """Join two managers' gameweek histories on the gameweek number.
+
+    Args:
+        history1: ``current`` history rows of the first manager.
+        history2: ``current`` history rows of the second manager.
+
+    Returns:
+        DataFrame with columns GW, points_1, points_2, total_1 and total_2
+        for every gameweek both managers played, in gameweek order.
+    """
+    columns = {"event": "GW", "points": "points", "total_points": "total"}
+    left = pd.DataFrame(history1, columns=list(columns)).rename(columns=columns)
+    right = pd.DataFrame(history2, columns=list(columns)).rename(columns=columns)
+    return left.merge(right, on="GW", suffixes=("_1", "_2")).sort_values("GW").reset_index(drop=True)
+
+
+def season_summary(history: list) -> dict:
+    """Sum up one manager's season from their ``current`` history rows.
+
+    Returns:
+        Dict of Total Points, Average Points, Best GW Points, Worst GW
+        Points and Gameweeks Played.
+    """
+    points = [gw["points"] for gw in history]
+    return {
+        "Total Points": sum(points),
+        "Average Points": round(sum(points) / len(points), 1) if points else 0,
+        "Best GW Points": max(points) if points else 0,
+        "Worst GW Points": min(points) if points else 0,
+        "Gameweeks Played": len(points),
+    }
+
+
+def compute_head_to_head(points: pd.DataFrame) -> dict:
+    """Compute every pair's head-to-head record in one pass.
+
+    Each gameweek's scores are encoded as one-hot ("scored exactly v") and
+    prefix ("scored less than v") indicator blocks, so the win counts for
+    all pairs come out of a single matrix product instead of a loop over
+    pairs.
+
+    Args:
+        points: Managers × gameweeks points matrix (from
+            analytics.trends.build_gameweek_matrix), NaN where a manager
+            didn't play.
+
+    Returns:
+        Dict with ``entries`` (entry IDs, in matrix order) and n × n arrays
+        ``wins`` (row beat column), ``draws``, ``played`` (gameweeks both
+        played) and ``points_diff`` (row's points minus column's over those
+        gameweeks). Losses are ``wins.T``.
+    """
+    values = points.to_numpy(dtype=float)
+    present = ~np.isnan(values)
+    n = len(values)
+
+    equal_blocks, below_blocks = [], []
+    for g in range(values.shape[1]):
+        rows = np.flatnonzero(present[:, g])
+        if not len(rows):
+            continue
+        levels, codes = np.unique(values[rows, g], return_inverse=True)
+        equal = np.zeros((n, len(levels)), dtype=np.float32)
+        equal[rows, codes] = 1
+        # below[j, v] = 1 when manager j scored less than levels[v]
+        below = np.cumsum(equal, axis=1) - equal
+        equal_blocks.append(equal)
+        below_blocks.append(below)
+
+    if not equal_blocks:
+        empty = np.zeros((n, n), dtype=np.int16)
+        return {"entries": list(points.index), "wins": empty, "draws": empty, "played": empty, "points_diff": empty}
+
+    equal = np.hstack(equal_blocks)
+    below = np.hstack(below_blocks)
+    mask = present.astype(np.float32)
+    scores = np.where(present, values, 0).astype(np.float32)
+
+    wins = equal @ below.T
+    draws = equal @ equal.T
+    played = mask @ mask.T
+    points_diff = scores @ mask.T - mask @ scores.T
+    for matrix in (wins, draws, played, points_diff):
+        np.fill_diagonal(matrix, 0)
+
+    return {
+        "entries": list(points.index),
+        "wins": wins.round().astype(np.int16),
+        "draws": draws.round().astype(np.int16),
+        "played": played.round().astype(np.int16),
+        "points_diff": points_diff.round().astype(np.int32),
+    }
+
+
+def head_to_head_record(h2h: dict, entry1: int, entry2: int) -> dict:
+    """Look up one pair in the output of compute_head_to_head.
+
+    Returns:
+        Dict with wins, draws, losses, played and points_diff from
+        ``entry1``'s point of view.
+    """
+    i, j = h2h["entries"].index(entry1), h2h["entries"].index(entry2)
+    return {
+        "wins": int(h2h["wins"][i, j]),
+        "draws": int(h2h["draws"][i, j]),
+        "losses": int(h2h["wins"][j, i]),
+        "played": int(h2h["played"][i, j]),
+        "points_diff": int(h2h["points_diff"][i, j]),
+    }
+
+
+def build_head_to_head_table(h2h: dict, names: dict) -> pd.DataFrame:
+    """Summarize everyone's record against the rest of the league.
+
+    Every gameweek counts as a match against each other manager who played
+    it: 3 points for a win, 1 for a draw.
+
+    Args:
+        h2h: Output of compute_head_to_head.
+        names: Entry ID → team name.
+
+    Returns:
+        DataFrame sorted by H2H points, with Rank, Team, P, W, D, L,
+        H2H Pts, Win % and Avg Margin (points per match).
+    """
+    played = h2h["played"].sum(axis=1)
+    wins = h2h["wins"].sum(axis=1)
+    draws = h2h["draws"].sum(axis=1)
+    losses = h2h["wins"].sum(axis=0)
+    matches = np.maximum(played, 1)
+
+    table = pd.DataFrame({
+        "Team": [names.get(e, str(e)) for e in h2h["entries"]],
+        "P": played,
+        "W": wins,
+        "D": draws,
+        "L": losses,
+        "H2H Pts": 3 * wins + draws,
+        "Win %": np.round(wins / matches * 100, 1),
+        "Avg Margin": np.round(h2h["points_diff"].sum(axis=1) / matches, 1),
+    })
+    table = table.sort_values(["H2H Pts", "Avg Margin"], ascending=False, kind="stable").reset_index(drop=True)
+    table.insert(0, "Rank", np.arange(1, len(table) + 1))
+    return table
@@ -0,0 +1,112 @@
+"""Cross-league tables — membership, combined standings, overlap and shared rivals."""
+
+import numpy as np
+import pandas as pd
+
+
+def build_membership(leagues: dict) -> pd.DataFrame:
+    """Flatten several leagues' standings into one membership table.
+
+    Args:
+        leagues: Dict {league_id: {"name", "standings"}} from get_multi_league_context.
+
+    Returns:
+        DataFrame with one row per (manager, league): entry, league (the
+        league ID; names can repeat, so they are mapped in only for display),
+        rank, total, event_total, entry_name and player_name.
+    """
+    rows = [
+        (s["entry"], league_id, s["rank"], s["total"], s["event_total"], s["entry_name"], s["player_name"])
+        for league_id, league in leagues.items()
+        for s in league["standings"]
+    ]
+    return pd.DataFrame(
+        rows, columns=["entry", "league", "rank", "total", "event_total", "entry_name", "player_name"]
+    )
+
+
+def build_combined_standings(membership: pd.DataFrame, histories: dict) -> pd.DataFrame:
+    """Rank every manager across all leagues on their season totals.
+
+    League totals can differ when a league started after GW1, so totals and
+    overall rank come from each manager's history where available.
+
+    Args:
+        membership: Output of build_membership.
+        histories: Dictionary of manager histories keyed by entry ID.
+
+    Returns:
+        DataFrame with one row per manager, sorted by total points.
+    """
+    if membership.empty:
+        return pd.DataFrame()
+
+    managers = membership.groupby("entry").agg(
+        Team=("entry_name", "first"),
+        Manager=("player_name", "first"),
+        Leagues=("league", "nunique"),
+        best_rank=("rank", "min"),
+        league_total=("total", "max"),
+        gw_points=("event_total", "first"),
+    )
+    latest = {
+        entry_id: history["current"][-1]
+        for entry_id, history in histories.items()
+        if history and history.get("current")
+    }
+    season_total = pd.Series([latest.get(e, {}).get("total_points") for e in managers.index], index=managers.index, dtype=float)
+    overall_rank = pd.Series([latest.get(e, {}).get("overall_rank") for e in managers.index], index=managers.index, dtype=float)
+
+    combined = pd.DataFrame({
+        "Team": managers["Team"],
+        "Manager": managers["Manager"],
+        "Total Pts": season_total.fillna(managers["league_total"]).astype(int),
+        "GW Pts": managers["gw_points"],
+        "Overall Rank": overall_rank.astype("Int64"),
+        "Leagues": managers["Leagues"],
+        "Best League Rank": managers["best_rank"],
+    })
+    combined = combined.sort_values(["Total Pts", "GW Pts"], ascending=False).reset_index(drop=True)
+    combined.insert(0, "Rank", np.arange(1, len(combined) + 1))
+    return combined
+
+
+def build_league_overlap(membership: pd.DataFrame) -> pd.DataFrame:
+    """Count the managers every pair of leagues has in common.
+
+    Args:
+        membership: Output of build_membership.
+
+    Returns:
+        Square DataFrame indexed and columned by league ID; the diagonal
+        holds each league's size.
+    """
+    if membership.empty:
+        return pd.DataFrame()
+    onehot = pd.crosstab(membership["entry"], membership["league"]).clip(upper=1)
+    matrix = onehot.to_numpy()
+    return pd.DataFrame(matrix.T @ matrix, index=onehot.columns, columns=onehot.columns)
+
+
+def build_shared_rivals(membership: pd.DataFrame) -> pd.DataFrame:
+    """Managers in more than one of the leagues, with their rank in each.
+
+    Args:
+        membership: Output of build_membership.
+
+    Returns:
+        DataFrame with Team, Manager, Leagues and one rank column per league,
+        named by league ID.
+    """
+    if membership.empty:
+        return pd.DataFrame()
+    counts = membership.groupby("entry")["league"].transform("nunique")
+    shared = membership[counts > 1]
+    if shared.empty:
+        return pd.DataFrame()
+
+    ranks = shared.pivot_table(index="entry", columns="league", values="rank", aggfunc="min")
+    names = shared.groupby("entry")[["entry_name", "player_name"]].first()
+    table = pd.concat([names, ranks.notna().sum(axis=1).rename("Leagues"), ranks.astype("Int64")], axis=1)
+    table = table.rename(columns={"entry_name": "Team", "player_name": "Manager"})
+    return table.sort_values(["Leagues", "Team"], ascending=[False, True]).reset_index(drop=True)
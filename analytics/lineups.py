@@ -0,0 +1,171 @@
+"""Hindsight-optimal lineups from each manager's own squads."""
+
+import numpy as np
+import pandas as pd
+
+SQUAD_SIZE = 15
+
+# After sorting a legal squad by position then points, slots 0-1 are GK,
+# 2-6 DEF, 7-11 MID and 12-14 FWD. The XI always starts the best GK and the
+# formation minimum of 3 DEF, 2 MID and 1 FWD, then the 4 best of the rest.
+_MANDATORY_SLOTS = [0, 2, 3, 4, 7, 8, 12]
+_FLEXIBLE_SLOTS = [5, 6, 9, 10, 11, 13, 14]
+_FLEXIBLE_PICKS = 4
+_SQUAD_POSITIONS = np.array([1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4])
+
+
+def compute_hindsight_lineups(
+    season_picks: dict,
+    histories: dict,
+    points_matrix: pd.DataFrame,
+    bootstrap_data: dict,
+) -> pd.DataFrame:
+    """Solve the best XI and captain from each manager's own squad, every gameweek.
+
+    All manager-gameweeks are solved together as arrays: each squad is sorted
+    by position and points, so the best legal XI is a fixed set of slots plus
+    the top four of the remaining outfielders.
+
+    Args:
+        season_picks: Nested dict {entry_id: {gameweek: picks or None}}.
+        histories: Dictionary of manager histories keyed by entry ID.
+        points_matrix: Players × GW points matrix from load_points_matrix.
+        bootstrap_data: Bootstrap data containing player positions.
+
+    Returns:
+        DataFrame with one row per manager-gameweek: entry, gameweek, actual,
+        optimal, bench_boost and triple_captain.
+    """
+    entries, gameweeks, chips, squads = [], [], [], []
+    for entry_id, by_gw in season_picks.items():
+        for gw, picks in (by_gw or {}).items():
+            elements = [p["element"] for p in (picks or {}).get("picks", [])]
+            if len(elements) != SQUAD_SIZE or gw not in points_matrix.columns:
+                continue
+            entries.append(entry_id)
+            gameweeks.append(gw)
+            chips.append(picks.get("active_chip") or "")
+            squads.append(elements)
+
+    columns = ["entry", "gameweek", "actual", "optimal", "bench_boost", "triple_captain"]
+    if not squads:
+        return pd.DataFrame(columns=columns)
+
+    squads = np.array(squads, dtype=np.int64)
+    gameweeks = np.array(gameweeks, dtype=np.int64)
+    chips = np.array(chips)
+
+    # Look up every pick's points and position in one gather each
+    element_ids = points_matrix.index.to_numpy()
+    rows = np.searchsorted(element_ids, squads).clip(0, len(element_ids) - 1)
+    known = element_ids[rows] == squads
+    cols = points_matrix.columns.get_indexer(gameweeks)
+    points = np.where(known, points_matrix.to_numpy()[rows, cols[:, None]], 0)
+
+    elements = bootstrap_data.get("elements", [])
+    positions_by_id = np.zeros(max([int(squads.max())] + [e["id"] for e in elements]) + 1, dtype=np.int64)
+    for element in elements:
+        positions_by_id[element["id"]] = element["element_type"]
+    positions = positions_by_id[squads]
+
+    order = np.argsort(positions * 1000 - points, axis=1, kind="stable")
+    points = np.take_along_axis(points, order, axis=1)
+    legal = (np.take_along_axis(positions, order, axis=1) == _SQUAD_POSITIONS).all(axis=1)
+
+    flexible = np.sort(points[:, _FLEXIBLE_SLOTS], axis=1)[:, -_FLEXIBLE_PICKS:]
+    xi_points = points[:, _MANDATORY_SLOTS].sum(axis=1) + flexible.sum(axis=1)
+    # The best scorer of each position is always in the XI, except the spare GK
+    best_starter = np.delete(points, 1, axis=1).max(axis=1)
+
+    bench_boost = chips == "bboost"
+    triple_captain = chips == "3xc"
+    captain_extra = np.where(triple_captain, 2, 1)
+    optimal = np.where(
+        bench_boost,
+        points.sum(axis=1) + captain_extra * points.max(axis=1),
+        xi_points + captain_extra * best_starter,
+    )
+
+    actual_lookup = {
+        (entry_id, gw["event"]): gw.get("points", 0)
+        for entry_id, history in histories.items() if history
+        for gw in history.get("current", [])
+    }
+    actual = np.array(
+        [actual_lookup.get((entry_id, int(gw)), np.nan) for entry_id, gw in zip(entries, gameweeks)]
+    )
+
+    df = pd.DataFrame({
+        "entry": entries,
+        "gameweek": gameweeks,
+        "actual": actual,
+        "optimal": optimal,
+        "bench_boost": bench_boost,
+        "triple_captain": triple_captain,
+    })
+    return df[legal & ~np.isnan(actual)].reset_index(drop=True)
+
+
+def summarize_lineup_efficiency(lineups: pd.DataFrame, standings: list) -> pd.DataFrame:
+    """Aggregate manager-gameweek lineups into a per-manager efficiency table.
+
+    Args:
+        lineups: Output of compute_hindsight_lineups.
+        standings: League standings rows, used for team and manager names.
+
+    Returns:
+        DataFrame with Team, Manager, Optimal Pts, Actual Pts, Pts Lost,
+        Efficiency % and Perfect GWs, sorted by efficiency.
+    """
+    if lineups.empty:
+        return pd.DataFrame()
+
+    lineups = lineups.assign(
+        lost=lineups["optimal"] - lineups["actual"],
+        perfect=lineups["optimal"] <= lineups["actual"],
+    )
+    totals = lineups.groupby("entry").agg(
+        optimal=("optimal", "sum"),
+        actual=("actual", "sum"),
+        lost=("lost", "sum"),
+        perfect=("perfect", "sum"),
+    )
+    names = {s["entry"]: (s["entry_name"], s["player_name"]) for s in standings}
+    summary = pd.DataFrame({
+        "Team": [names.get(e, ("Unknown", ""))[0] for e in totals.index],
+        "Manager": [names.get(e, ("", "Unknown"))[1] for e in totals.index],
+        "Optimal Pts": totals["optimal"].astype(int).to_numpy(),
+        "Actual Pts": totals["actual"].astype(int).to_numpy(),
+        "Pts Lost": totals["lost"].astype(int).to_numpy(),
+        "Efficiency %": (totals["actual"] / totals["optimal"].where(totals["optimal"] > 0) * 100).round(1).fillna(0).to_numpy(),
+        "Perfect GWs": totals["perfect"].astype(int).to_numpy(),
+    })
+    return summary.sort_values("Efficiency %", ascending=False).reset_index(drop=True)
+
+
+POSITION_GROUPS = {1: "Goalkeeper", 2: "Defense", 3: "Midfield", 4: "Attack"}
+
+
+def position_points(picks: dict, points: dict, bootstrap_data: dict) -> pd.DataFrame:
+    """Total each manager's scored points by position for one gameweek.
+
+    Args:
+        picks: Gameweek picks keyed by entry ID (None when missing).
+        points: Element ID → points scored in the gameweek.
+        bootstrap_data: Bootstrap data containing player positions.
+
+    Returns:
+        DataFrame indexed by entry ID with one column per position in
+        POSITION_GROUPS, counting captaincy and bench multipliers. Managers
+        without picks are left out.
+    """
+    positions = {e["id"]: e["element_type"] for e in bootstrap_data.get("elements", [])}
+    rows = [
+        (entry_id, POSITION_GROUPS[positions[p["element"]]], p.get("multiplier", 0) * points.get(p["element"], 0))
+        for entry_id, entry_picks in picks.items()
+        for p in (entry_picks or {}).get("picks", [])
+        if positions.get(p["element"]) in POSITION_GROUPS
+    ]
+    table = pd.DataFrame(rows, columns=["entry", "position", "points"])
+    by_position = table.groupby(["entry", "position"])["points"].sum().unstack(fill_value=0)
+    return by_position.reindex(columns=list(POSITION_GROUPS.values()), fill_value=0).astype(int)
@@ -0,0 +1,98 @@
+"""Global player and season figures from the bootstrap data."""
+
+import pandas as pd
+
+from analytics.differentials import POSITION_SHORT_NAMES
+
+CHIP_LABELS = {
+    "wildcard": "Wildcard",
+    "freehit": "Free Hit",
+    "bboost": "Bench Boost",
+    "3xc": "Triple Captain",
+}
+
+
+def build_player_table(bootstrap_data: dict) -> pd.DataFrame:
+    """Build one row per FPL player with the columns every global view uses.
+
+    Returns:
+        DataFrame with Player, Team, Pos, Price (£m), Total Pts, GW Pts,
+        Form, Owned %, ICT, Pts / £m, and gameweek and season transfers in,
+        out and net ("In (GW)" ... "Net (Season)").
+    """
+    columns = [
+        "id", "web_name", "team", "element_type", "now_cost", "total_points", "event_points", "form",
+        "selected_by_percent", "ict_index", "transfers_in_event", "transfers_out_event", "transfers_in",
+        "transfers_out",
+    ]
+    elements = pd.DataFrame(bootstrap_data.get("elements", []), columns=columns)
+    teams = {t["id"]: t["short_name"] for t in bootstrap_data.get("teams", [])}
+
+    def number(column: str, dtype) -> pd.Series:
+        return pd.to_numeric(elements[column], errors="coerce").fillna(0).astype(dtype)
+
+    price = elements["now_cost"] / 10
+    total_points = number("total_points", int)
+    table = pd.DataFrame({
+        "Player": elements["web_name"],
+        "Team": elements["team"].map(teams).fillna(""),
+        "Pos": elements["element_type"].map(POSITION_SHORT_NAMES).fillna(""),
+        "Price": price.round(1),
+        "Total Pts": total_points,
+        "GW Pts": number("event_points", int),
+        "Form": number("form", float),
+        "Owned %": number("selected_by_percent", float),
+        "ICT": number("ict_index", float),
+        "Pts / £m": (total_points / price.clip(lower=0.1)).round(1),
+        "In (GW)": number("transfers_in_event", int),
+        "Out (GW)": number("transfers_out_event", int),
+        "In (Season)": number("transfers_in", int),
+        "Out (Season)": number("transfers_out", int),
+    })
+    table.insert(table.columns.get_loc("Out (GW)") + 1, "Net (GW)", table["In (GW)"] - table["Out (GW)"])
+    table["Net (Season)"] = table["In (Season)"] - table["Out (Season)"]
+    return table.set_index(elements["id"].rename("element"))
+
+
+def summarize_season(bootstrap_data: dict) -> dict:
+    """Collect the season's gameweek averages, high scores and chip plays.
+
+    Returns:
+        Dict with ``scores`` (DataFrame of Gameweek, Global Avg and Highest
+        Score per played gameweek), ``season_avg``, ``best_avg_gw`` (the
+        event with the highest average), ``high_score``, ``high_score_gw``,
+        ``chips`` (Gameweek, Chip, Managers) and ``chip_totals`` (Chip, Total
+        Uses). ``scores`` is empty before the first gameweek starts.
+    """
+    played = [e for e in bootstrap_data.get("events", []) if e.get("finished") or e.get("is_current")]
+
+    avgs = [e["average_entry_score"] for e in played if e.get("average_entry_score")]
+    highs = [e["highest_score"] for e in played if e.get("highest_score")]
+    high_score = max(highs) if highs else 0
+
+    chips = pd.DataFrame(
+        [
+            {"Gameweek": e["id"], "Chip": CHIP_LABELS.get(c["chip_name"], c["chip_name"]), "Managers": c["num_played"]}
+            for e in played
+            for c in e.get("chip_plays", [])
+        ],
+        columns=["Gameweek", "Chip", "Managers"],
+    )
+    chip_totals = chips.groupby("Chip")["Managers"].sum().reset_index()
+    chip_totals.columns = ["Chip", "Total Uses"]
+
+    return {
+        "scores": pd.DataFrame(
+            [
+                {"Gameweek": e["id"], "Global Avg": e.get("average_entry_score", 0), "Highest Score": e.get("highest_score", 0)}
+                for e in played
+            ],
+            columns=["Gameweek", "Global Avg", "Highest Score"],
+        ),
+        "season_avg": round(sum(avgs) / len(avgs), 1) if avgs else 0,
+        "best_avg_gw": max(played, key=lambda e: e.get("average_entry_score") or 0) if played else None,
+        "high_score": high_score,
+        "high_score_gw": next((e["id"] for e in played if e.get("highest_score") == high_score), "—"),
+        "chips": chips,
+        "chip_totals": chip_totals,
+    }
@@ -0,0 +1,171 @@
+"""Monte Carlo projections of the mini-league's final standings.
+
+Each manager's remaining gameweeks are modelled as independent normal
+draws. The mean blends the expected points of their current squad (see
+analytics.expected_points) with their recent average; the spread is
+their own gameweek-to-gameweek standard deviation. The sum of the
+remaining gameweeks is then itself normal, so a season is one draw per
+manager and tens of thousands of seasons are a single array operation,
+split into chunks across a process pool for large leagues.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from analytics.expected_points import build_squad_matrix, player_projections, squad_expected_points
+from config import SIMULATION_WORKERS
+
+DEFAULT_SIMULATIONS = 20000
+SIMULATION_CHUNK = 5000
+RECENT_GAMEWEEKS = 6
+SQUAD_WEIGHT = 0.5
+# Floor on a manager's per-gameweek standard deviation, in points
+MIN_GW_STD = 8.0
+# Below this many simulated manager-seasons the pool costs more than it saves
+_POOL_THRESHOLD = 2_000_000
+
+_pool = None
+
+
+def remaining_gameweeks(bootstrap_data: dict) -> int:
+    """Count the gameweeks that have not started yet."""
+    return sum(
+        1 for event in bootstrap_data.get("events", [])
+        if not event.get("finished") and not event.get("is_current")
+    )
+
+
+def build_projection_inputs(standings: list, histories: dict, picks: dict, bootstrap_data: dict) -> pd.DataFrame:
+    """Estimate each manager's current total and per-gameweek mean and spread.
+
+    Args:
+        standings: League standings rows for the managers to project.
+        histories: Dictionary of manager histories keyed by entry ID.
+        picks: Latest gameweek picks keyed by entry ID (None when missing).
+        bootstrap_data: Bootstrap data with per-player projections.
+
+    Returns:
+        DataFrame indexed by entry with team, total, squad_ep (NaN without
+        picks), recent_mean, mean and std.
+    """
+    projections = player_projections(bootstrap_data)
+    squad = build_squad_matrix(picks, projections["availability"])
+    squad_points = dict(zip(squad["entries"], squad_expected_points(squad, projections["expected"])))
+
+    rows = []
+    for s in standings:
+        history = (histories.get(s["entry"]) or {}).get("current", [])
+        net = np.array([gw["points"] - gw.get("event_transfers_cost", 0) for gw in history], dtype=float)
+        total = history[-1]["total_points"] if history else s.get("total", 0)
+
+        rows.append({
+            "entry": s["entry"],
+            "team": s["entry_name"],
+            "total": total,
+            "squad_ep": squad_points.get(s["entry"], np.nan),
+            "recent_mean": net[-RECENT_GAMEWEEKS:].mean() if len(net) else np.nan,
+            "std": net.std(ddof=1) if len(net) >= 3 else np.nan,
+        })
+
+    inputs = pd.DataFrame(rows, columns=["entry", "team", "total", "squad_ep", "recent_mean", "std"]).set_index("entry")
+    if inputs.empty:
+        inputs["mean"] = pd.Series(dtype=float)
+        return inputs
+
+    league_mean = inputs["recent_mean"].mean()
+    recent = inputs["recent_mean"].fillna(inputs["squad_ep"]).fillna(league_mean if pd.notna(league_mean) else 0)
+    squad = inputs["squad_ep"].fillna(recent)
+    inputs["mean"] = SQUAD_WEIGHT * squad + (1 - SQUAD_WEIGHT) * recent
+    league_std = inputs["std"].median()
+    inputs["std"] = inputs["std"].fillna(league_std if pd.notna(league_std) else MIN_GW_STD).clip(lower=MIN_GW_STD)
+    return inputs
+
+
+def simulate_finishing_positions(
+    inputs: pd.DataFrame,
+    remaining: int,
+    n_sims: int = DEFAULT_SIMULATIONS,
+    seed: int = 0,
+) -> np.ndarray:
+    """Simulate the rest of the season and count where each manager finishes.
+
+    Args:
+        inputs: Output of build_projection_inputs.
+        remaining: Gameweeks still to be played.
+        n_sims: Number of simulated seasons.
+        seed: Seed for reproducible results.
+
+    Returns:
+        n × n array; row i, column p is the probability that manager i
+        (in ``inputs`` order) finishes in position p + 1.
+    """
+    n = len(inputs)
+    if n == 0:
+        return np.zeros((0, 0))
+
+    args = (
+        inputs["total"].to_numpy(dtype=float),
+        inputs["mean"].to_numpy(dtype=float) * remaining,
+        inputs["std"].to_numpy(dtype=float) * np.sqrt(remaining),
+    )
+    sizes = [SIMULATION_CHUNK] * (n_sims // SIMULATION_CHUNK)
+    if n_sims % SIMULATION_CHUNK:
+        sizes.append(n_sims % SIMULATION_CHUNK)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if SIMULATION_WORKERS > 1 and len(sizes) > 1 and n_sims * n >= _POOL_THRESHOLD:
+        results = _get_pool().map(_simulate_chunk, *zip(*[(*args, size, s) for size, s in zip(sizes, seeds)]))
+    else:
+        results = (_simulate_chunk(*args, size, s) for size, s in zip(sizes, seeds))
+
+    counts = np.zeros((n, n), dtype=np.int64)
+    for chunk_counts in results:
+        counts += chunk_counts
+    return counts / n_sims
+
+
+def summarize_projections(inputs: pd.DataFrame, probabilities: np.ndarray, remaining: int) -> pd.DataFrame:
+    """Turn finishing-position probabilities into a per-manager table.
+
+    Returns:
+        DataFrame sorted by win probability with Team, Current Pts,
+        Projected Pts, Win %, Top 3 %, Last %, Expected Pos and Most Likely.
+    """
+    n = len(inputs)
+    positions = np.arange(1, n + 1)
+    table = pd.DataFrame({
+        "Team": inputs["team"].to_numpy(),
+        "Current Pts": inputs["total"].to_numpy(dtype=int),
+        "Projected Pts": np.round(inputs["total"].to_numpy() + inputs["mean"].to_numpy() * remaining).astype(int),
+        "Win %": probabilities[:, 0] * 100,
+        "Top 3 %": probabilities[:, :3].sum(axis=1) * 100,
+        "Last %": probabilities[:, -1] * 100,
+        "Expected Pos": probabilities @ positions,
+        "Most Likely": probabilities.argmax(axis=1) + 1,
+    }, index=inputs.index)
+    return table.sort_values(["Win %", "Expected Pos"], ascending=[False, True])
+
+
+def _simulate_chunk(totals: np.ndarray, means: np.ndarray, stds: np.ndarray, size: int, seed) -> np.ndarray:
+    """Simulate ``size`` seasons and return finishing-position counts."""
+    n = len(totals)
+    rng = np.random.default_rng(seed)
+    finals = totals + means + stds * rng.standard_normal((size, n))
+    # order[s, p] is the manager finishing in position p of season s
+    order = np.argsort(-finals, axis=1)
+    return np.bincount((order * n + np.arange(n)).ravel(), minlength=n * n).reshape(n, n)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Return the shared simulation pool, starting it on first use.
+
+    Workers are spawned rather than forked, since the app's server process
+    runs threads.
+    """
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(SIMULATION_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
@@ -0,0 +1,238 @@
+"""Squad similarity — player bitsets, pairwise Jaccard, clusters and template distance.
+
+Each squad is a fixed-width bitset with one bit per element ID, so the
+players two managers share are the popcount of the AND of their bitsets.
+Pairwise similarity is computed in row chunks with a bounded working set,
+which keeps leagues of thousands of managers (millions of pairs) to a few
+vectorized passes without ever holding an n × n matrix of bit words.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Template squad shape: goalkeepers, defenders, midfielders, forwards
+TEMPLATE_QUOTAS = {1: 2, 2: 5, 3: 5, 4: 3}
+DEFAULT_CLUSTERS = 4
+# Upper bound on 64-bit words in flight per chunk (32 MB)
+_CHUNK_WORDS = 1 << 22
+# Members tried as a cluster's new medoid per iteration
+_MEDOID_CANDIDATES = 256
+_MAX_ITERATIONS = 20
+
+
+def squad_bitsets(picks: dict, n_elements: int) -> dict:
+    """Encode every manager's squad as a player bitset.
+
+    Args:
+        picks: Picks keyed by entry ID (None when missing).
+        n_elements: Number of bit positions, i.e. highest element ID + 1.
+
+    Returns:
+        Dict with ``entries`` (entry IDs with picks, in row order) and
+        ``bits``, a managers × words uint64 array.
+    """
+    entries = [e for e, p in picks.items() if p and p.get("picks")]
+    words = max((n_elements + 63) // 64, 1)
+    bits = np.zeros((len(entries), words), dtype=np.uint64)
+    for row, entry_id in enumerate(entries):
+        ids = np.array([p["element"] for p in picks[entry_id]["picks"] if 0 <= p["element"] < words * 64], dtype=np.uint64)
+        np.bitwise_or.at(bits[row], (ids >> np.uint64(6)).astype(np.intp), np.uint64(1) << (ids & np.uint64(63)))
+    return {"entries": entries, "bits": bits}
+
+
+def popcount(bits: np.ndarray) -> np.ndarray:
+    """Count the set bits of each row of a bitset array."""
+    return np.bitwise_count(bits).sum(axis=-1, dtype=np.int32)
+
+
+def jaccard(rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """Jaccard similarity of every row bitset with every column bitset.
+
+    Args:
+        rows: r × words bitsets.
+        cols: c × words bitsets.
+
+    Returns:
+        r × c float32 array; 0 where both squads are empty.
+    """
+    out = np.empty((len(rows), len(cols)), dtype=np.float32)
+    row_sizes, col_sizes = popcount(rows), popcount(cols)
+    for start, stop in _chunks(len(rows), len(cols) * rows.shape[1]):
+        shared = popcount(rows[start:stop, None, :] & cols[None, :, :])
+        union = row_sizes[start:stop, None] + col_sizes[None, :] - shared
+        out[start:stop] = np.divide(shared, union, out=np.zeros(shared.shape), where=union > 0)
+    return out
+
+
+def nearest_rivals(bits: np.ndarray) -> dict:
+    """Find each manager's most similar rival, one chunk of pairs at a time.
+
+    Returns:
+        Dict of per-manager arrays: ``nearest`` (row of the most similar
+        other manager, -1 when alone), ``similarity`` (their Jaccard
+        similarity) and ``mean`` (average similarity to everyone else).
+    """
+    n = len(bits)
+    nearest = np.full(n, -1)
+    best = np.zeros(n, dtype=np.float32)
+    mean = np.zeros(n, dtype=np.float32)
+    if n < 2:
+        return {"nearest": nearest, "similarity": best, "mean": mean}
+
+    for start, stop in _chunks(n, n):
+        block = jaccard(bits[start:stop], bits)
+        mean[start:stop] = (block.sum(axis=1) - np.diag(block[:, start:stop])) / (n - 1)
+        block[np.arange(stop - start), np.arange(start, stop)] = -1
+        nearest[start:stop] = block.argmax(axis=1)
+        best[start:stop] = block.max(axis=1)
+    return {"nearest": nearest, "similarity": best, "mean": mean}
+
+
+def template_squad(bits: np.ndarray, element_types: np.ndarray) -> np.ndarray:
+    """Build the league template: the most owned players in a valid squad shape.
+
+    Args:
+        bits: managers × words squad bitsets.
+        element_types: Position per bit (element ID), 0 where unknown.
+
+    Returns:
+        Bitset (one row of words) of the template squad.
+    """
+    owners = _unpack(bits).sum(axis=0)[:len(element_types)]
+    template = np.zeros(bits.shape[1], dtype=np.uint64)
+    for position, quota in TEMPLATE_QUOTAS.items():
+        candidates = np.flatnonzero((element_types == position) & (owners > 0))
+        chosen = candidates[np.argsort(-owners[candidates], kind="stable")[:quota]].astype(np.uint64)
+        np.bitwise_or.at(template, (chosen >> np.uint64(6)).astype(np.intp), np.uint64(1) << (chosen & np.uint64(63)))
+    return template
+
+
+def cluster_squads(bits: np.ndarray, k: int = DEFAULT_CLUSTERS, seed: int = 0) -> dict:
+    """Group squads with k-medoids on Jaccard distance.
+
+    Medoids are seeded k-medoids++ style and refined by alternating
+    assignment and medoid updates; large clusters try a sample of their
+    members as the new medoid, so each pass stays well under O(n²).
+
+    Args:
+        bits: managers × words squad bitsets.
+        k: Number of clusters (capped at the number of managers).
+        seed: Seed for reproducible results.
+
+    Returns:
+        Dict with ``labels`` (cluster per manager, largest cluster first)
+        and ``medoids`` (row of each cluster's most central squad).
+    """
+    n = len(bits)
+    k = min(k, n)
+    if k == 0:
+        return {"labels": np.zeros(0, dtype=int), "medoids": np.zeros(0, dtype=int)}
+
+    rng = np.random.default_rng(seed)
+    medoids = [int(rng.integers(n))]
+    distance = 1 - jaccard(bits, bits[medoids])[:, 0]
+    while len(medoids) < k:
+        weights = distance.astype(float) ** 2
+        pick = int(rng.choice(n, p=weights / weights.sum())) if weights.sum() > 0 else int(rng.integers(n))
+        medoids.append(pick)
+        distance = np.minimum(distance, 1 - jaccard(bits, bits[[pick]])[:, 0])
+    medoids = np.array(medoids)
+
+    for _ in range(_MAX_ITERATIONS):
+        labels = jaccard(bits, bits[medoids]).argmax(axis=1)
+        updated = medoids.copy()
+        for c in range(k):
+            members = np.flatnonzero(labels == c)
+            if not len(members):
+                continue
+            candidates = members
+            if len(members) > _MEDOID_CANDIDATES:
+                candidates = rng.choice(members, _MEDOID_CANDIDATES, replace=False)
+            cost = (1 - jaccard(bits[candidates], bits[members])).sum(axis=1)
+            if cost.min() < (1 - jaccard(bits[[medoids[c]]], bits[members])).sum():
+                updated[c] = candidates[cost.argmin()]
+        if np.array_equal(updated, medoids):
+            break
+        medoids = updated
+
+    labels = jaccard(bits, bits[medoids]).argmax(axis=1)
+    order = np.argsort(-np.bincount(labels, minlength=k), kind="stable")
+    relabel = np.empty(k, dtype=int)
+    relabel[order] = np.arange(k)
+    return {"labels": relabel[labels], "medoids": medoids[order]}
+
+
+def build_similarity_report(standings: list, picks: dict, bootstrap_data: dict, k: int = DEFAULT_CLUSTERS) -> dict:
+    """Compare every manager's squad with the rest of the league.
+
+    Args:
+        standings: League standings rows for the managers to compare.
+        picks: Gameweek picks keyed by entry ID (None when missing).
+        bootstrap_data: Bootstrap data with ``element_type`` per player.
+        k: Number of clusters.
+
+    Returns:
+        Dict with ``table`` (per manager: Team, Group, Nearest Rival,
+        Similarity %, Avg Similarity %, Template Distance), ``groups`` (per
+        cluster: Group, Managers, Typical Squad and Core Players, the
+        players most of the group own), ``template`` (template player
+        names) and ``entries``/``bits`` for pairwise views.
+    """
+    elements = bootstrap_data.get("elements", [])
+    size = max((el["id"] for el in elements), default=0) + 1
+    element_types = np.zeros(size, dtype=np.int64)
+    names = np.full(size, "", dtype=object)
+    for el in elements:
+        element_types[el["id"]] = el["element_type"]
+        names[el["id"]] = el["web_name"]
+
+    wanted = {s["entry"]: s["entry_name"] for s in standings}
+    squads = squad_bitsets({e: p for e, p in picks.items() if e in wanted}, size)
+    entries, bits = squads["entries"], squads["bits"]
+    teams = [wanted[e] for e in entries]
+
+    rivals = nearest_rivals(bits)
+    template = template_squad(bits, element_types)
+    clusters = cluster_squads(bits, k, seed=len(entries))
+
+    table = pd.DataFrame({
+        "Team": teams,
+        "Group": clusters["labels"] + 1,
+        "Nearest Rival": [teams[i] if i >= 0 else "" for i in rivals["nearest"]],
+        "Similarity %": rivals["similarity"] * 100,
+        "Avg Similarity %": rivals["mean"] * 100,
+        "Template Distance": 1 - jaccard(bits, template[None, :])[:, 0] if len(bits) else np.zeros(0),
+    }, index=pd.Index(entries, name="entry"))
+
+    owned = _unpack(bits)[:, :size]
+    groups = []
+    for c, medoid in enumerate(clusters["medoids"]):
+        members = clusters["labels"] == c
+        share = owned[members].mean(axis=0)
+        core = np.argsort(-share, kind="stable")[:5]
+        groups.append({
+            "Group": c + 1,
+            "Managers": int(members.sum()),
+            "Typical Squad": teams[medoid],
+            "Core Players": ", ".join(f"{names[p]} ({share[p]:.0%})" for p in core if share[p] > 0),
+        })
+
+    return {
+        "table": table.sort_values(["Group", "Template Distance"]),
+        "groups": pd.DataFrame(groups, columns=["Group", "Managers", "Typical Squad", "Core Players"]),
+        "template": [names[p] for p in np.flatnonzero(_unpack(template[None, :])[0, :size])],
+        "entries": entries,
+        "bits": bits,
+    }
+
+
+def _unpack(bits: np.ndarray) -> np.ndarray:
+    """Expand bitsets to a managers × bit positions uint8 array."""
+    return np.unpackbits(bits.view(np.uint8), axis=-1, bitorder="little")
+
+
+def _chunks(n: int, words_per_row: int):
+    """Split ``n`` rows into ranges that keep each chunk under _CHUNK_WORDS."""
+    step = max(_CHUNK_WORDS // max(words_per_row, 1), 1)
+    for start in range(0, n, step):
+        yield start, min(start + step, n)
@@ -0,0 +1,301 @@
+"""Squad selection logic for best performers.
+
+The best squad is the highest-scoring legal FPL squad: 2 GK, 5 DEF, 5 MID and
+3 FWD within the budget and with at most three players from any one club.
+It is solved exactly with a DP over clubs whose state is the number of players
+picked per position and the money spent, in £0.1m buckets.
+"""
+
+from itertools import combinations
+
+import numpy as np
+
+POSITION_NAMES = {
+    1: "goalkeeper",
+    2: "defender",
+    3: "midfielder",
+    4: "forward"
+}
+
+SQUAD_COMPOSITION = {
+    "goalkeeper": 2,
+    "defender": 5,
+    "midfielder": 5,
+    "forward": 3
+}
+
+# Starting XI formation limits (min, max) per position
+XI_LIMITS = {
+    "goalkeeper": (1, 1),
+    "defender": (3, 5),
+    "midfielder": (2, 5),
+    "forward": (1, 3),
+}
+
+SQUAD_BUDGET = 100.0  # £m
+MAX_PER_CLUB = 3
+
+_NEG = np.iinfo(np.int32).min // 4
+
+
+def merge_player_data(bootstrap_data: dict, live_data: dict) -> list:
+    """Merge bootstrap metadata with live performance data.
+
+    Args:
+        bootstrap_data: Bootstrap data containing player metadata and teams.
+        live_data: Live gameweek data containing player performance stats.
+
+    Returns:
+        List of dicts with {id, web_name, element_type, team, team_code, total_points, price}
+    """
+    # Build points lookup from live data
+    points_lookup = {}
+    for element in live_data.get("elements", []):
+        points_lookup[element["id"]] = element.get("stats", {}).get("total_points", 0)
+
+    return merge_player_points(bootstrap_data, points_lookup)
+
+
+def merge_player_points(bootstrap_data: dict, points_lookup) -> list:
+    """Merge bootstrap metadata with per-player points.
+
+    Args:
+        bootstrap_data: Bootstrap data containing player metadata and teams.
+        points_lookup: Mapping (dict or Series) of element ID to points scored.
+
+    Returns:
+        List of dicts with {id, web_name, element_type, team, team_code, total_points, price}
+    """
+    # Get all players from bootstrap
+    players = bootstrap_data.get("elements", [])
+
+    # Build team lookup with both short_name and team_code
+    teams = {}
+    for t in bootstrap_data.get("teams", []):
+        teams[t["id"]] = {
+            "short_name": t["short_name"],
+            "code": t["code"]
+        }
+
+    # Merge
+    merged = []
+    for player in players:
+        team_info = teams.get(player["team"], {"short_name": "Unknown", "code": 0})
+        # Convert price from tenths to actual price (e.g., 48 -> £4.8m)
+        price = player.get("now_cost", 0) / 10
+        merged.append({
+            "id": player["id"],
+            "web_name": player["web_name"],
+            "element_type": player["element_type"],
+            "team": team_info["short_name"],
+            "team_code": team_info["code"],
+            "total_points": int(points_lookup.get(player["id"], 0)),
+            "price": price
+        })
+
+    return merged
+
+
+def select_best_squad(
+    all_players: list,
+    budget: float = SQUAD_BUDGET,
+    max_per_club: int = MAX_PER_CLUB,
+) -> dict:
+    """Select the highest-scoring legal 15-man squad.
+
+    Args:
+        all_players: List of player dicts with element_type, team, price and total_points.
+        budget: Squad budget in £m.
+        max_per_club: Maximum number of players from a single club.
+
+    Returns:
+        Dict with keys: goalkeepers, defenders, midfielders, forwards. Each position
+        is sorted by total_points descending. Lists are empty if no legal squad exists.
+    """
+    squad = {f"{position}s": [] for position in SQUAD_COMPOSITION}
+
+    players = [p for p in all_players if p["element_type"] in POSITION_NAMES]
+    if not players:
+        return squad
+
+    clubs = {name: i for i, name in enumerate(sorted({str(p["team"]) for p in players}))}
+    chosen = _solve_squad(
+        costs=np.array([int(round(p["price"] * 10)) for p in players], dtype=np.int64),
+        points=np.array([int(p["total_points"]) for p in players], dtype=np.int64),
+        positions=np.array([p["element_type"] for p in players], dtype=np.int64),
+        clubs=np.array([clubs[str(p["team"])] for p in players], dtype=np.int64),
+        budget=int(round(budget * 10)),
+        max_per_club=max_per_club,
+    )
+    if chosen is None:
+        return squad
+
+    for i in chosen:
+        player = players[i]
+        squad[f"{POSITION_NAMES[player['element_type']]}s"].append(player)
+    for position_players in squad.values():
+        position_players.sort(key=lambda x: x["total_points"], reverse=True)
+
+    return squad
+
+
+def select_starting_xi(squad: dict) -> dict:
+    """Pick the best legal starting XI and bench from a 15-man squad.
+
+    Args:
+        squad: Dict with keys goalkeepers, defenders, midfielders, forwards.
+
+    Returns:
+        Dict with the same position keys holding the starters, plus "bench"
+        (goalkeeper first, then outfielders by points) and "captain".
+    """
+    ranked = {
+        position: sorted(squad.get(f"{position}s", []), key=lambda x: x["total_points"], reverse=True)
+        for position in SQUAD_COMPOSITION
+    }
+
+    # Fill the formation minimums, then the best remaining outfielders up to 11
+    starting = {position: players[:XI_LIMITS[position][0]] for position, players in ranked.items()}
+    spare = [
+        (player, position)
+        for position, players in ranked.items()
+        if position != "goalkeeper"
+        for player in players[XI_LIMITS[position][0]:XI_LIMITS[position][1]]
+    ]
+    spare.sort(key=lambda x: x[0]["total_points"], reverse=True)
+    open_slots = 11 - sum(len(players) for players in starting.values())
+    for player, position in spare[:max(open_slots, 0)]:
+        starting[position].append(player)
+
+    starter_ids = {p["id"] for players in starting.values() for p in players}
+    bench_gk = [p for p in ranked["goalkeeper"] if p["id"] not in starter_ids]
+    bench_outfield = [
+        p for position, players in ranked.items() if position != "goalkeeper"
+        for p in players if p["id"] not in starter_ids
+    ]
+    bench_outfield.sort(key=lambda x: x["total_points"], reverse=True)
+
+    starters = [p for players in starting.values() for p in players]
+    xi = {f"{position}s": players for position, players in starting.items()}
+    xi["bench"] = bench_gk + bench_outfield
+    xi["captain"] = max(starters, key=lambda x: x["total_points"]) if starters else None
+    return xi
+
+
+def _solve_squad(costs, points, positions, clubs, budget: int, max_per_club: int):
+    """Exact squad optimizer.
+
+    Returns:
+        Indices of the chosen 15 players, or None if no legal squad fits the budget.
+    """
+    quotas = [SQUAD_COMPOSITION[POSITION_NAMES[t]] for t in sorted(POSITION_NAMES)]
+    candidates = _prune_dominated(costs, points, positions, clubs, max_per_club)
+
+    # table[gk, def, mid, fwd, spend] = best points so far
+    table = np.full([q + 1 for q in quotas] + [budget + 1], _NEG, dtype=np.int32)
+    table[0, 0, 0, 0, 0] = 0
+    steps = []
+    for club in np.unique(clubs[candidates]).tolist():
+        members = candidates[clubs[candidates] == club]
+        options = _club_options(members, costs, points, positions, quotas, max_per_club)
+        updated = table.copy()
+        choice = np.zeros(table.shape, dtype=np.int16)
+        for k, (offset, cost, pts, _) in enumerate(options):
+            if cost > budget:
+                continue
+            source = table[tuple(slice(0, q + 1 - o) for q, o in zip(quotas, offset)) + (slice(0, budget + 1 - cost),)]
+            target_index = tuple(slice(o, None) for o in offset) + (slice(cost, None),)
+            target = updated[target_index]
+            candidate = source + pts
+            improved = candidate > target
+            np.copyto(target, candidate, where=improved)
+            np.copyto(choice[target_index], k + 1, where=improved)
+        steps.append((options, choice))
+        table = updated
+
+    full = table[tuple(quotas)]
+    spend = int(np.argmax(full))
+    if full[spend] <= _NEG // 2:
+        return None
+
+    # Walk the clubs backwards to recover each club's picks
+    chosen = []
+    state = list(quotas) + [spend]
+    for options, choice in reversed(steps):
+        k = int(choice[tuple(state)])
+        if k == 0:
+            continue
+        offset, cost, _, picked = options[k - 1]
+        chosen.extend(picked)
+        state = [s - o for s, o in zip(state, list(offset) + [cost])]
+    return chosen
+
+
+def _club_options(members, costs, points, positions, quotas, max_per_club) -> list:
+    """Non-empty picks of up to ``max_per_club`` players from one club.
+
+    Only picks that are not beaten by a cheaper, higher-scoring pick with the
+    same positional make-up are kept.
+
+    Returns:
+        List of (position counts, cost, points, player indices) tuples.
+    """
+    by_shape = {}
+    for size in range(1, max_per_club + 1):
+        for picked in combinations(members.tolist(), size):
+            offset = [0] * len(quotas)
+            for i in picked:
+                offset[positions[i] - 1] += 1
+            if any(o > q for o, q in zip(offset, quotas)):
+                continue
+            by_shape.setdefault(tuple(offset), []).append(
+                (int(costs[list(picked)].sum()), int(points[list(picked)].sum()), picked)
+            )
+
+    options = []
+    for offset, picks in by_shape.items():
+        picks.sort(key=lambda x: (x[0], -x[1]))
+        best_pts = None
+        for cost, pts, picked in picks:
+            if best_pts is None or pts > best_pts:
+                options.append((offset, cost, pts, picked))
+                best_pts = pts
+    return options
+
+
+def _prune_dominated(costs, points, positions, clubs, max_per_club) -> np.ndarray:
+    """Drop players that can always be swapped for a cheaper, better one.
+
+    A player is dropped when, after discounting the same-position players that
+    could already be in the squad and the other clubs that could already be
+    full, at least one same-position player that costs no more and scores no
+    less is still free to take their place.
+
+    Returns:
+        Sorted indices of the remaining candidates.
+    """
+    keep = []
+    n_clubs = int(clubs.max()) + 1
+    full_clubs = (sum(SQUAD_COMPOSITION.values()) - 1) // max_per_club
+    for element_type, position in POSITION_NAMES.items():
+        idx = np.flatnonzero(positions == element_type)
+        if idx.size == 0:
+            continue
+        cost = costs[idx]
+        pts = points[idx]
+        order = np.arange(idx.size)
+        # dominated_by[i, j]: player j is at least as good a pick as player i
+        dominated_by = (
+            (cost[None, :] <= cost[:, None])
+            & (pts[None, :] >= pts[:, None])
+            & ((cost[None, :] < cost[:, None]) | (pts[None, :] > pts[:, None]) | (order[None, :] < order[:, None]))
+        )
+        club_onehot = np.zeros((idx.size, n_clubs), dtype=np.int64)
+        club_onehot[order, clubs[idx]] = 1
+        per_club = dominated_by.astype(np.int64) @ club_onehot
+        own_club = per_club[order, clubs[idx]].copy()
+        per_club[order, clubs[idx]] = 0
+        blocked = -np.sort(-per_club, axis=1)[:, :full_clubs].sum(axis=1)
+        free = own_club + per_club.sum(axis=1) - blocked - (SQUAD_COMPOSITION[position] - 1)
+        keep.append(idx[free <= 0])
+    return np.sort(np.concatenate(keep)) if keep else np.array([], dtype=np.int64)
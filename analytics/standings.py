@@ -0,0 +1,252 @@
+"""League standings table built column-wise from flattened league arrays."""
+
+import numpy as np
+import pandas as pd
+
+import fpl_api
+
+# All available chips in FPL (each can be used once per half-season)
+ALL_CHIPS = {"wildcard", "freehit", "bboost", "3xc"}
+FIRST_HALF_DEADLINE_GW = 19  # Chips must be used before GW20 for first half
+
+# Every column build_standings_table can produce, in display order
+ALL_COLUMNS = [
+    "Rank", "Change", "Team", "Manager", "GW Pts", "Total Pts",
+    "Behind", "High", "Low", "Chips", "Chips Left",
+    "TF Season", "TF GW", "Hits Season", "Hits GW",
+    "Captain", "Capt Pts"
+]
+
+# Text columns that can be sorted on in the paged view; numeric columns always can
+_SORTABLE_TEXT = ["Team", "Manager", "Captain"]
+
+_CHIP_ABBREV = {"wildcard": "WC", "freehit": "FH", "bboost": "BB", "3xc": "TC"}
+_CHIP_BITS = {name: 1 << i for i, name in enumerate(_CHIP_ABBREV)}
+
+
+def build_standings_table(
+    standings: list,
+    histories: dict,
+    transfers: dict,
+    picks: dict,
+    bootstrap_data: dict,
+    current_gw: int,
+    columns: list,
+    leader_total: int = None,
+) -> pd.DataFrame:
+    """Build the standings table column by column from flattened league arrays.
+
+    Manager histories, transfers and chips are each flattened once into
+    parallel arrays keyed by standings row, and every column is then a
+    single aggregation over those arrays.
+
+    Args:
+        standings: League standings rows to display, in order.
+        histories: Dictionary of manager histories keyed by entry ID.
+        transfers: Dictionary of manager transfers keyed by entry ID.
+        picks: Dictionary of manager picks for current GW keyed by entry ID.
+        bootstrap_data: Bootstrap data used for captain names and points.
+        current_gw: Current gameweek number.
+        columns: Column names to build, in display order.
+        leader_total: Total points the "Behind" column is measured from.
+            Defaults to the first standings row.
+
+    Returns:
+        DataFrame with the requested columns.
+    """
+    n = len(standings)
+    wanted = set(columns)
+    entries = [s["entry"] for s in standings]
+    rank = np.array([s["rank"] for s in standings], dtype=np.int64)
+    last_rank = np.array([s["last_rank"] for s in standings], dtype=np.int64)
+    total = np.array([s["total"] for s in standings], dtype=np.int64)
+
+    table = {
+        "Rank": rank,
+        "Change": _rank_change_labels(rank, last_rank),
+        "Team": [s["entry_name"] for s in standings],
+        "Manager": [s["player_name"] for s in standings],
+        "GW Pts": np.array([s["event_total"] for s in standings], dtype=np.int64),
+        "Total Pts": total,
+    }
+
+    if "Behind" in wanted:
+        if leader_total is None:
+            leader_total = int(total[0]) if n else 0
+        behind = leader_total - total
+        table["Behind"] = np.where(behind > 0, np.char.add("-", behind.astype(str)), "0")
+
+    histories = histories or {}
+    if wanted & {"High", "Low", "Hits Season", "Hits GW"}:
+        row, gws = _flatten(entries, lambda e: (histories.get(e) or {}).get("current", []))
+        event = _field(gws, "event")
+        points = _field(gws, "points")
+        cost = _field(gws, "event_transfers_cost")
+        played = np.bincount(row, minlength=n) > 0
+        high = np.full(n, np.iinfo(np.int64).min)
+        low = np.full(n, np.iinfo(np.int64).max)
+        np.maximum.at(high, row, points)
+        np.minimum.at(low, row, points)
+        this_gw = event == current_gw
+        table["High"] = np.where(played, high, 0)
+        table["Low"] = np.where(played, low, 0)
+        table["Hits Season"] = np.bincount(row, weights=cost, minlength=n).astype(np.int64)
+        table["Hits GW"] = np.bincount(row[this_gw], weights=cost[this_gw], minlength=n).astype(np.int64)
+
+    if wanted & {"Chip", "Chips", "Chips Left"}:
+        table.update(_chip_columns(entries, histories, current_gw))
+
+    if wanted & {"TF Season", "TF GW"}:
+        transfers = transfers or {}
+        row, transfer_list = _flatten(entries, lambda e: transfers.get(e) or [])
+        event = _field(transfer_list, "event")
+        table["TF Season"] = np.bincount(row, minlength=n)
+        table["TF GW"] = np.bincount(row[event == current_gw], minlength=n)
+
+    if wanted & {"Captain", "Capt Pts"}:
+        picks = picks or {}
+        captains = pd.Series([
+            next((p["element"] for p in (picks.get(entry_id) or {}).get("picks", []) if p.get("is_captain")), None)
+            for entry_id in entries
+        ], dtype="Int64")
+        names = fpl_api.get_player_names(bootstrap_data)
+        event_points = {el["id"]: el.get("event_points", 0) for el in bootstrap_data.get("elements", [])}
+        table["Captain"] = np.where(captains.isna(), "-", captains.map(names).fillna("Unknown"))
+        table["Capt Pts"] = captains.map(event_points).fillna(0).astype(np.int64).to_numpy()
+
+    return pd.DataFrame({col: table[col] for col in columns if col in table})
+
+
+def _rank_change_labels(rank: np.ndarray, last_rank: np.ndarray) -> np.ndarray:
+    """Label each rank change as "↑n", "↓n" or "-" (no change or no previous rank)."""
+    diff = last_rank - rank
+    return np.select(
+        [(last_rank != 0) & (diff > 0), (last_rank != 0) & (diff < 0)],
+        [np.char.add("↑", diff.astype(str)), np.char.add("↓", (-diff).astype(str))],
+        "-",
+    )
+
+
+def _flatten(entries: list, records) -> tuple:
+    """Concatenate each manager's records, returning (standings row per record, records)."""
+    per_entry = [records(entry_id) for entry_id in entries]
+    counts = np.fromiter(map(len, per_entry), dtype=np.int64, count=len(per_entry))
+    flat = [record for entry_records in per_entry for record in entry_records]
+    return np.repeat(np.arange(len(entries)), counts), flat
+
+
+def _field(records: list, name: str) -> np.ndarray:
+    """Extract one integer field from a list of record dicts as an array."""
+    return np.fromiter((r.get(name, 0) or 0 for r in records), dtype=np.int64, count=len(records))
+
+
+def _chip_columns(entries: list, histories: dict, current_gw: int) -> dict:
+    """Build the Chip, Chips and Chips Left columns from a compact chips table."""
+    n = len(entries)
+    row, chips = _flatten(entries, lambda e: (histories.get(e) or {}).get("chips", []))
+    names = [chip.get("name", "").lower() for chip in chips]
+    event = _field(chips, "event")
+    label = np.array([_CHIP_ABBREV.get(name, name.upper()) for name in names], dtype=object)
+    bit = np.fromiter((_CHIP_BITS.get(name, 0) for name in names), dtype=np.int64, count=len(names))
+
+    # Chip played this GW: the first listed for each manager
+    current = np.flatnonzero(event == current_gw)
+    current_rows, first = np.unique(row[current], return_index=True)
+    chip_now = np.full(n, "-", dtype=object)
+    chip_now[current_rows] = label[current[first]]
+
+    # Records are grouped by row, so each manager's chips are one contiguous run
+    listed = np.char.add(np.char.add(label.astype(str), "("), np.char.add(event.astype(str), ")")).tolist()
+    bounds = np.concatenate([[0], np.cumsum(np.bincount(row, minlength=n))])
+    season = np.array(
+        [", ".join(listed[bounds[i]:bounds[i + 1]]) or "-" for i in range(n)], dtype=object
+    )
+
+    # Chips used per half as 4-bit masks, then one label per mask pair
+    first_half = event <= FIRST_HALF_DEADLINE_GW
+    used_first = np.zeros(n, dtype=np.int64)
+    used_second = np.zeros(n, dtype=np.int64)
+    np.bitwise_or.at(used_first, row[first_half], bit[first_half])
+    np.bitwise_or.at(used_second, row[~first_half], bit[~first_half])
+    remaining = _CHIPS_LEFT_LABELS[used_first * 16 + used_second]
+
+    return {"Chip": chip_now, "Chips": season, "Chips Left": remaining}
+
+
+def _get_chips_remaining(used_chips: list) -> str:
+    """Get remaining chips by half (all chips can be used once per half)."""
+    chip_abbrev = {
+        "wildcard": "WC",
+        "freehit": "FH",
+        "bboost": "BB",
+        "3xc": "TC",
+    }
+    all_chip_names = ["wildcard", "freehit", "bboost", "3xc"]
+
+    # Track chips used in each half
+    first_half_used = set()
+    second_half_used = set()
+
+    for chip in used_chips:
+        name = chip.get("name", "").lower()
+        gw = chip.get("event", 0)
+        if gw <= FIRST_HALF_DEADLINE_GW:
+            first_half_used.add(name)
+        else:
+            second_half_used.add(name)
+
+    # Get remaining chips for each half
+    first_half_remaining = [chip_abbrev[c] for c in all_chip_names if c not in first_half_used]
+    second_half_remaining = [chip_abbrev[c] for c in all_chip_names if c not in second_half_used]
+
+    # Format output
+    first_str = ", ".join(first_half_remaining) if first_half_remaining else "-"
+    second_str = ", ".join(second_half_remaining) if second_half_remaining else "-"
+
+    if first_half_remaining == list(chip_abbrev.values()):
+        first_str = "All"
+    if second_half_remaining == list(chip_abbrev.values()):
+        second_str = "All"
+
+    return f"1st: {first_str} · 2nd: {second_str}"
+
+
+# "Chips Left" label for every (first-half mask * 16 + second-half mask)
+_CHIPS_LEFT_LABELS = np.array([
+    _get_chips_remaining([
+        {"name": name, "event": gw}
+        for mask, gw in ((first, 1), (second, FIRST_HALF_DEADLINE_GW + 1))
+        for name, bit in _CHIP_BITS.items() if mask & bit
+    ])
+    for first in range(16)
+    for second in range(16)
+], dtype=object)
+
+
+def build_sort_orders(table: pd.DataFrame) -> dict:
+    """Precompute the row order for every sortable column and direction.
+
+    Args:
+        table: Output of build_standings_table.
+
+    Returns:
+        Dict mapping (column, descending) to an array of row positions, plus
+        "search": lowercased "team manager" strings for filtering.
+    """
+    orders = {}
+    for col in table.columns:
+        values = table[col]
+        if pd.api.types.is_numeric_dtype(values):
+            key = values.to_numpy()
+            orders[(col, False)] = np.argsort(key, kind="stable")
+            orders[(col, True)] = np.argsort(-key, kind="stable")
+        elif col in _SORTABLE_TEXT:
+            ascending = np.argsort(values.astype(str).str.lower().to_numpy(), kind="stable")
+            orders[(col, False)] = ascending
+            orders[(col, True)] = ascending[::-1]
+    blank = [""] * len(table)
+    orders["search"] = np.array(
+        [f"{team} {manager}".lower() for team, manager in zip(table.get("Team", blank), table.get("Manager", blank))],
+        dtype=str,
+    )
+    return orders
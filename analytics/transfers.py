@@ -0,0 +1,283 @@
+"""Transfer returns — points gained or lost by each transfer over the following gameweeks."""
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_HORIZON = 3
+TRANSFER_COLUMNS = ["entry", "event", "element_in", "element_out", "element_in_cost", "element_out_cost", "time"]
+
+
+def build_transfers_table(transfers: dict) -> pd.DataFrame:
+    """Flatten every manager's transfer list into one columnar table.
+
+    Args:
+        transfers: Dictionary of manager transfers keyed by entry ID.
+
+    Returns:
+        DataFrame with one row per transfer: entry, event, element_in,
+        element_out, element_in_cost and element_out_cost (in tenths of a
+        million) and time (UTC timestamp).
+    """
+    rows = [
+        (
+            entry_id, t.get("event", 0), t.get("element_in", 0), t.get("element_out", 0),
+            t.get("element_in_cost", 0), t.get("element_out_cost", 0), t.get("time"),
+        )
+        for entry_id, transfer_list in transfers.items()
+        for t in (transfer_list or [])
+    ]
+    df = pd.DataFrame(rows, columns=TRANSFER_COLUMNS)
+    df[TRANSFER_COLUMNS[:-1]] = df[TRANSFER_COLUMNS[:-1]].astype(np.int64)
+    df["time"] = pd.to_datetime(df["time"], utc=True, errors="coerce")
+    return df
+
+
+def build_gameweek_costs(histories: dict) -> pd.DataFrame:
+    """Tabulate each manager's hit cost and Free Hit use per gameweek.
+
+    Args:
+        histories: Dictionary of manager histories keyed by entry ID.
+
+    Returns:
+        DataFrame with one row per manager and played gameweek: entry,
+        event, hit (points paid for extra transfers) and free_hit.
+    """
+    free_hits = {
+        (entry_id, chip.get("event"))
+        for entry_id, history in histories.items() if history
+        for chip in history.get("chips", [])
+        if chip.get("name") == "freehit"
+    }
+    rows = [
+        (entry_id, gw["event"], gw.get("event_transfers_cost", 0), (entry_id, gw["event"]) in free_hits)
+        for entry_id, history in histories.items() if history
+        for gw in history.get("current", [])
+    ]
+    df = pd.DataFrame(rows, columns=["entry", "event", "hit", "free_hit"])
+    return df.astype({"entry": np.int64, "event": np.int64, "hit": np.int64, "free_hit": bool})
+
+
+def compute_transfer_roi(
+    table: pd.DataFrame,
+    costs: pd.DataFrame,
+    points_matrix: pd.DataFrame,
+    horizon: int = DEFAULT_HORIZON,
+) -> pd.DataFrame:
+    """Score every transfer by the points the player in outscored the player out.
+
+    Window sums come from a cumulative-sum copy of the points matrix, so all
+    managers' transfers are scored in one gather. Hit costs are split evenly
+    across the transfers made that gameweek, and Free Hit transfers are only
+    scored for the gameweek they were made in.
+
+    Args:
+        table: Output of build_transfers_table.
+        costs: Output of build_gameweek_costs.
+        points_matrix: Players × GW points matrix with consecutive gameweek columns.
+        horizon: Number of gameweeks, starting with the transfer's, to compare.
+
+    Returns:
+        DataFrame with one row per scored transfer: entry, event, element_in,
+        element_out, gameweeks, in_points, out_points, hit and gain.
+    """
+    columns = ["entry", "event", "element_in", "element_out", "gameweeks", "in_points", "out_points", "hit", "gain"]
+    if table.empty or points_matrix.empty:
+        return pd.DataFrame(columns=columns)
+
+    df = table[["entry", "event", "element_in", "element_out"]]
+    start = points_matrix.columns.get_indexer(df["event"])
+    df = df[start >= 0].reset_index(drop=True)
+    start = start[start >= 0]
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+
+    by_gameweek = costs.set_index(["entry", "event"])
+    keys = pd.MultiIndex.from_frame(df[["entry", "event"]])
+    is_free_hit = by_gameweek["free_hit"].reindex(keys, fill_value=False).to_numpy(dtype=bool)
+    window = np.where(is_free_hit, 1, max(int(horizon), 1))
+    end = np.minimum(start + window, points_matrix.shape[1])
+
+    # cumulative[:, k] = points over the first k gameweek columns
+    values = points_matrix.to_numpy()
+    cumulative = np.zeros((values.shape[0], values.shape[1] + 1), dtype=np.int64)
+    np.cumsum(values, axis=1, out=cumulative[:, 1:])
+
+    element_ids = points_matrix.index.to_numpy()
+
+    def window_points(elements: np.ndarray) -> np.ndarray:
+        rows = np.searchsorted(element_ids, elements).clip(0, len(element_ids) - 1)
+        known = element_ids[rows] == elements
+        return np.where(known, cumulative[rows, end] - cumulative[rows, start], 0)
+
+    hit_cost = by_gameweek["hit"].reindex(keys, fill_value=0).to_numpy(dtype=float)
+    transfers_made = df.groupby(["entry", "event"])["event"].transform("size").to_numpy()
+
+    df["gameweeks"] = end - start
+    df["in_points"] = window_points(df["element_in"].to_numpy(dtype=np.int64))
+    df["out_points"] = window_points(df["element_out"].to_numpy(dtype=np.int64))
+    df["hit"] = hit_cost / transfers_made
+    df["gain"] = df["in_points"] - df["out_points"] - df["hit"]
+    return df[columns]
+
+
+def count_hit_costs(costs: pd.DataFrame) -> pd.Series:
+    """Total the points each manager has paid for extra transfers.
+
+    Args:
+        costs: Output of build_gameweek_costs.
+
+    Returns:
+        Series of hit points indexed by entry ID.
+    """
+    return costs.groupby("entry")["hit"].sum()
+
+
+def build_transfer_analysis(
+    standings: list,
+    histories: dict,
+    transfers: dict,
+    names: dict,
+    current_gw: int,
+) -> dict:
+    """Derive every Transfer Analysis view from one columnar transfers table.
+
+    The transfer lists are flattened once by build_transfers_table; each
+    view is then a group-by over that table. The table and the gameweek
+    costs are returned too, so transfer returns can be scored for any
+    horizon without refetching.
+
+    Args:
+        standings: League standings rows of the managers shown.
+        histories: Dictionary of manager histories keyed by entry ID.
+        transfers: Dictionary of manager transfers keyed by entry ID.
+        names: Element ID → player name.
+        current_gw: Current gameweek number.
+
+    Returns:
+        Dict with ``summary`` (summarize_league_transfers), ``by_gw``
+        (count_transfers_by_gameweek), ``by_manager``
+        (build_manager_transfer_table), ``players``
+        (count_transferred_players), ``transfers`` (build_transfers_table)
+        and ``costs`` (build_gameweek_costs).
+    """
+    table = build_transfers_table({s["entry"]: transfers.get(s["entry"]) for s in standings})
+    costs = build_gameweek_costs({s["entry"]: histories.get(s["entry"]) for s in standings})
+    by_gw = count_transfers_by_gameweek(table)
+    by_manager = build_manager_transfer_table(standings, table, count_hit_costs(costs), current_gw)
+    return {
+        "summary": summarize_league_transfers(by_gw, by_manager),
+        "by_gw": by_gw,
+        "by_manager": by_manager,
+        "players": count_transferred_players(table, names),
+        "transfers": table,
+        "costs": costs,
+    }
+
+
+def summarize_league_transfers(by_gw: pd.DataFrame, by_manager: pd.DataFrame) -> dict:
+    """Total the league's transfers and hits and find the busiest gameweek and manager.
+
+    Args:
+        by_gw: Output of count_transfers_by_gameweek.
+        by_manager: Output of build_manager_transfer_table.
+
+    Returns:
+        Dict with total, busiest_gw, busiest_gw_count, most_active (team
+        name, "—" when nobody is shown), most_active_count and hit_cost.
+    """
+    busiest = by_gw.loc[by_gw["Transfers"].idxmax()] if not by_gw.empty else None
+    most_active = by_manager.iloc[0] if not by_manager.empty else None
+    return {
+        "total": int(by_gw["Transfers"].sum()),
+        "busiest_gw": int(busiest["GW_num"]) if busiest is not None else 0,
+        "busiest_gw_count": int(busiest["Transfers"]) if busiest is not None else 0,
+        "most_active": most_active["Team"] if most_active is not None else "—",
+        "most_active_count": int(most_active["Total Transfers"]) if most_active is not None else 0,
+        "hit_cost": int(by_manager["Total Hits (pts)"].sum()),
+    }
+
+
+def count_transfers_by_gameweek(table: pd.DataFrame) -> pd.DataFrame:
+    """Count the league's transfers in each gameweek.
+
+    Args:
+        table: Output of build_transfers_table.
+
+    Returns:
+        DataFrame in gameweek order with Gameweek ("GW5"), GW_num and Transfers.
+    """
+    counts = table.groupby("event").size()
+    return pd.DataFrame({
+        "Gameweek": [f"GW{gw}" for gw in counts.index],
+        "GW_num": counts.index.to_numpy(dtype=np.int64),
+        "Transfers": counts.to_numpy(dtype=np.int64),
+    })
+
+
+def build_manager_transfer_table(
+    standings: list,
+    table: pd.DataFrame,
+    hit_costs: pd.Series,
+    current_gw: int,
+) -> pd.DataFrame:
+    """Tabulate each manager's transfers and hits.
+
+    Args:
+        standings: League standings rows of the managers shown.
+        table: Output of build_transfers_table.
+        hit_costs: Output of count_hit_costs.
+        current_gw: Current gameweek number.
+
+    Returns:
+        DataFrame with Team, Total Transfers, Total Hits (pts) and This GW
+        Transfers, most transfers first (ties keep standings order).
+    """
+    entries = pd.Index([s["entry"] for s in standings])
+    df = pd.DataFrame({
+        "Team": [s["entry_name"] for s in standings],
+        "Total Transfers": table.groupby("entry").size().reindex(entries, fill_value=0).to_numpy(),
+        "Total Hits (pts)": hit_costs.reindex(entries, fill_value=0).to_numpy(),
+        "This GW Transfers": (
+            table[table["event"] == current_gw].groupby("entry").size().reindex(entries, fill_value=0).to_numpy()
+        ),
+    })
+    return df.astype({c: np.int64 for c in df.columns[1:]}).sort_values(
+        "Total Transfers", ascending=False, kind="stable"
+    )
+
+
+def count_transferred_players(table: pd.DataFrame, names: dict) -> pd.DataFrame:
+    """Count how often each player was transferred in and out, per gameweek.
+
+    Args:
+        table: Output of build_transfers_table.
+        names: Element ID → player name.
+
+    Returns:
+        DataFrame with event, element, Player, In and Out, one row per
+        player moved in each gameweek.
+    """
+    moves = pd.concat([
+        pd.DataFrame({"event": table["event"], "element": table["element_in"], "direction": "In"}),
+        pd.DataFrame({"event": table["event"], "element": table["element_out"], "direction": "Out"}),
+    ])
+    moves = moves[moves["element"] > 0]
+    counts = (
+        moves.groupby(["event", "element", "direction"]).size()
+        .unstack(fill_value=0)
+        .reindex(columns=["In", "Out"], fill_value=0)
+        .reset_index()
+    )
+    counts.columns.name = None
+    counts.insert(2, "Player", counts["element"].map(names).fillna("Unknown"))
+    return counts[["event", "element", "Player", "In", "Out"]]
+
+
+def top_transferred(players: pd.DataFrame, gameweek: int, column: str, n: int = 10) -> pd.DataFrame:
+    """Pick the players most transferred in (``column="In"``) or out in a gameweek.
+
+    Returns:
+        DataFrame with Player and Count, most moved first.
+    """
+    moved = players[(players["event"] == gameweek) & (players[column] > 0)]
+    return moved.nlargest(n, column, keep="first")[["Player", column]].rename(columns={column: "Count"})
@@ -0,0 +1,94 @@
+"""Per-gameweek league trends — points and rank matrices and percentile bands."""
+
+import numpy as np
+import pandas as pd
+
+BAND_PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def build_gameweek_matrix(standings: list, histories: dict, field: str = "points") -> pd.DataFrame:
+    """Collect one history field into a managers × gameweeks matrix.
+
+    Args:
+        standings: League standings rows, in league order.
+        histories: Dictionary of manager histories keyed by entry ID.
+        field: History field to collect, e.g. "points" or "total_points".
+
+    Returns:
+        DataFrame indexed by entry ID (in standings order) with one float
+        column per gameweek; NaN where a manager has no entry for that GW.
+    """
+    entries, gws, values = [], [], []
+    for s in standings:
+        history = histories.get(s["entry"])
+        if not history or "current" not in history:
+            continue
+        for row in history["current"]:
+            entries.append(s["entry"])
+            gws.append(row["event"])
+            values.append(row[field])
+
+    if not entries:
+        return pd.DataFrame()
+    order = list(dict.fromkeys(entries))
+    matrix = pd.DataFrame({"entry": entries, "gw": gws, "value": values}).pivot_table(
+        index="entry", columns="gw", values="value", aggfunc="last"
+    )
+    return matrix.reindex(order).astype(float)
+
+
+def league_rank_matrix(totals: pd.DataFrame) -> pd.DataFrame:
+    """Rank managers within the league at each gameweek by cumulative points.
+
+    Ties keep league order, and managers without a total for a gameweek are
+    left unranked (NaN) there.
+
+    Args:
+        totals: Output of build_gameweek_matrix with field="total_points".
+
+    Returns:
+        DataFrame of the same shape holding league positions (1 = top).
+    """
+    return totals.rank(axis=0, ascending=False, method="first")
+
+
+def percentile_bands(matrix: pd.DataFrame, percentiles: tuple = BAND_PERCENTILES) -> pd.DataFrame:
+    """Summarize a managers × gameweeks matrix as percentiles per gameweek.
+
+    Args:
+        matrix: Output of build_gameweek_matrix.
+        percentiles: Percentiles to compute, 0–100.
+
+    Returns:
+        DataFrame indexed by gameweek with one column per percentile
+        (named "p10", "p50", …) plus "mean".
+    """
+    values = matrix.to_numpy(dtype=float)
+    present = ~np.isnan(values).all(axis=0)
+    bands = np.full((len(percentiles), values.shape[1]), np.nan)
+    bands[:, present] = np.nanpercentile(values[:, present], percentiles, axis=0)
+
+    out = pd.DataFrame(bands.T, index=matrix.columns, columns=[f"p{p}" for p in percentiles])
+    out["mean"] = matrix.mean(axis=0).to_numpy()
+    out.index.name = "gw"
+    return out
+
+
+def sample_rows(matrix: pd.DataFrame, max_cells: int, keep: list = ()) -> pd.DataFrame:
+    """Thin a matrix to at most ``max_cells`` cells by keeping evenly spaced rows.
+
+    Args:
+        matrix: Any DataFrame, e.g. a rank matrix in league order.
+        max_cells: Upper bound on rows × columns in the result.
+        keep: Index labels that are always kept.
+
+    Returns:
+        The matrix itself when it fits, otherwise an evenly spaced subset of
+        rows (plus ``keep``) in the original order.
+    """
+    max_rows = max(max_cells // max(matrix.shape[1], 1), 1)
+    if len(matrix) <= max_rows:
+        return matrix
+    positions = set(np.linspace(0, len(matrix) - 1, max_rows).round().astype(int))
+    positions.update(matrix.index.get_indexer([k for k in keep if k in matrix.index]))
+    return matrix.iloc[sorted(positions)]
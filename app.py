@@ -58,9 +58,12 @@ standings_page = st.Page("pages/standings.py", title="Standings", icon=":materia
 league_insights_page = st.Page("pages/league_insights.py", title="League Insights", icon=":material/insights:")
 head_to_head_page = st.Page("pages/head_to_head.py", title="Head-to-Head", icon=":material/compare:")
 point_sources_page = st.Page("pages/point_sources.py", title="Point Sources", icon=":material/pie_chart:")
+lineup_efficiency_page = st.Page("pages/lineup_efficiency.py", title="Lineup Efficiency", icon=":material/event_seat:")
 transfer_analysis_page = st.Page("pages/transfer_analysis.py", title="Transfer Analysis", icon=":material/swap_horiz:")
 captain_picks_page = st.Page("pages/captain_picks.py", title="Captain Picks", icon=":material/star:")
 player_ownership_page = st.Page("pages/player_ownership.py", title="Player Ownership", icon=":material/group:")
+multi_league_page = st.Page("pages/multi_league.py", title="Multi-League", icon=":material/hub:")
+projections_page = st.Page("pages/projections.py", title="Projections", icon=":material/casino:")
 
 # Define pages — Global
 season_stats_page = st.Page("pages/season_stats.py", title="Season Stats", icon=":material/bar_chart:")
@@ -80,9 +83,12 @@ pg = st.navigation({
         league_insights_page,
         head_to_head_page,
         point_sources_page,
+        lineup_efficiency_page,
         transfer_analysis_page,
         captain_picks_page,
         player_ownership_page,
+        multi_league_page,
+        projections_page,
     ],
     "Global": [
         season_stats_page,
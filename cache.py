@@ -0,0 +1,447 @@
+"""Process-shared cache for FPL API responses and derived data.
+
+``st.cache_data`` lives in one server process, so every worker behind a load
+balancer starts cold. ``cached`` is a drop-in decorator with the same
+``ttl``/``max_entries`` arguments whose entries live in a backend that all
+processes on a host (SQLite) or in a deployment (Redis) share.
+
+Values are pickled and zlib-compressed; each entry records its expiry time
+and stored size. Backends keep an entry for ``FPL_CACHE_STALE_GRACE``
+seconds past its TTL, so when a value cannot be recomputed (the app is
+reading from the sync daemon's store only, see scripts/sync_daemon.py) the
+last stored copy is served instead. The backend is picked with
+``FPL_CACHE_BACKEND``:
+
+- ``sqlite`` (default): a WAL-mode database at ``FPL_CACHE_PATH``.
+- ``redis``: any server speaking the Redis protocol at ``FPL_CACHE_REDIS_URL``.
+- ``memory``: a per-process dict, as before.
+"""
+
+import functools
+import hashlib
+import inspect
+import pickle
+import socket
+import sqlite3
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from urllib.parse import urlparse
+
+from config import CACHE_BACKEND, CACHE_MAX_BYTES, CACHE_PATH, CACHE_REDIS_URL, CACHE_STALE_GRACE
+
+_COMPRESS_LEVEL = 3
+
+# Logical expiry (Unix time, 0 for none) stored ahead of each cached value
+_EXPIRY = struct.Struct("<d")
+
+
+class Unavailable(Exception):
+    """Raised when a value cannot be recomputed right now.
+
+    A cached function that raises this (directly or from a cached call it
+    makes) gets its expired entry served instead, if one is still stored.
+    """
+
+
+def serialize(value) -> bytes:
+    """Pickle and compress a value for storage."""
+    return zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), _COMPRESS_LEVEL)
+
+
+def deserialize(data: bytes):
+    """Inverse of serialize."""
+    return pickle.loads(zlib.decompress(data))
+
+
+class MemoryBackend:
+    """Per-process store; the fallback when no shared backend is wanted."""
+
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES):
+        self._entries = {}  # key -> (namespace, expires_at, data)
+        self._lock = threading.Lock()
+        self._max_bytes = max_bytes
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] is not None and entry[1] <= time.time():
+                del self._entries[key]
+                return None
+            # Re-insert so iteration order doubles as least-recently-used order
+            self._entries[key] = self._entries.pop(key)
+            return entry[2]
+
+    def set(self, key: str, namespace: str, data: bytes, ttl: float | None, max_entries: int | None) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (namespace, time.time() + ttl if ttl else None, data)
+            if max_entries:
+                same = [k for k, e in self._entries.items() if e[0] == namespace]
+                for k in same[:-max_entries]:
+                    del self._entries[k]
+            total = sum(len(e[2]) for e in self._entries.values())
+            for k in list(self._entries):
+                if total <= self._max_bytes:
+                    break
+                total -= len(self._entries.pop(k)[2])
+
+    def clear(self, namespace: str) -> None:
+        with self._lock:
+            for k in [k for k, e in self._entries.items() if e[0] == namespace]:
+                del self._entries[k]
+
+    def keys(self, namespace: str) -> list:
+        now = time.time()
+        with self._lock:
+            return [k for k, e in self._entries.items() if e[0] == namespace and (e[1] is None or e[1] > now)]
+
+    def stats(self) -> dict:
+        with self._lock:
+            out = {}
+            for namespace, _, data in self._entries.values():
+                entries, size = out.get(namespace, (0, 0))
+                out[namespace] = (entries + 1, size + len(data))
+            return {ns: {"entries": n, "bytes": b} for ns, (n, b) in out.items()}
+
+
+class SQLiteBackend:
+    """Store shared by every process on the host, in a WAL-mode SQLite file.
+
+    Triggers keep the stored byte total in the ``meta`` table, so a write
+    only reads one row to check the size budget. Expired entries are swept
+    at most every ``_SWEEP_INTERVAL`` seconds, and an over-budget store is
+    trimmed to ``_EVICT_TO`` of the budget in one go rather than an entry
+    per write. Reads record access times at most every ``_TOUCH_INTERVAL``
+    seconds, so cache hits rarely need the write lock.
+    """
+
+    _SWEEP_INTERVAL = 60
+    _TOUCH_INTERVAL = 60
+    _EVICT_TO = 0.9
+
+    def __init__(self, path: str | Path = CACHE_PATH, max_bytes: int = CACHE_MAX_BYTES):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._local = threading.local()
+        self._next_sweep = 0.0
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY, namespace TEXT NOT NULL, value BLOB NOT NULL,"
+                " size INTEGER NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_namespace ON entries (namespace, accessed_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires_at)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            # Caches created before the running total count their rows once here
+            conn.execute(
+                "INSERT OR IGNORE INTO meta SELECT 'bytes', COALESCE(SUM(size), 0) FROM entries"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN"
+                " UPDATE meta SET value = value + new.size WHERE name = 'bytes'; END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN"
+                " UPDATE meta SET value = value - old.size WHERE name = 'bytes'; END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_resize AFTER UPDATE OF size ON entries BEGIN"
+                " UPDATE meta SET value = value - old.size + new.size WHERE name = 'bytes'; END"
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str):
+        conn = self._connect()
+        now = time.time()
+        row = conn.execute("SELECT value, expires_at, accessed_at FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        if row[1] is not None and row[1] <= now:
+            conn.execute("DELETE FROM entries WHERE key = ? AND expires_at <= ?", (key, now))
+            return None
+        if now - row[2] > self._TOUCH_INTERVAL:
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        return row[0]
+
+    def set(self, key: str, namespace: str, data: bytes, ttl: float | None, max_entries: int | None) -> None:
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # An upsert, unlike INSERT OR REPLACE, fires the update trigger for replaced rows
+            conn.execute(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET"
+                " namespace = excluded.namespace, value = excluded.value, size = excluded.size,"
+                " expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+                (key, namespace, data, len(data), now + ttl if ttl else None, now),
+            )
+            if max_entries:
+                conn.execute(
+                    "DELETE FROM entries WHERE key IN (SELECT key FROM entries WHERE namespace = ?"
+                    " ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (namespace, max_entries),
+                )
+            total = self._total(conn)
+            if now >= self._next_sweep or total > self._max_bytes:
+                self._next_sweep = now + self._SWEEP_INTERVAL
+                conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+                total = self._total(conn)
+            if total > self._max_bytes:
+                self._evict(conn, total - int(self._max_bytes * self._EVICT_TO))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _total(conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()[0]
+
+    @staticmethod
+    def _evict(conn: sqlite3.Connection, excess: int) -> None:
+        """Delete least recently used entries until ``excess`` bytes are freed."""
+        evict, freed = [], 0
+        for old_key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            if freed >= excess:
+                break
+            evict.append((old_key,))
+            freed += size
+        conn.executemany("DELETE FROM entries WHERE key = ?", evict)
+
+    def clear(self, namespace: str) -> None:
+        self._connect().execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+
+    def keys(self, namespace: str) -> list:
+        rows = self._connect().execute(
+            "SELECT key FROM entries WHERE namespace = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (namespace, time.time()),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def stats(self) -> dict:
+        rows = self._connect().execute(
+            "SELECT namespace, COUNT(*), SUM(size) FROM entries GROUP BY namespace"
+        ).fetchall()
+        return {ns: {"entries": n, "bytes": b} for ns, n, b in rows}
+
+
+class RedisBackend:
+    """Store on a Redis-protocol server, spoken over a raw RESP socket.
+
+    Only GET, SET, DEL, SCAN, STRLEN, ZADD, ZCARD, ZRANGE and ZREM are used,
+    so any compatible server (or a small local stand-in) will do. Expiry is
+    left to the server; ``max_entries`` is tracked in a per-namespace sorted
+    set of last-write times.
+    """
+
+    def __init__(self, url: str = CACHE_REDIS_URL, prefix: str = "fpl-cache:"):
+        parsed = urlparse(url)
+        self._address = (parsed.hostname or "localhost", parsed.port or 6379)
+        self._db = int(parsed.path.lstrip("/") or 0)
+        self._password = parsed.password
+        self._prefix = prefix
+        self._local = threading.local()
+
+    def _command(self, *args):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            sock = socket.create_connection(self._address, timeout=5)
+            conn = (sock, sock.makefile("rb"))
+            self._local.conn = conn
+            if self._password:
+                self._command("AUTH", self._password)
+            if self._db:
+                self._command("SELECT", self._db)
+        sock, reader = conn
+        parts = [arg if isinstance(arg, bytes) else str(arg).encode() for arg in args]
+        payload = b"*%d\r\n" % len(parts) + b"".join(b"$%d\r\n%s\r\n" % (len(p), p) for p in parts)
+        try:
+            sock.sendall(payload)
+            return _read_reply(reader)
+        except OSError:
+            self._local.conn = None
+            raise
+
+    def get(self, key: str):
+        return self._command("GET", self._prefix + key)
+
+    def set(self, key: str, namespace: str, data: bytes, ttl: float | None, max_entries: int | None) -> None:
+        full_key = self._prefix + key
+        if ttl:
+            self._command("SET", full_key, data, "PX", int(ttl * 1000))
+        else:
+            self._command("SET", full_key, data)
+        if max_entries:
+            index = self._prefix + "index:" + namespace
+            self._command("ZADD", index, time.time(), full_key)
+            excess = int(self._command("ZCARD", index)) - max_entries
+            if excess > 0:
+                stale = self._command("ZRANGE", index, 0, excess - 1)
+                self._command("DEL", *stale)
+                self._command("ZREM", index, *stale)
+
+    def clear(self, namespace: str) -> None:
+        for key in self._scan(f"{self._prefix}{namespace}:*"):
+            self._command("DEL", key)
+        self._command("DEL", self._prefix + "index:" + namespace)
+
+    def keys(self, namespace: str) -> list:
+        return [key.decode()[len(self._prefix):] for key in self._scan(f"{self._prefix}{namespace}:*")]
+
+    def stats(self) -> dict:
+        out = {}
+        for key in self._scan(f"{self._prefix}*"):
+            name = key.decode()[len(self._prefix):]
+            if name.startswith("index:"):
+                continue
+            namespace = name.rsplit(":", 1)[0]
+            entry = out.setdefault(namespace, {"entries": 0, "bytes": 0})
+            entry["entries"] += 1
+            entry["bytes"] += int(self._command("STRLEN", key))
+        return out
+
+    def _scan(self, pattern: str):
+        cursor = b"0"
+        while True:
+            cursor, keys = self._command("SCAN", cursor, "MATCH", pattern, "COUNT", 500)
+            yield from keys
+            if cursor == b"0":
+                return
+
+
+def _read_reply(reader):
+    """Parse one RESP reply."""
+    line = reader.readline()
+    if not line:
+        raise ConnectionError("Cache server closed the connection")
+    kind, rest = line[:1], line[1:-2]
+    if kind == b"+":
+        return rest
+    if kind == b"-":
+        raise RuntimeError(rest.decode())
+    if kind == b":":
+        return int(rest)
+    if kind == b"$":
+        length = int(rest)
+        if length < 0:
+            return None
+        data = reader.read(length + 2)
+        return data[:-2]
+    if kind == b"*":
+        length = int(rest)
+        return None if length < 0 else [_read_reply(reader) for _ in range(length)]
+    raise RuntimeError(f"Unexpected cache server reply: {line!r}")
+
+
+_BACKENDS = {"memory": MemoryBackend, "sqlite": SQLiteBackend, "redis": RedisBackend}
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """Return the process-wide cache backend, creating it on first use."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _BACKENDS[CACHE_BACKEND]()
+    return _backend
+
+
+def set_backend(backend) -> None:
+    """Replace the process-wide cache backend."""
+    global _backend
+    _backend = backend
+
+
+def cached(ttl: float | None = None, max_entries: int | None = None):
+    """Cache a function's return value in the shared backend.
+
+    Like st.cache_data, arguments whose names start with an underscore are
+    left out of the cache key, and callers always get a fresh copy of the
+    value. If the backend is unavailable the function is simply called; if
+    the function raises Unavailable, an expired entry is returned instead.
+
+    The wrapper gains ``clear()`` and ``refresh(*args, **kwargs)``, which
+    recomputes and stores the value even when the stored one is still valid.
+
+    Args:
+        ttl: Seconds an entry stays valid. None keeps it until evicted.
+        max_entries: Most entries kept for this function.
+    """
+    # Expired entries are kept a while longer as a fallback
+    retention = ttl + CACHE_STALE_GRACE if ttl else None
+
+    def decorator(func):
+        namespace = f"{func.__module__}.{func.__qualname__}"
+        signature = inspect.signature(func)
+        hashed = [name for name in signature.parameters if not name.startswith("_")]
+
+        def make_key(args, kwargs) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key_args = pickle.dumps([bound.arguments[name] for name in hashed], protocol=4)
+            # The personalisation string versions the entry format
+            digest = hashlib.blake2b(key_args, digest_size=16, person=b"fpl-cache-v2").hexdigest()
+            return f"{namespace}:{digest}"
+
+        def store(key: str, value) -> None:
+            data = _EXPIRY.pack(time.time() + ttl if ttl else 0) + serialize(value)
+            try:
+                get_backend().set(key, namespace, data, retention, max_entries)
+            except Exception:
+                pass
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            try:
+                data = get_backend().get(key)
+            except Exception:
+                data = None
+            if data is not None:
+                (expires_at,) = _EXPIRY.unpack_from(data)
+                if not expires_at or expires_at > time.time():
+                    return deserialize(data[_EXPIRY.size:])
+
+            try:
+                value = func(*args, **kwargs)
+            except Unavailable:
+                if data is None:
+                    raise
+                return deserialize(data[_EXPIRY.size:])
+            store(key, value)
+            return value
+
+        def refresh(*args, **kwargs):
+            value = func(*args, **kwargs)
+            store(make_key(args, kwargs), value)
+            return value
+
+        wrapper.clear = lambda: get_backend().clear(namespace)
+        wrapper.refresh = refresh
+        return wrapper
+
+    return decorator
@@ -1,9 +1,64 @@
 """Configuration constants for FPL League Analysis."""
 
+import os
+
 DEFAULT_LEAGUE_ID = 0
 APP_TITLE = "FPL League Analysis"
 APP_ICON = "⚽"
 
+# Maximum concurrent requests when fetching many FPL API resources at once
+MAX_FETCH_WORKERS = 8
+
+# Global ceiling on FPL API requests per second, shared by every thread
+API_RATE_LIMIT = 20
+
+# League standings pages (50 managers each) loaded per league
+MAX_STANDINGS_PAGES = 20
+
+# Leagues with more managers than this get a paged standings table
+STANDINGS_PAGE_THRESHOLD = 200
+
+# Trend charts switch to WebGL and percentile bands above this many managers
+LARGE_CHART_THRESHOLD = 30
+# Most managers that can be highlighted on a large-league chart
+MAX_HIGHLIGHTED_MANAGERS = 10
+# Upper bound on data points (or heatmap cells) sent per large-league chart
+CHART_MAX_POINTS = 4000
+
+# Byte budget, measured as JSON specs, for Plotly figures kept between reruns (see features/figure_cache.py)
+FIGURE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Processes used for Monte Carlo standings projections (see analytics/projections.py)
+SIMULATION_WORKERS = int(os.environ.get("FPL_SIMULATION_WORKERS", os.cpu_count() or 1))
+
+# Append-only file written by scripts/snapshot_bootstrap.py (see snapshot_store.py)
+SNAPSHOT_STORE_PATH = "data/bootstrap_snapshots.fplsnap"
+
+# Shared cache for API responses (see cache.py): "sqlite", "redis" or "memory"
+CACHE_BACKEND = os.environ.get("FPL_CACHE_BACKEND", "sqlite")
+CACHE_PATH = os.environ.get("FPL_CACHE_PATH", "data/cache.sqlite3")
+CACHE_REDIS_URL = os.environ.get("FPL_CACHE_REDIS_URL", "redis://localhost:6379/0")
+CACHE_MAX_BYTES = int(os.environ.get("FPL_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+# Seconds an expired entry is kept as a fallback for when it can't be refetched
+CACHE_STALE_GRACE = int(os.environ.get("FPL_CACHE_STALE_GRACE", 7 * 24 * 3600))
+
+# Background sync (scripts/sync_daemon.py). With FPL_STORE_ONLY=1 the app never
+# calls the FPL API itself and serves whatever the daemon last stored.
+STORE_ONLY = os.environ.get("FPL_STORE_ONLY", "").lower() in ("1", "true", "yes")
+SYNC_LEAGUES = [int(x) for x in os.environ.get("FPL_SYNC_LEAGUES", "").replace(",", " ").split()]
+# Leagues opened in the app are synced for this long after their last view
+SYNC_RECENT_LEAGUE_TTL = 3 * 24 * 3600
+# Seconds between sync passes while a gameweek is live, near a deadline, and otherwise
+SYNC_LIVE_INTERVAL = 120
+SYNC_DEADLINE_INTERVAL = 600
+SYNC_IDLE_INTERVAL = 3600
+
+# Read-only JSON API (scripts/api_server.py)
+API_HOST = os.environ.get("FPL_API_HOST", "127.0.0.1")
+API_PORT = int(os.environ.get("FPL_API_PORT", 8000))
+# Upper bound on the serialized responses the API keeps in memory
+API_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 # Formspree endpoint for feedback form (https://formspree.io)
 # Set via Streamlit secrets: add FORMSPREE_ENDPOINT to .streamlit/secrets.toml (local)
 # or the Streamlit Cloud secrets manager (deployed).
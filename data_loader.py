@@ -1,91 +1,394 @@
-"""Shared data loading utilities for FPL League Analysis."""
+"""Shared data loading utilities for FPL League Analysis.
 
-import streamlit as st
+Nothing here depends on Streamlit, so the same loaders serve the app,
+scripts and worker processes. The app's session-aware wrappers live in
+features/context.py.
+"""
+
+import numpy as np
+import pandas as pd
 
 import fpl_api
+from analytics.dashboard import compute_gw_highlights
+from analytics.differentials import compute_differentials, count_league_ownership
+from analytics.expected_points import build_expected_points_table
+from analytics.head_to_head import compute_head_to_head
+from analytics.lineups import position_points
+from analytics.players import build_player_table, summarize_season
+from analytics.projections import (
+    DEFAULT_SIMULATIONS,
+    build_projection_inputs,
+    remaining_gameweeks,
+    simulate_finishing_positions,
+)
+from analytics.similarity import build_similarity_report
+from analytics.transfers import build_transfer_analysis
+from analytics.trends import build_gameweek_matrix
+from cache import Unavailable, cached, get_backend
+from config import SYNC_RECENT_LEAGUE_TTL
+from snapshot_store import SnapshotStore
+
+_VIEWED_LEAGUES = "sync.viewed_leagues"
 
 
-@st.cache_data(ttl=300)
+@cached(ttl=300)
 def load_all_data(league_id: int):
     """Load all required data for a given league."""
-    standings = fpl_api.get_league_standings(league_id)
+    standings = fpl_api.get_full_league_standings(league_id)
     bootstrap = fpl_api.get_bootstrap_data()
     return standings, bootstrap
 
 
-@st.cache_data(ttl=300)
+@cached(ttl=300)
 def load_manager_entries(entry_ids: tuple):
     """Load entry info for all managers (includes free transfers)."""
-    entries = {}
-    for entry_id in entry_ids:
-        try:
-            entries[entry_id] = fpl_api.get_manager_entry(entry_id)
-        except Exception:
-            entries[entry_id] = None
-    return entries
+    return _fetch_each(fpl_api.get_manager_entry, entry_ids, None)
 
 
-@st.cache_data(ttl=300)
+@cached(ttl=300)
 def load_manager_histories(entry_ids: tuple):
     """Load history for all managers."""
-    histories = {}
-    for entry_id in entry_ids:
-        try:
-            histories[entry_id] = fpl_api.get_manager_history(entry_id)
-        except Exception:
-            histories[entry_id] = None
-    return histories
+    return _fetch_each(fpl_api.get_manager_history, entry_ids, None)
 
 
-@st.cache_data(ttl=300)
+@cached(ttl=300)
 def load_manager_transfers(entry_ids: tuple):
     """Load transfers for all managers."""
-    transfers = {}
-    for entry_id in entry_ids:
+    return _fetch_each(fpl_api.get_manager_transfers, entry_ids, [])
+
+
+def _fetch_each(fetch, entry_ids: tuple, default) -> dict:
+    """Fetch one payload per manager concurrently, using ``default`` for failures.
+
+    Unavailable (data not synced yet in store-only mode) is re-raised, so a
+    league with unsynced managers is never cached as if it were complete.
+    """
+    def fetch_one(entry_id: int):
         try:
-            transfers[entry_id] = fpl_api.get_manager_transfers(entry_id)
+            return fetch(entry_id)
+        except Unavailable:
+            raise
         except Exception:
-            transfers[entry_id] = []
-    return transfers
+            return default
 
+    return dict(zip(entry_ids, fpl_api.fetch_many(fetch_one, [(entry_id,) for entry_id in entry_ids])))
 
-@st.cache_data(ttl=300)
+
+@cached(ttl=300)
 def load_manager_picks(entry_ids: tuple, gameweek: int):
     """Load picks for all managers for a specific gameweek."""
-    picks = {}
-    for entry_id in entry_ids:
-        try:
-            picks[entry_id] = fpl_api.get_manager_picks(entry_id, gameweek)
-        except Exception:
-            picks[entry_id] = None
+    final = gameweek in final_gameweeks(fpl_api.get_bootstrap_data())
+    return {entry_id: _fetch_manager_picks(entry_id, gameweek, final) for entry_id in entry_ids}
+
+
+@cached(ttl=300)
+def load_head_to_head(entry_ids: tuple) -> dict:
+    """Load the pairwise head-to-head records of a set of managers.
+
+    Returns:
+        Output of analytics.head_to_head.compute_head_to_head.
+    """
+    histories = load_manager_histories(entry_ids)
+    points = build_gameweek_matrix([{"entry": e} for e in entry_ids], histories, "points")
+    return compute_head_to_head(points)
+
+
+@cached(ttl=3600, max_entries=100)
+def load_projections(league_id: int, gameweek: int, entry_ids: tuple, n_sims: int = DEFAULT_SIMULATIONS) -> dict:
+    """Simulate the rest of the season for a league's shown managers.
+
+    Results are cached per league and gameweek (and the managers shown).
+
+    Returns:
+        Dict with ``inputs`` (from build_projection_inputs), ``probabilities``
+        (managers × finishing positions) and ``remaining`` gameweeks.
+    """
+    standings, bootstrap = _shown_standings(league_id, entry_ids)
+    histories = load_manager_histories(entry_ids)
+    picks = load_manager_picks(entry_ids, gameweek)
+
+    inputs = build_projection_inputs(standings, histories, picks, bootstrap)
+    remaining = remaining_gameweeks(bootstrap)
+    return {
+        "inputs": inputs,
+        "probabilities": simulate_finishing_positions(inputs, remaining, n_sims, seed=league_id * 100 + gameweek),
+        "remaining": remaining,
+    }
+
+
+@cached(ttl=300)
+def load_expected_points(league_id: int, gameweek: int, entry_ids: tuple) -> pd.DataFrame:
+    """Project next gameweek's points from each manager's latest picks.
+
+    Returns:
+        Output of analytics.expected_points.build_expected_points_table.
+    """
+    standings, bootstrap = _shown_standings(league_id, entry_ids)
+    return build_expected_points_table(standings, load_manager_picks(entry_ids, gameweek), bootstrap)
+
+
+@cached(ttl=300)
+def load_differentials(league_id: int, gameweek: int, entry_ids: tuple) -> dict:
+    """Compute league vs global ownership and every manager's swings once per gameweek.
+
+    Returns:
+        Output of analytics.differentials.compute_differentials.
+    """
+    _, bootstrap = load_all_data(league_id)
+    return compute_differentials(load_manager_picks(entry_ids, gameweek), bootstrap)
+
+
+@cached(ttl=300)
+def load_squad_similarity(league_id: int, gameweek: int, entry_ids: tuple, clusters: int) -> dict:
+    """Compare the shown managers' squads for a gameweek.
+
+    Returns:
+        Output of analytics.similarity.build_similarity_report.
+    """
+    standings, bootstrap = _shown_standings(league_id, entry_ids)
+    return build_similarity_report(standings, load_manager_picks(entry_ids, gameweek), bootstrap, clusters)
+
+
+def _shown_standings(league_id: int, entry_ids: tuple) -> tuple:
+    """Return the league's standings rows for ``entry_ids`` and the bootstrap data."""
+    standings_data, bootstrap = load_all_data(league_id)
+    wanted = set(entry_ids)
+    return [s for s in standings_data.get("standings", {}).get("results", []) if s["entry"] in wanted], bootstrap
+
+
+@cached(ttl=86400)
+def load_gw_highlights(league_id: int, data_version: str, entry_ids: tuple, gameweek: int) -> dict:
+    """Compute the dashboard's gameweek highlights once per data version.
+
+    Returns:
+        Output of analytics.dashboard.compute_gw_highlights.
+    """
+    standings, bootstrap = _shown_standings(league_id, entry_ids)
+    points = {e["id"]: e.get("event_points", 0) for e in bootstrap.get("elements", [])}
+    return compute_gw_highlights(
+        standings, load_manager_picks(entry_ids, gameweek), points, fpl_api.get_player_names(bootstrap)
+    )
+
+
+@cached(ttl=300)
+def load_transfer_analysis(league_id: int, data_version: str, entry_ids: tuple, current_gw: int) -> dict:
+    """Compute every Transfer Analysis view for a league.
+
+    Managers transfer between a gameweek being checked and the next
+    deadline, so this refreshes on the same five-minute TTL as the
+    transfer lists it reads rather than once per data version.
+
+    Returns:
+        Output of analytics.transfers.build_transfer_analysis.
+    """
+    standings, bootstrap = _shown_standings(league_id, entry_ids)
+    return build_transfer_analysis(
+        standings,
+        load_manager_histories(entry_ids),
+        load_manager_transfers(entry_ids),
+        fpl_api.get_player_names(bootstrap),
+        current_gw,
+    )
+
+
+@cached(ttl=86400)
+def load_position_points(data_version: str, gameweek: int, entry_ids: tuple) -> pd.DataFrame:
+    """Total every shown manager's points by position for a gameweek, once per data version.
+
+    Returns:
+        Output of analytics.lineups.position_points.
+    """
+    points = load_points_matrix((gameweek,))
+    return position_points(
+        load_manager_picks(entry_ids, gameweek),
+        points[gameweek].to_dict() if gameweek in points else {},
+        fpl_api.get_bootstrap_data(),
+    )
+
+
+@cached(ttl=86400)
+def load_league_ownership(data_version: str, gameweek: int, entry_ids: tuple) -> pd.DataFrame:
+    """Count the shown managers' ownership of every player for a gameweek, once per data version.
+
+    Returns:
+        Output of analytics.differentials.count_league_ownership.
+    """
+    return count_league_ownership(load_manager_picks(entry_ids, gameweek), fpl_api.get_bootstrap_data())
+
+
+def _fetch_manager_picks(entry_id: int, gameweek: int, final: bool = False):
+    """Fetch picks, returning None when the manager has none for the gameweek."""
+    try:
+        if final:
+            return fpl_api.get_finished_manager_picks(entry_id, gameweek)
+        return fpl_api.get_manager_picks(entry_id, gameweek)
+    except Unavailable:
+        # The sync daemon only stores picks for gameweeks the manager played
+        history = fpl_api.get_manager_history(entry_id)
+        if gameweek in {row["event"] for row in history.get("current", [])}:
+            raise
+        return None
+    except Exception:
+        return None
+
+
+@cached(ttl=300)
+def load_season_picks(entry_ids: tuple, gameweeks: tuple) -> dict:
+    """Load picks for every manager and gameweek, fetched concurrently.
+
+    Returns:
+        Nested dict {entry_id: {gameweek: picks or None}}.
+    """
+    final = final_gameweeks(fpl_api.get_bootstrap_data())
+    args = [(entry_id, gw, gw in final) for entry_id in entry_ids for gw in gameweeks]
+    results = fpl_api.fetch_many(_fetch_manager_picks, args)
+    picks = {entry_id: {} for entry_id in entry_ids}
+    for (entry_id, gw, _), result in zip(args, results):
+        picks[entry_id][gw] = result
     return picks
 
 
-def show_error(e: Exception) -> None:
-    """Display a sanitized error message without exposing internal details."""
-    import streamlit as _st
-    from fpl_api import GameUpdatingError
-    if isinstance(e, GameUpdatingError):
-        _st.warning("The FPL game is currently being updated. Please try again later.")
-    else:
-        _st.error("Failed to load data. Please check the league ID and try again.")
+def final_gameweeks(bootstrap_data: dict) -> set:
+    """Return the IDs of gameweeks whose data FPL has checked (and so won't change)."""
+    return {e["id"] for e in bootstrap_data.get("events", []) if e.get("data_checked")}
+
+
+def _fetch_live_gameweek(gameweek: int, final: bool) -> dict:
+    """Fetch live data, from the permanent cache once the gameweek is final."""
+    if final:
+        return fpl_api.get_finished_live_gameweek(gameweek)
+    return fpl_api.get_live_gameweek(gameweek)
+
+
+@cached(ttl=300)
+def load_points_matrix(gameweeks: tuple) -> pd.DataFrame:
+    """Load per-player points for several gameweeks as one matrix.
+
+    Live payloads are fetched concurrently; checked gameweeks come from the
+    permanent cache, so only the in-progress gameweek is ever refetched.
+
+    Returns:
+        DataFrame indexed by element ID with one column of points per gameweek.
+    """
+    final = final_gameweeks(fpl_api.get_bootstrap_data())
+    payloads = fpl_api.fetch_many(_fetch_live_gameweek, [(gw, gw in final) for gw in gameweeks])
+    return build_points_matrix(dict(zip(gameweeks, payloads)))
+
+
+def build_points_matrix(live_by_gw: dict) -> pd.DataFrame:
+    """Reduce live gameweek payloads into a players × GW points matrix.
+
+    Args:
+        live_by_gw: Live gameweek payloads keyed by gameweek number.
+
+    Returns:
+        DataFrame indexed by element ID with one int column per gameweek;
+        players without an entry in a gameweek score 0.
+    """
+    columns = {}
+    for gw, live_data in live_by_gw.items():
+        elements = live_data.get("elements", [])
+        ids = np.fromiter((e["id"] for e in elements), dtype=np.int64, count=len(elements))
+        points = np.fromiter(
+            (e.get("stats", {}).get("total_points", 0) for e in elements), dtype=np.int64, count=len(elements)
+        )
+        columns[gw] = pd.Series(points, index=ids)
+    if not columns:
+        return pd.DataFrame(dtype=np.int64)
+    matrix = pd.DataFrame(columns).fillna(0).astype(np.int64).sort_index()
+    matrix.index.name = "element"
+    matrix.columns.name = "gameweek"
+    return matrix
+
+
+# Element-summary history fields: summed over a double gameweek, or the last value taken
+_HISTORY_SUM_FIELDS = ["total_points", "minutes", "goals_scored", "assists", "clean_sheets", "bonus"]
+_HISTORY_LAST_FIELDS = ["value", "selected", "transfers_balance"]
+
+
+@cached(ttl=86400)
+def load_player_history(element_ids: tuple, gameweek_version: str) -> pd.DataFrame:
+    """Load per-gameweek history for many players from their element summaries.
+
+    Args:
+        element_ids: Player element IDs to load.
+        gameweek_version: Token from fpl_api.get_gameweek_version, used as the
+            expiry key. The sync daemon stores summaries under the same token.
+
+    Returns:
+        Table from build_player_history_table.
+    """
+    summaries = fpl_api.get_element_summaries(list(element_ids), gameweek_version)
+    return build_player_history_table(summaries)
+
+
+@cached(ttl=86400)
+def load_player_table(bootstrap_version: str) -> pd.DataFrame:
+    """Build the global player table once per bootstrap payload.
+
+    Args:
+        bootstrap_version: Fingerprint from fpl_api.get_bootstrap_version.
+
+    Returns:
+        Output of analytics.players.build_player_table.
+    """
+    return build_player_table(fpl_api.get_bootstrap_data())
+
 
+@cached(ttl=86400)
+def load_season_summary(bootstrap_version: str) -> dict:
+    """Summarize the season's scores and chip plays once per bootstrap payload.
 
-def get_rank_change_indicator(current: int, previous: int) -> str:
-    """Return arrow indicator for rank change."""
-    if previous == 0:
-        return "-"
-    diff = previous - current
-    if diff > 0:
-        return f"↑{diff}"
-    elif diff < 0:
-        return f"↓{abs(diff)}"
-    return "-"
+    Args:
+        bootstrap_version: Fingerprint from fpl_api.get_bootstrap_version.
 
+    Returns:
+        Output of analytics.players.summarize_season.
+    """
+    return summarize_season(fpl_api.get_bootstrap_data())
 
-def _get_manager_range(total: int):
-    """Resolve the current manager display range from session state."""
-    display = st.session_state.get("manager_display", "Top 10")
+
+def build_player_history_table(summaries: dict) -> pd.DataFrame:
+    """Normalize element summaries into a columnar players × GW table.
+
+    Args:
+        summaries: Element summaries keyed by element ID.
+
+    Returns:
+        DataFrame indexed by (element, gameweek) with one numeric column per
+        history field. Double gameweeks are collapsed into a single row.
+    """
+    fields = _HISTORY_SUM_FIELDS + _HISTORY_LAST_FIELDS
+    columns = {name: [] for name in ["element", "gameweek"] + fields}
+    for element_id, summary in summaries.items():
+        for row in summary.get("history", []):
+            columns["element"].append(element_id)
+            columns["gameweek"].append(row.get("round", 0))
+            for name in fields:
+                columns[name].append(row.get(name, 0) or 0)
+
+    table = pd.DataFrame(columns, dtype=np.int64)
+    aggregations = {name: "sum" for name in _HISTORY_SUM_FIELDS}
+    aggregations.update({name: "last" for name in _HISTORY_LAST_FIELDS})
+    return table.groupby(["element", "gameweek"]).agg(aggregations)
+
+
+@cached(ttl=300)
+def load_snapshot_series(element_ids: tuple, store_mtime: float) -> pd.DataFrame:
+    """Load recorded price, ownership and transfer series from the snapshot store.
+
+    Args:
+        element_ids: Player element IDs to load.
+        store_mtime: Modification time of the store file, used as the cache key.
+
+    Returns:
+        Table from SnapshotStore.player_series.
+    """
+    return SnapshotStore().player_series(list(element_ids))
+
+
+def resolve_manager_range(total: int, display: str = "Top 10", custom_start: int = 1, custom_end: int = 20):
+    """Resolve a manager display option to a (start, end) slice of the standings."""
     if display == "Top 10":
         return 0, min(10, total)
     if display == "Top 20":
@@ -93,27 +396,45 @@ def _get_manager_range(total: int):
     if display == "All":
         return 0, total
     # Custom
-    start = max(1, int(st.session_state.get("custom_start", 1)))
-    end = max(start, int(st.session_state.get("custom_end", 20)))
+    start = max(1, int(custom_start))
+    end = max(start, int(custom_end))
     return start - 1, min(end, total)
 
 
-def get_league_context():
-    """Helper to get common data needed by most pages."""
-    league_id = int(st.session_state.get("league_id") or 0)
-    if not league_id:
-        from features.ui import welcome_screen
-        welcome_screen()
+def record_league_view(league_id: int) -> None:
+    """Note that a league was opened, so the sync daemon keeps it warm."""
+    try:
+        get_backend().set(f"{_VIEWED_LEAGUES}:{league_id}", _VIEWED_LEAGUES, b"", SYNC_RECENT_LEAGUE_TTL, None)
+    except Exception:
+        pass
+
+
+def get_recent_league_ids() -> list:
+    """Return the leagues opened in the app within SYNC_RECENT_LEAGUE_TTL."""
+    return sorted(int(key.rsplit(":", 1)[1]) for key in get_backend().keys(_VIEWED_LEAGUES))
+
+
+def load_league_context(league_id: int, display: str = "Top 10", custom_start: int = 1, custom_end: int = 20):
+    """Load the common data needed by most league pages.
+
+    Args:
+        league_id: Classic league ID.
+        display: Manager range option ("Top 10", "Top 20", "All" or "Custom").
+        custom_start: First rank shown for the "Custom" option.
+        custom_end: Last rank shown for the "Custom" option.
+    """
     standings_data, bootstrap_data = load_all_data(league_id)
     league_info = standings_data.get("league", {})
     all_standings = standings_data.get("standings", {}).get("results", [])
     current_gw = fpl_api.get_current_gameweek(bootstrap_data)
 
-    start, end = _get_manager_range(len(all_standings))
+    start, end = resolve_manager_range(len(all_standings), display, custom_start, custom_end)
     standings = all_standings[start:end]
     entry_ids = tuple(s["entry"] for s in standings)
 
     return {
+        "league_id": league_id,
+        "data_version": fpl_api.get_data_version(bootstrap_data),
         "league_info": league_info,
         "standings": standings,
         "bootstrap_data": bootstrap_data,
@@ -122,11 +443,39 @@ def get_league_context():
     }
 
 
-def get_global_context():
+def load_multi_league_context(league_ids: tuple):
+    """Load several leagues together and union their managers.
+
+    Managers who are in more than one league appear once in ``entry_ids``,
+    so per-manager data loaded for the union is fetched once per manager.
+    """
+    leagues = {}
+    bootstrap_data = None
+    for league_id in league_ids:
+        standings_data, bootstrap_data = load_all_data(league_id)
+        leagues[league_id] = {
+            "name": standings_data.get("league", {}).get("name", f"League {league_id}"),
+            "standings": standings_data.get("standings", {}).get("results", []),
+        }
+
+    entry_ids = tuple(sorted({s["entry"] for league in leagues.values() for s in league["standings"]}))
+    bootstrap_data = bootstrap_data or fpl_api.get_bootstrap_data()
+    return {
+        "leagues": leagues,
+        "bootstrap_data": bootstrap_data,
+        "current_gw": fpl_api.get_current_gameweek(bootstrap_data),
+        "data_version": fpl_api.get_data_version(bootstrap_data),
+        "entry_ids": entry_ids,
+    }
+
+
+def load_global_context():
     """Return bootstrap data and current GW — no league ID required."""
     bootstrap_data = fpl_api.get_bootstrap_data()
     current_gw = fpl_api.get_current_gameweek(bootstrap_data)
     return {
         "bootstrap_data": bootstrap_data,
         "current_gw": current_gw,
+        "data_version": fpl_api.get_data_version(bootstrap_data),
+        "bootstrap_version": fpl_api.get_bootstrap_version(bootstrap_data),
     }
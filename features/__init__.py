@@ -1,10 +1,6 @@
 """Feature modules for FPL League Analysis."""
 
-from features.dashboard.league_summary import render_league_summary
-from features.standings import render_standings, BASIC_COLUMNS, ALL_COLUMNS
-from features.league_insights.points_per_gw import render_points_per_gameweek
-from features.transfers import render_transfers_by_manager, render_most_transferred_players
-from features.captain.popular_captains import render_captain_picks
+from features._lazy import lazy_exports
 
 __all__ = [
     "render_league_summary",
@@ -16,3 +12,14 @@ __all__ = [
     "render_most_transferred_players",
     "render_captain_picks",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "render_league_summary": ".dashboard.league_summary",
+    "render_standings": ".standings",
+    "BASIC_COLUMNS": ".standings",
+    "ALL_COLUMNS": ".standings",
+    "render_points_per_gameweek": ".league_insights.points_per_gw",
+    "render_transfers_by_manager": ".transfers",
+    "render_most_transferred_players": ".transfers",
+    "render_captain_picks": ".captain.popular_captains",
+})
@@ -0,0 +1,35 @@
+"""Lazy re-exports for the feature packages.
+
+Importing ``features.ui`` used to run ``features/__init__.py``, which in turn
+imported every feature module along with pandas, plotly and the analytics
+package. Feature packages now map their public names to the module that
+defines them, and a module is imported the first time one of its names is
+used, so a page only pays for the sections it renders.
+"""
+
+import importlib
+
+
+def lazy_exports(package: str, exports: dict):
+    """Build module-level ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        package: The package's ``__name__``.
+        exports: Public name → defining module, absolute or relative to
+            ``package``.
+
+    Returns:
+        Tuple of (__getattr__, __dir__) to assign in the package.
+    """
+    def __getattr__(name: str):
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(exports[name], package), name)
+        # Cache on the package so later lookups skip this hook
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(importlib.import_module(package))) | set(exports))
+
+    return __getattr__, __dir__
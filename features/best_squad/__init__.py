@@ -1,5 +1,11 @@
 """Best squad feature modules."""
 
-from features.best_squad.formation_view import render_best_squad
+from features._lazy import lazy_exports
 
-__all__ = ["render_best_squad"]
+__all__ = [
+    "render_best_squad",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "render_best_squad": ".formation_view",
+})
@@ -4,7 +4,14 @@ import html as _html
 
 import streamlit as st
 
-from features.best_squad.squad_selector import merge_player_data, select_best_squad
+from analytics.squad import (
+    SQUAD_BUDGET,
+    merge_player_points,
+    select_best_squad,
+    select_starting_xi,
+)
+
+_POSITION_KEYS = ["goalkeepers", "defenders", "midfielders", "forwards"]
 
 
 def _get_points_color(points: int) -> str:
@@ -57,83 +64,30 @@ def _render_player_card_html(player: dict) -> str:
     return card_html
 
 
-def _render_forwards_row_html(forwards: list) -> str:
-    """Generate HTML for forwards row (3 players centered).
-
-    Args:
-        forwards: List of forward player dicts.
-
-    Returns:
-        HTML string for forwards row.
-    """
-    if len(forwards) < 3:
-        return ""
-
-    cards = [_render_player_card_html(forwards[i]) for i in range(3)]
-    cards_html = "".join(cards)
-
-    return f"<div style='display: flex; justify-content: center; gap: 1rem; margin: 1rem 0;'>{cards_html}</div>"
-
-
-def _render_midfielders_row_html(midfielders: list) -> str:
-    """Generate HTML for midfielders row (5 players).
+def _render_row_html(players: list, gap: str = "0.5rem") -> str:
+    """Generate HTML for one formation row of player cards.
 
     Args:
-        midfielders: List of midfielder player dicts.
+        players: List of player dicts in display order.
+        gap: CSS gap between cards.
 
     Returns:
-        HTML string for midfielders row.
+        HTML string for the row.
     """
-    if len(midfielders) < 5:
+    if not players:
         return ""
 
-    cards = [_render_player_card_html(midfielders[i]) for i in range(5)]
-    cards_html = "".join(cards)
-
-    return f"<div style='display: flex; justify-content: center; gap: 0.5rem; margin: 1rem 0;'>{cards_html}</div>"
+    cards_html = "".join(_render_player_card_html(player) for player in players)
 
+    return f"<div style='display: flex; justify-content: center; gap: {gap}; margin: 1rem 0;'>{cards_html}</div>"
 
-def _render_defenders_row_html(defenders: list) -> str:
-    """Generate HTML for defenders row (5 players).
-
-    Args:
-        defenders: List of defender player dicts.
-
-    Returns:
-        HTML string for defenders row.
-    """
-    if len(defenders) < 5:
-        return ""
 
-    cards = [_render_player_card_html(defenders[i]) for i in range(5)]
-    cards_html = "".join(cards)
-
-    return f"<div style='display: flex; justify-content: center; gap: 0.5rem; margin: 1rem 0;'>{cards_html}</div>"
-
-
-def _render_goalkeepers_row_html(goalkeepers: list) -> str:
-    """Generate HTML for goalkeepers row (2 players centered).
-
-    Args:
-        goalkeepers: List of goalkeeper player dicts.
-
-    Returns:
-        HTML string for goalkeepers row.
-    """
-    if len(goalkeepers) < 2:
-        return ""
-
-    cards = [_render_player_card_html(goalkeepers[i]) for i in range(2)]
-    cards_html = "".join(cards)
-
-    return f"<div style='display: flex; justify-content: center; gap: 2rem; margin: 1rem 0;'>{cards_html}</div>"
-
-
-def _render_summary_stats(squad: dict) -> None:
+def _render_summary_stats(squad: dict, lineup: dict) -> None:
     """Display aggregate stats.
 
     Args:
         squad: Squad dict with all positions.
+        lineup: Starting XI dict from select_starting_xi.
     """
     # Calculate totals
     all_players = []
@@ -143,63 +97,72 @@ def _render_summary_stats(squad: dict) -> None:
     if not all_players:
         return
 
-    total_points = sum(p["total_points"] for p in all_players)
-    highest = max(p["total_points"] for p in all_players)
-    avg = round(total_points / len(all_players), 1)
+    starters = [p for key in _POSITION_KEYS for p in lineup[key]]
+    xi_points = sum(p["total_points"] for p in starters)
+    captain = lineup["captain"]
+    squad_cost = sum(p["price"] for p in all_players)
+    formation = "-".join(str(len(lineup[key])) for key in _POSITION_KEYS[1:])
 
     # Display metrics
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Squad Points", total_points)
+        st.metric("Starting XI Points", xi_points, f"+{captain['total_points']} captain" if captain else None)
     with col2:
-        st.metric("Highest Scorer", highest)
+        st.metric("Total Squad Points", sum(p["total_points"] for p in all_players))
     with col3:
-        st.metric("Average Points", avg)
+        st.metric("Squad Cost", f"£{squad_cost:.1f}m", f"£{SQUAD_BUDGET - squad_cost:.1f}m in the bank", delta_color="off")
+    with col4:
+        st.metric("Formation", formation)
 
 
-def render_best_squad(bootstrap_data: dict, live_data: dict, selected_gw: int) -> None:
+def render_best_squad(bootstrap_data: dict, player_points, period_label: str) -> None:
     """Render best squad in formation layout.
 
     Args:
         bootstrap_data: Bootstrap data containing player metadata.
-        live_data: Live gameweek data containing player performance.
-        selected_gw: Selected gameweek number.
+        player_points: Mapping (dict or Series) of element ID to points over the period.
+        period_label: Human-readable period, e.g. "GW 12" or "GW 5–12".
     """
     with st.spinner("Building best squad..."):
         # Merge data
-        all_players = merge_player_data(bootstrap_data, live_data)
+        all_players = merge_player_points(bootstrap_data, player_points)
 
         # Check if any players scored
         players_with_points = [p for p in all_players if p["total_points"] > 0]
         if not players_with_points:
-            st.info("No player performance data available for this gameweek.")
+            st.info(f"No player performance data available for {period_label}.")
             return
 
         # Select squad
         squad = select_best_squad(all_players)
+        lineup = select_starting_xi(squad)
+
+    if not all(squad.get(key) for key in _POSITION_KEYS):
+        st.info(f"No legal squad could be built for {period_label}.")
+        return
 
     # Display summary stats
-    _render_summary_stats(squad)
+    _render_summary_stats(squad, lineup)
 
     st.divider()
 
     # Generate HTML for each formation row
-    goalkeepers_html = _render_goalkeepers_row_html(squad.get("goalkeepers", []))
-    defenders_html = _render_defenders_row_html(squad.get("defenders", []))
-    midfielders_html = _render_midfielders_row_html(squad.get("midfielders", []))
-    forwards_html = _render_forwards_row_html(squad.get("forwards", []))
-
-    # Check if we have all formations
-    if not all([goalkeepers_html, defenders_html, midfielders_html, forwards_html]):
-        st.info("Not enough players with points in this gameweek to form a complete squad.")
-        return
+    rows_html = "".join(
+        _render_row_html(lineup[key], gap="2rem" if key == "goalkeepers" else "0.5rem")
+        for key in _POSITION_KEYS
+    )
 
-    # Render complete formation with pitch background in one HTML block
+    # Render starting XI with pitch background in one HTML block
     formation_html = f"""<div style='background-image: url("https://fantasy.premierleague.com/assets/pitch-graphic-t77-OTdp.svg"); background-size: cover; background-position: center; background-repeat: no-repeat; border-radius: 10px; padding: 3rem 6rem; min-height: 850px; display: flex; flex-direction: column; justify-content: space-around;'>
-        {goalkeepers_html}
-        {defenders_html}
-        {midfielders_html}
-        {forwards_html}
+        {rows_html}
     </div>"""
 
     st.markdown(formation_html, unsafe_allow_html=True)
+
+    # Bench below the pitch
+    st.caption("Bench")
+    bench_html = _render_row_html(lineup["bench"], gap="1rem")
+    st.markdown(
+        f"<div style='background-color: #f3e8ff; border-radius: 10px; padding: 0.5rem 6rem;'>{bench_html}</div>",
+        unsafe_allow_html=True,
+    )
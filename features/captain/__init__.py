@@ -1,5 +1,11 @@
 """Captain picks feature modules."""
 
-from features.captain.popular_captains import render_captain_picks
+from features._lazy import lazy_exports
 
-__all__ = ["render_captain_picks"]
+__all__ = [
+    "render_captain_picks",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "render_captain_picks": ".popular_captains",
+})
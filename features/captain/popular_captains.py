@@ -1,19 +1,21 @@
 """Popular captains analysis display."""
 
-from collections import Counter
-
-import pandas as pd
 import plotly.express as px
 import streamlit as st
 
 import fpl_api
-
+from analytics.captains import summarize_captains
+from data_loader import load_manager_picks, load_points_matrix
+from features.context import show_error
 from features.ui import metric_card
 
 
+@st.fragment
 def render_captain_picks(context: dict, histories: dict = None) -> None:
     """Display captain picks analysis.
 
+    Runs as a fragment, so changing the gameweek reloads only this section.
+
     Args:
         context: League context containing standings and bootstrap data.
         histories: Dictionary of manager histories keyed by entry ID.
@@ -22,11 +24,6 @@ def render_captain_picks(context: dict, histories: dict = None) -> None:
     bootstrap_data = context["bootstrap_data"]
     current_gw = context["current_gw"]
 
-    # Build player points lookup
-    player_points = {}
-    for element in bootstrap_data.get("elements", []):
-        player_points[element["id"]] = element.get("event_points", 0)
-
     selected_gw = st.selectbox(
         "Select Gameweek",
         options=list(range(1, current_gw + 1)),
@@ -34,55 +31,33 @@ def render_captain_picks(context: dict, histories: dict = None) -> None:
     )
 
     with st.spinner("Loading captain data..."):
-        all_captains = []
-        captain_points_list = []
-
-        for s in standings:
-            entry_id = s["entry"]
-
-            try:
-                picks = fpl_api.get_manager_picks(entry_id, selected_gw)
-                for pick in picks.get("picks", []):
-                    if pick.get("is_captain"):
-                        captain_id = pick["element"]
-                        all_captains.append(captain_id)
-                        # Get captain points (doubled for captain)
-                        pts = player_points.get(captain_id, 0) * 2
-                        captain_points_list.append({
-                            "captain_id": captain_id,
-                            "points": pts,
-                        })
-                        break
-            except Exception:
-                pass
+        try:
+            picks_by_entry = load_manager_picks(tuple(s["entry"] for s in standings), selected_gw)
+            points = load_points_matrix((selected_gw,))
+        except Exception as e:
+            show_error(e)
+            return
+
+        captains = summarize_captains(
+            picks_by_entry,
+            points[selected_gw].to_dict() if selected_gw in points else {},
+            fpl_api.get_player_names(bootstrap_data),
+        )
 
     # Most popular captains with points
     st.subheader("Most Popular Captains")
-    captain_counts = Counter(all_captains)
-    top_captains = captain_counts.most_common(10)
-
-    captain_df = pd.DataFrame([
-        {
-            "Captain": fpl_api.get_player_name(pid, bootstrap_data),
-            "Picked by Managers": count,
-            "Points (x2)": player_points.get(pid, 0) * 2,
-        }
-        for pid, count in top_captains if pid
-    ])
+    captain_df = captains.head(10).drop(columns="element")
 
     if not captain_df.empty:
         # Captain success metrics
-        if captain_points_list:
-            best_captain = max(captain_points_list, key=lambda x: x["points"])
-            worst_captain = min(captain_points_list, key=lambda x: x["points"])
-
-            col1, col2 = st.columns(2)
-            with col1:
-                best_name = fpl_api.get_player_name(best_captain["captain_id"], bootstrap_data)
-                metric_card("Best Captain", f"{best_name}", f"{best_captain['points']} pts", "positive")
-            with col2:
-                worst_name = fpl_api.get_player_name(worst_captain["captain_id"], bootstrap_data)
-                metric_card("Worst Captain", f"{worst_name}", f"{worst_captain['points']} pts", "negative")
+        best_captain = captains.loc[captains["Points (x2)"].idxmax()]
+        worst_captain = captains.loc[captains["Points (x2)"].idxmin()]
+
+        col1, col2 = st.columns(2)
+        with col1:
+            metric_card("Best Captain", best_captain["Captain"], f"{best_captain['Points (x2)']} pts", "positive")
+        with col2:
+            metric_card("Worst Captain", worst_captain["Captain"], f"{worst_captain['Points (x2)']} pts", "negative")
 
         fig = px.bar(
             captain_df, x="Captain", y="Picked by Managers",
@@ -0,0 +1,56 @@
+"""Streamlit wrappers around the headless data loaders.
+
+Pages get their league or global context from here. These helpers read the
+sidebar settings from session state and pass them to data_loader, which has
+no Streamlit dependency of its own.
+"""
+
+import streamlit as st
+
+import data_loader
+from fpl_api import DataNotSyncedError, GameUpdatingError
+from features.ui import welcome_screen
+
+
+def get_league_context():
+    """Helper to get common data needed by most pages."""
+    league_id = int(st.session_state.get("league_id") or 0)
+    if not league_id:
+        welcome_screen()
+    _record_views((league_id,))
+    return data_loader.load_league_context(
+        league_id,
+        display=st.session_state.get("manager_display", "Top 10"),
+        custom_start=st.session_state.get("custom_start", 1),
+        custom_end=st.session_state.get("custom_end", 20),
+    )
+
+
+def get_multi_league_context(league_ids: tuple):
+    """Load several leagues together and union their managers."""
+    _record_views(league_ids)
+    return data_loader.load_multi_league_context(league_ids)
+
+
+def get_global_context():
+    """Return bootstrap data and current GW — no league ID required."""
+    return data_loader.load_global_context()
+
+
+def _record_views(league_ids) -> None:
+    """Register leagues with the sync daemon, once per session."""
+    viewed = st.session_state.setdefault("viewed_leagues", set())
+    for league_id in league_ids:
+        if league_id not in viewed:
+            data_loader.record_league_view(league_id)
+            viewed.add(league_id)
+
+
+def show_error(e: Exception) -> None:
+    """Display a sanitized error message without exposing internal details."""
+    if isinstance(e, GameUpdatingError):
+        st.warning("The FPL game is currently being updated. Please try again later.")
+    elif isinstance(e, DataNotSyncedError):
+        st.info("This data hasn't been synced yet. The league has been queued — check back in a few minutes.")
+    else:
+        st.error("Failed to load data. Please check the league ID and try again.")
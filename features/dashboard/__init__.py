@@ -1,7 +1,17 @@
 """Dashboard feature modules."""
 
-from features.dashboard.gw_highlights import render_gw_highlights
-from features.dashboard.league_summary import render_league_summary
-from features.standings import render_standings, BASIC_COLUMNS
+from features._lazy import lazy_exports
 
-__all__ = ["render_gw_highlights", "render_league_summary", "render_standings", "BASIC_COLUMNS"]
+__all__ = [
+    "render_gw_highlights",
+    "render_league_summary",
+    "render_standings",
+    "BASIC_COLUMNS",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "render_gw_highlights": ".gw_highlights",
+    "render_league_summary": ".league_summary",
+    "render_standings": "features.standings",
+    "BASIC_COLUMNS": "features.standings",
+})
@@ -1,5 +1,11 @@
 """Feedback feature components."""
 
-from features.feedback.render import render_feedback_form
+from features._lazy import lazy_exports
 
-__all__ = ["render_feedback_form"]
+__all__ = [
+    "render_feedback_form",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "render_feedback_form": ".render",
+})
@@ -0,0 +1,95 @@
+"""Process-wide cache of built Plotly figures.
+
+Building a figure with plotly express means a DataFrame, trace validation
+and layout merging on every rerun, even when nothing it shows has changed.
+``cached_figure`` keeps each built figure under a key that names
+everything the figure depends on — chart kind, league, gameweek, data
+version and display options — and hands the same object back on a hit,
+so st.plotly_chart only has to serialize it. Cached figures are shared
+between sessions and must not be modified by callers. Entries are evicted
+least recently used first once their JSON specs exceed
+FIGURE_CACHE_MAX_BYTES.
+"""
+
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from config import FIGURE_CACHE_MAX_BYTES
+
+
+class FigureCache:
+    """LRU map of figure key → figure, bounded by the total size of their specs."""
+
+    def __init__(self, max_bytes: int = FIGURE_CACHE_MAX_BYTES):
+        self._figures = OrderedDict()  # key -> (figure, spec size)
+        self._bytes = 0
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple):
+        """Return the stored figure for ``key``, or None."""
+        with self._lock:
+            entry = self._figures.get(key)
+            if entry is None:
+                return None
+            self._figures.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: tuple, fig: go.Figure, size: int) -> None:
+        """Store a figure whose spec is ``size`` bytes, evicting the least recently used ones over budget."""
+        with self._lock:
+            old = self._figures.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if size > self._max_bytes:
+                return
+            self._figures[key] = (fig, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, evicted) = self._figures.popitem(last=False)
+                self._bytes -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._figures.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._figures), "bytes": self._bytes}
+
+
+_cache = FigureCache()
+
+
+def cached_figure(kind: str, key: tuple, build) -> go.Figure | None:
+    """Return a figure from the cache, building and storing it on a miss.
+
+    Args:
+        kind: Chart kind, e.g. "ownership_bar"; namespaces the key.
+        key: Hashable tuple of everything the figure depends on.
+        build: Zero-argument callable returning the figure, or None when
+            there is nothing to draw (None is not cached).
+
+    Returns:
+        The figure, or None if ``build`` returned None. A cached figure is
+        shared, so pass it to st.plotly_chart as is.
+    """
+    full_key = (kind, *key)
+    fig = _cache.get(full_key)
+    if fig is not None:
+        return fig
+
+    fig = build()
+    if fig is not None:
+        _cache.put(full_key, fig, len(pio.to_json(fig, validate=False)))
+    return fig
+
+
+def frame_key(df: pd.DataFrame) -> tuple:
+    """Fingerprint a DataFrame's columns and values for use in a figure key."""
+    return tuple(df.columns), len(df), int(pd.util.hash_pandas_object(df, index=False).sum())
@@ -1,9 +1,6 @@
 """Global FPL feature modules."""
 
-from .season_stats import render_season_stats
-from .player_rankings import render_player_rankings
-from .global_transfers import render_global_transfers
-from .global_ownership import render_global_ownership
+from features._lazy import lazy_exports
 
 __all__ = [
     "render_season_stats",
@@ -11,3 +8,10 @@ __all__ = [
     "render_global_transfers",
     "render_global_ownership",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "render_season_stats": ".season_stats",
+    "render_player_rankings": ".player_rankings",
+    "render_global_transfers": ".global_transfers",
+    "render_global_ownership": ".global_ownership",
+})
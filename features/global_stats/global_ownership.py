@@ -4,33 +4,21 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+from data_loader import load_player_table
+from features.figure_cache import cached_figure, frame_key
 from features.ui import metric_card, section_header
 
-_POSITION_MAP = {1: "GKP", 2: "DEF", 3: "MID", 4: "FWD"}
 _POSITION_TABS = ["Goalkeepers", "Defenders", "Midfielders", "Forwards"]
 _POSITION_KEYS = ["GKP", "DEF", "MID", "FWD"]
 
 
-def _build_ownership_df(bootstrap_data: dict) -> pd.DataFrame:
-    teams = {t["id"]: t["short_name"] for t in bootstrap_data.get("teams", [])}
-    rows = []
-    for el in bootstrap_data.get("elements", []):
-        rows.append({
-            "Player": el["web_name"],
-            "Team": teams.get(el["team"], ""),
-            "Pos": _POSITION_MAP.get(el["element_type"], ""),
-            "Price": round(el["now_cost"] / 10, 1),
-            "Owned %": float(el.get("selected_by_percent", 0) or 0),
-            "Total Pts": el.get("total_points", 0),
-            "GW Pts": el.get("event_points", 0),
-            "Form": float(el.get("form", 0) or 0),
-            "Pts / £m": round(el.get("total_points", 0) / max(el["now_cost"] / 10, 0.1), 1),
-        })
-    return pd.DataFrame(rows)
-
-
 def _ownership_bar(pos_df: pd.DataFrame, n: int = 15) -> None:
     top = pos_df.nlargest(n, "Owned %")
+    fig = cached_figure("global_ownership_bar", (n, frame_key(top)), lambda: _ownership_bar_figure(top, n))
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def _ownership_bar_figure(top: pd.DataFrame, n: int):
     fig = px.bar(
         top, x="Owned %", y="Player", orientation="h",
         color="Owned %",
@@ -49,13 +37,12 @@ def _ownership_bar(pos_df: pd.DataFrame, n: int = 15) -> None:
         showlegend=False,
         margin=dict(t=10, b=20, l=10, r=60),
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def render_global_ownership(context: dict) -> None:
     """Display global player ownership analysis."""
-    bootstrap_data = context["bootstrap_data"]
-    df = _build_ownership_df(bootstrap_data)
+    df = load_player_table(context["bootstrap_version"])
 
     # ── Summary metrics ───────────────────────────────────────────────────────
     top_owned = df.loc[df["Owned %"].idxmax()]
@@ -4,38 +4,22 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+from data_loader import load_player_table, load_snapshot_series
+from features.figure_cache import cached_figure, frame_key
 from features.ui import metric_card, section_header
+from snapshot_store import SnapshotStore
 
-_POSITION_MAP = {1: "GKP", 2: "DEF", 3: "MID", 4: "FWD"}
 
-
-def _build_transfer_df(bootstrap_data: dict) -> pd.DataFrame:
-    teams = {t["id"]: t["short_name"] for t in bootstrap_data.get("teams", [])}
-    rows = []
-    for el in bootstrap_data.get("elements", []):
-        in_gw = el.get("transfers_in_event", 0) or 0
-        out_gw = el.get("transfers_out_event", 0) or 0
-        in_season = el.get("transfers_in", 0) or 0
-        out_season = el.get("transfers_out", 0) or 0
-        rows.append({
-            "Player": el["web_name"],
-            "Team": teams.get(el["team"], ""),
-            "Pos": _POSITION_MAP.get(el["element_type"], ""),
-            "Price": round(el["now_cost"] / 10, 1),
-            "In (GW)": in_gw,
-            "Out (GW)": out_gw,
-            "Net (GW)": in_gw - out_gw,
-            "In (Season)": in_season,
-            "Out (Season)": out_season,
-            "Net (Season)": in_season - out_season,
-            "Owned %": float(el.get("selected_by_percent", 0) or 0),
-            "GW Pts": el.get("event_points", 0),
-            "Total Pts": el.get("total_points", 0),
-        })
-    return pd.DataFrame(rows)
+def _horizontal_bar(df: pd.DataFrame, x_col: str, color: str, title: str) -> None:
+    fig = cached_figure(
+        "transfer_bar",
+        (x_col, color, title, frame_key(df)),
+        lambda: _horizontal_bar_figure(df, x_col, color, title),
+    )
+    st.plotly_chart(fig, use_container_width=True)
 
 
-def _horizontal_bar(df: pd.DataFrame, x_col: str, color: str, title: str) -> None:
+def _horizontal_bar_figure(df: pd.DataFrame, x_col: str, color: str, title: str):
     fig = px.bar(
         df, x=x_col, y="Player", orientation="h",
         color_discrete_sequence=[color],
@@ -53,16 +37,18 @@ def _horizontal_bar(df: pd.DataFrame, x_col: str, color: str, title: str) -> Non
         showlegend=False,
         margin=dict(t=40, b=20, l=10, r=60),
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def render_global_transfers(context: dict) -> None:
     """Display global transfer trends."""
     bootstrap_data = context["bootstrap_data"]
     current_gw = context["current_gw"]
-    df = _build_transfer_df(bootstrap_data)
+    df = load_player_table(context["bootstrap_version"])
 
-    tab_gw, tab_season = st.tabs([f"GW {current_gw} Transfers", "Season Transfers"])
+    tab_gw, tab_season, tab_history = st.tabs(
+        [f"GW {current_gw} Transfers", "Season Transfers", "Price & Ownership History"]
+    )
 
     # ── This GW ───────────────────────────────────────────────────────────────
     with tab_gw:
@@ -133,3 +119,63 @@ def render_global_transfers(context: dict) -> None:
         with col_out:
             top_out_s = df.nlargest(10, "Out (Season)")[["Player", "Team", "Pos", "Price", "Out (Season)", "Total Pts"]].copy()
             _horizontal_bar(top_out_s, "Out (Season)", "#dc2626", "Top Transfers Out (Season)")
+
+    # ── History ───────────────────────────────────────────────────────────────
+    with tab_history:
+        _render_snapshot_history(bootstrap_data)
+
+
+def _render_snapshot_history(bootstrap_data: dict) -> None:
+    store_path = SnapshotStore().path
+    if not store_path.exists():
+        st.info(
+            "No snapshots recorded yet. Run `python scripts/snapshot_bootstrap.py` "
+            "to start recording prices and ownership over time."
+        )
+        return
+
+    teams = {t["id"]: t["short_name"] for t in bootstrap_data.get("teams", [])}
+    elements = sorted(
+        bootstrap_data.get("elements", []),
+        key=lambda el: float(el.get("selected_by_percent", 0) or 0),
+        reverse=True,
+    )
+    labels = {el["id"]: f"{el['web_name']} ({teams.get(el['team'], '')})" for el in elements}
+    selected = st.multiselect(
+        "Players",
+        options=list(labels),
+        default=list(labels)[:3],
+        format_func=labels.get,
+        max_selections=8,
+        key="gt_history_players",
+    )
+    if not selected:
+        return
+
+    series = load_snapshot_series(tuple(sorted(selected)), store_path.stat().st_mtime)
+    if series.empty:
+        st.info("No snapshots recorded for these players yet.")
+        return
+    series = series.assign(Player=series["element"].map(labels))
+
+    section_header("Price & Ownership History", f"{series['timestamp'].nunique()} snapshots recorded")
+    for column, title in (
+        ("price", "Price (£m)"),
+        ("ownership", "Ownership %"),
+        ("net_transfers", "Net Transfers This GW"),
+    ):
+        fig = px.line(
+            series, x="timestamp", y=column, color="Player",
+            color_discrete_sequence=["#37003c", "#00ff87", "#7b2d8b", "#c084fc", "#16a34a", "#dc2626", "#f59e0b", "#0ea5e9"],
+        )
+        fig.update_layout(
+            template="plotly_white",
+            height=320,
+            title=title,
+            title_font=dict(size=14),
+            xaxis_title="",
+            yaxis_title="",
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, title=""),
+            margin=dict(t=60, b=20),
+        )
+        st.plotly_chart(fig, use_container_width=True)
@@ -1,37 +1,21 @@
 """Global player rankings — sortable, filterable table of all FPL players."""
 
-import pandas as pd
+import plotly.graph_objects as go
 import streamlit as st
 
+import fpl_api
+from data_loader import load_player_history, load_player_table
 from features.ui import metric_card, section_header
 
-_POSITION_MAP = {1: "GKP", 2: "DEF", 3: "MID", 4: "FWD"}
 _ALL_POSITIONS = ["GKP", "DEF", "MID", "FWD"]
-
-
-def _build_player_df(bootstrap_data: dict) -> pd.DataFrame:
-    teams = {t["id"]: t["short_name"] for t in bootstrap_data.get("teams", [])}
-    rows = []
-    for el in bootstrap_data.get("elements", []):
-        rows.append({
-            "Player": el["web_name"],
-            "Team": teams.get(el["team"], ""),
-            "Pos": _POSITION_MAP.get(el["element_type"], ""),
-            "Price": round(el["now_cost"] / 10, 1),
-            "Total Pts": el.get("total_points", 0),
-            "GW Pts": el.get("event_points", 0),
-            "Form": float(el.get("form", 0) or 0),
-            "Owned %": float(el.get("selected_by_percent", 0) or 0),
-            "ICT": float(el.get("ict_index", 0) or 0),
-            "Pts / £m": round(el.get("total_points", 0) / max(el["now_cost"] / 10, 0.1), 1),
-        })
-    return pd.DataFrame(rows)
+_MAX_HISTORY_PLAYERS = 5
+_RANKING_COLUMNS = ["Player", "Team", "Pos", "Price", "Total Pts", "GW Pts", "Form", "Owned %", "ICT", "Pts / £m"]
 
 
 def render_player_rankings(context: dict) -> None:
     """Display global player rankings with filters."""
     bootstrap_data = context["bootstrap_data"]
-    df = _build_player_df(bootstrap_data)
+    df = load_player_table(context["bootstrap_version"])[_RANKING_COLUMNS]
 
     # ── Summary metrics ───────────────────────────────────────────────────────
     top_scorer = df.loc[df["Total Pts"].idxmax()]
@@ -89,3 +73,57 @@ def render_player_rankings(context: dict) -> None:
             "Pts / £m": st.column_config.NumberColumn("Pts / £m", format="%.1f"),
         },
     )
+
+    # ── Player history ────────────────────────────────────────────────────────
+    section_header("Player History", "Points and price gameweek by gameweek")
+    _render_player_history(bootstrap_data)
+
+
+def _render_player_history(bootstrap_data: dict) -> None:
+    elements = sorted(bootstrap_data.get("elements", []), key=lambda el: el.get("total_points", 0), reverse=True)
+    teams = {t["id"]: t["short_name"] for t in bootstrap_data.get("teams", [])}
+    labels = {el["id"]: f"{el['web_name']} ({teams.get(el['team'], '')})" for el in elements}
+
+    selected = st.multiselect(
+        "Players",
+        options=list(labels),
+        default=list(labels)[:1],
+        format_func=labels.get,
+        max_selections=_MAX_HISTORY_PLAYERS,
+        key="pr_history_players",
+    )
+    if not selected:
+        return
+
+    history = load_player_history(tuple(sorted(selected)), fpl_api.get_gameweek_version(bootstrap_data))
+    if history.empty:
+        st.info("No gameweek history available yet.")
+        return
+
+    col_pts, col_price = st.columns(2)
+    for col, field, title, scale in (
+        (col_pts, "total_points", "Points per Gameweek", 1),
+        (col_price, "value", "Price (£m)", 10),
+    ):
+        fig = go.Figure()
+        for element_id in selected:
+            if element_id not in history.index.get_level_values("element"):
+                continue
+            series = history.loc[element_id, field] / scale
+            fig.add_trace(go.Scatter(
+                x=series.index, y=series.values,
+                mode="lines+markers",
+                name=labels[element_id],
+            ))
+        fig.update_layout(
+            template="plotly_white",
+            height=350,
+            title=title,
+            title_font=dict(size=14),
+            xaxis_title="Gameweek",
+            yaxis_title="",
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+            margin=dict(t=60, b=40),
+        )
+        with col:
+            st.plotly_chart(fig, use_container_width=True)
@@ -1,18 +1,11 @@
 """Global season statistics — GW averages, highest scores, chip usage."""
 
-import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
+from data_loader import load_season_summary
 from features.ui import metric_card, section_header
 
-_CHIP_LABELS = {
-    "wildcard": "Wildcard",
-    "freehit": "Free Hit",
-    "bboost": "Bench Boost",
-    "3xc": "Triple Captain",
-}
-
 _CHIP_COLORS = {
     "Wildcard": "#37003c",
     "Free Hit": "#7b2d8b",
@@ -23,47 +16,29 @@ _CHIP_COLORS = {
 
 def render_season_stats(context: dict) -> None:
     """Display global season statistics."""
-    bootstrap_data = context["bootstrap_data"]
-    current_gw = context["current_gw"]
-
-    events = bootstrap_data.get("events", [])
-    played = [e for e in events if e.get("finished") or e.get("is_current")]
+    season = load_season_summary(context["bootstrap_version"])
+    gw_df = season["scores"]
 
-    if not played:
+    if gw_df.empty:
         st.info("No gameweek data available yet.")
         return
 
     # ── Summary metrics ───────────────────────────────────────────────────────
-    avgs = [e["average_entry_score"] for e in played if e.get("average_entry_score")]
-    highs = [e["highest_score"] for e in played if e.get("highest_score")]
-
-    season_avg = round(sum(avgs) / len(avgs), 1) if avgs else 0
-    best_avg_gw = max(played, key=lambda e: e.get("average_entry_score") or 0)
-    all_time_high = max(highs) if highs else 0
-    all_time_high_gw = next((e["id"] for e in played if e.get("highest_score") == all_time_high), "—")
+    best_avg_gw = season["best_avg_gw"]
 
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        metric_card("Season Avg Score", f"{season_avg} pts")
+        metric_card("Season Avg Score", f"{season['season_avg']} pts")
     with col2:
         metric_card("Best GW Avg", f"GW {best_avg_gw['id']}", f"{best_avg_gw.get('average_entry_score', 0)} pts avg", "positive")
     with col3:
-        metric_card("All-Time High Score", f"{all_time_high} pts", f"GW {all_time_high_gw}", "positive")
+        metric_card("All-Time High Score", f"{season['high_score']} pts", f"GW {season['high_score_gw']}", "positive")
     with col4:
-        metric_card("Gameweeks Played", str(len(played)), f"of 38 total")
+        metric_card("Gameweeks Played", str(len(gw_df)), f"of 38 total")
 
     # ── GW avg + highest score chart ─────────────────────────────────────────
     section_header("Score Trends", "Global average and highest score per gameweek")
 
-    gw_df = pd.DataFrame([
-        {
-            "Gameweek": e["id"],
-            "Global Avg": e.get("average_entry_score", 0),
-            "Highest Score": e.get("highest_score", 0),
-        }
-        for e in played
-    ])
-
     fig = go.Figure()
     fig.add_trace(go.Scatter(
         x=gw_df["Gameweek"], y=gw_df["Highest Score"],
@@ -95,21 +70,10 @@ def render_season_stats(context: dict) -> None:
     # ── Chip usage ────────────────────────────────────────────────────────────
     section_header("Chip Usage", "How many managers played each chip per gameweek")
 
-    chip_rows = []
-    for e in played:
-        for chip in e.get("chip_plays", []):
-            label = _CHIP_LABELS.get(chip["chip_name"], chip["chip_name"])
-            chip_rows.append({
-                "Gameweek": e["id"],
-                "Chip": label,
-                "Managers": chip["num_played"],
-            })
-
-    if chip_rows:
-        chip_df = pd.DataFrame(chip_rows)
-        chip_totals = chip_df.groupby("Chip")["Managers"].sum().reset_index()
-        chip_totals.columns = ["Chip", "Total Uses"]
+    chip_df = season["chips"]
+    chip_totals = season["chip_totals"]
 
+    if not chip_df.empty:
         col_chart, col_table = st.columns([2, 1])
 
         with col_chart:
@@ -1,11 +1,17 @@
 """Head-to-head feature modules."""
 
-from features.head_to_head.team_comparison import render_team_comparison
-from features.head_to_head.season_trajectory import render_season_trajectory
-from features.head_to_head.gameweek_breakdown import render_gameweek_breakdown
+from features._lazy import lazy_exports
 
 __all__ = [
     "render_team_comparison",
     "render_season_trajectory",
     "render_gameweek_breakdown",
+    "render_head_to_head_table",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "render_team_comparison": ".team_comparison",
+    "render_season_trajectory": ".season_trajectory",
+    "render_gameweek_breakdown": ".gameweek_breakdown",
+    "render_head_to_head_table": ".league_table",
+})
@@ -1,8 +1,11 @@
 """Gameweek by gameweek breakdown display."""
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from analytics.head_to_head import align_histories
+
 
 def render_gameweek_breakdown(team1_name: str, team2_name: str, history1: list, history2: list) -> None:
     """Display gameweek by gameweek breakdown.
@@ -15,34 +18,25 @@ def render_gameweek_breakdown(team1_name: str, team2_name: str, history1: list,
     """
     st.subheader("Gameweek by Gameweek")
 
-    h2h_data = []
-    wins1, wins2, draws = 0, 0, 0
-    biggest_swing = {"gw": 0, "diff": 0, "winner": ""}
+    # Compare only the gameweeks both managers played
+    aligned = align_histories(history1, history2)
+    margin = aligned["points_1"] - aligned["points_2"]
+    winner = np.select([margin > 0, margin < 0], [team1_name, team2_name], "Draw")
+    wins1, wins2 = int((margin > 0).sum()), int((margin < 0).sum())
+    draws = len(aligned) - wins1 - wins2
 
-    for gw1, gw2 in zip(history1, history2):
-        diff = abs(gw1["points"] - gw2["points"])
-
-        if gw1["points"] > gw2["points"]:
-            wins1 += 1
-            winner = team1_name
-        elif gw2["points"] > gw1["points"]:
-            wins2 += 1
-            winner = team2_name
-        else:
-            draws += 1
-            winner = "Draw"
-
-        # Track biggest swing
-        if diff > biggest_swing["diff"]:
-            biggest_swing = {"gw": gw1["event"], "diff": diff, "winner": winner}
-
-        h2h_data.append({
-            "GW": gw1["event"],
-            team1_name: gw1["points"],
-            team2_name: gw2["points"],
-            "Diff": diff,
-            "Winner": winner,
-        })
+    biggest_swing = {"gw": 0, "diff": 0, "winner": ""}
+    if len(aligned) and margin.abs().max() > 0:
+        i = int(margin.abs().idxmax())
+        biggest_swing = {"gw": int(aligned["GW"][i]), "diff": int(abs(margin[i])), "winner": winner[i]}
+
+    h2h_data = pd.DataFrame({
+        "GW": aligned["GW"],
+        team1_name: aligned["points_1"],
+        team2_name: aligned["points_2"],
+        "Diff": margin.abs(),
+        "Winner": winner,
+    })
 
     # Summary stats
     col1, col2 = st.columns(2)
@@ -57,5 +51,4 @@ def render_gameweek_breakdown(team1_name: str, team2_name: str, history1: list,
 
     st.write(f"**{team1_name}** wins: {wins1} | **{team2_name}** wins: {wins2} | Draws: {draws}")
 
-    df = pd.DataFrame(h2h_data)
-    st.dataframe(df, width='stretch', hide_index=True)
+    st.dataframe(h2h_data, width='stretch', hide_index=True)
@@ -0,0 +1,32 @@
+"""League-wide head-to-head table display."""
+
+import streamlit as st
+
+from analytics.head_to_head import build_head_to_head_table
+
+
+def render_head_to_head_table(context: dict, h2h: dict) -> None:
+    """Display every manager's gameweek-by-gameweek record against the league.
+
+    Args:
+        context: League context containing standings data.
+        h2h: Pairwise records from data_loader.load_head_to_head.
+    """
+    names = {s["entry"]: s["entry_name"] for s in context["standings"]}
+    table = build_head_to_head_table(h2h, names)
+    if table.empty or not table["P"].any():
+        st.info("No head-to-head data available yet.")
+        return
+
+    st.dataframe(
+        table,
+        hide_index=True,
+        width='stretch',
+        column_config={
+            "Rank": st.column_config.NumberColumn("Rank", format="%d", width="small"),
+            "P": st.column_config.NumberColumn("P", help="Gameweeks matched against other managers"),
+            "H2H Pts": st.column_config.NumberColumn("H2H Pts", help="3 for a win, 1 for a draw"),
+            "Win %": st.column_config.ProgressColumn("Win %", min_value=0, max_value=100, format="%.1f%%"),
+            "Avg Margin": st.column_config.NumberColumn("Avg Margin", format="%+.1f", help="Points per match"),
+        },
+    )
@@ -2,6 +2,7 @@
 
 import streamlit as st
 
+from analytics.head_to_head import season_summary
 from features.ui import metric_card
 
 
@@ -39,18 +40,8 @@ def render_team_comparison(context: dict, histories: dict) -> tuple:
         st.warning("Could not load history for one or both teams")
         return None, None, None, None
 
-    def calc_stats(history):
-        points = [gw["points"] for gw in history]
-        return {
-            "Total Points": sum(points),
-            "Average Points": round(sum(points) / len(points), 1) if points else 0,
-            "Best GW Points": max(points) if points else 0,
-            "Worst GW Points": min(points) if points else 0,
-            "Gameweeks Played": len(points),
-        }
-
-    stats1 = calc_stats(history1)
-    stats2 = calc_stats(history2)
+    stats1 = season_summary(history1)
+    stats2 = season_summary(history2)
 
     stat_keys = list(stats1.keys())
 
@@ -1,9 +1,17 @@
 """League insights feature modules."""
 
-from features.league_insights.points_per_gw import render_points_per_gameweek
-from features.league_insights.rank_movement import render_rank_movement
+from features._lazy import lazy_exports
 
 __all__ = [
     "render_points_per_gameweek",
     "render_rank_movement",
+    "render_squad_similarity",
+    "select_highlighted_managers",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "render_points_per_gameweek": ".points_per_gw",
+    "render_rank_movement": ".rank_movement",
+    "render_squad_similarity": ".squad_similarity",
+    "select_highlighted_managers": ".large_league",
+})
@@ -0,0 +1,88 @@
+"""Large-league chart mode — manager highlighting and WebGL percentile bands.
+
+One trace per manager stops scaling past a few dozen managers, so bigger
+leagues are drawn as percentile bands with a handful of highlighted
+managers on top.
+"""
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from config import LARGE_CHART_THRESHOLD, MAX_HIGHLIGHTED_MANAGERS
+
+HIGHLIGHT_COLORS = ["#37003c", "#00ff87", "#7b2d8b", "#16a34a", "#dc2626", "#c084fc"]
+
+
+def is_large_league(context: dict) -> bool:
+    """Whether the shown managers are too many to draw one line each."""
+    return len(context["standings"]) > LARGE_CHART_THRESHOLD
+
+
+def select_highlighted_managers(context: dict) -> list:
+    """Let the user pick managers to draw individually on large-league charts.
+
+    Renders nothing for smaller leagues, where every manager is drawn.
+
+    Returns:
+        Selected entry IDs, top three in the league by default.
+    """
+    if not is_large_league(context):
+        return []
+    names = {s["entry"]: s["entry_name"] for s in context["standings"]}
+    return st.multiselect(
+        "Highlight managers",
+        options=list(names),
+        default=list(names)[:3],
+        format_func=names.get,
+        max_selections=MAX_HIGHLIGHTED_MANAGERS,
+        key="insights_highlighted",
+    )
+
+
+def add_percentile_bands(fig: go.Figure, bands: pd.DataFrame, unit: str) -> None:
+    """Draw p10–p90 and p25–p75 shaded bands and the median as WebGL traces.
+
+    Args:
+        fig: Figure to add the traces to.
+        bands: Output of analytics.trends.percentile_bands.
+        unit: Hover label for the values, e.g. "pts".
+    """
+    x = bands.index.tolist()
+    for low, high, fill, name in (
+        ("p10", "p90", "rgba(123, 45, 139, 0.12)", "10th–90th percentile"),
+        ("p25", "p75", "rgba(123, 45, 139, 0.25)", "25th–75th percentile"),
+    ):
+        fig.add_trace(go.Scattergl(
+            x=x, y=bands[low], mode="lines", line=dict(width=0),
+            showlegend=False, hoverinfo="skip",
+        ))
+        fig.add_trace(go.Scattergl(
+            x=x, y=bands[high], mode="lines", line=dict(width=0),
+            fill="tonexty", fillcolor=fill, name=name, hoverinfo="skip",
+        ))
+    fig.add_trace(go.Scattergl(
+        x=x, y=bands["p50"], mode="lines", name="Median",
+        line=dict(color="#7b2d8b", width=2),
+        hovertemplate=f"Median: %{{y:.0f}} {unit}<extra></extra>",
+    ))
+
+
+def add_highlighted_lines(fig: go.Figure, matrix: pd.DataFrame, highlighted: list, names: dict, unit: str) -> None:
+    """Draw one WebGL line per highlighted manager.
+
+    Args:
+        fig: Figure to add the traces to.
+        matrix: Managers × gameweeks values indexed by entry ID.
+        highlighted: Entry IDs to draw.
+        names: Entry ID → team name.
+        unit: Hover label for the values.
+    """
+    for i, entry_id in enumerate(e for e in highlighted if e in matrix.index):
+        row = matrix.loc[entry_id].dropna()
+        fig.add_trace(go.Scattergl(
+            x=row.index.tolist(), y=row.tolist(), mode="lines+markers",
+            name=names.get(entry_id, str(entry_id)),
+            line=dict(color=HIGHLIGHT_COLORS[i % len(HIGHLIGHT_COLORS)], width=2.5),
+            hovertemplate=f"%{{fullData.name}}: %{{y:.0f}} {unit}<extra></extra>",
+        ))
@@ -5,15 +5,29 @@ import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
+from analytics.trends import build_gameweek_matrix, percentile_bands
+from features.league_insights.large_league import (
+    add_highlighted_lines,
+    add_percentile_bands,
+    is_large_league,
+)
 
-def render_points_per_gameweek(context: dict, histories: dict) -> None:
+
+def render_points_per_gameweek(context: dict, histories: dict, highlighted: list = None) -> None:
     """Display points per gameweek chart with league average line.
 
+    Large leagues are drawn as percentile bands plus the highlighted
+    managers instead of one line per manager.
+
     Args:
         context: League context containing standings data.
         histories: Dictionary of manager histories keyed by entry ID.
+        highlighted: Entry IDs drawn individually in large-league mode.
     """
     standings = context["standings"]
+    if is_large_league(context):
+        _render_points_bands(standings, histories, highlighted or [])
+        return
 
     chart_data = []
     for s in standings:
@@ -64,3 +78,39 @@ def render_points_per_gameweek(context: dict, histories: dict) -> None:
         yaxis_title="Points",
     )
     st.plotly_chart(fig, use_container_width=True)
+
+
+def _render_points_bands(standings: list, histories: dict, highlighted: list) -> None:
+    """Large-league mode: spread of weekly points, league average and highlights."""
+    matrix = build_gameweek_matrix(standings, histories, "points")
+    if matrix.empty:
+        st.warning("No gameweek data available")
+        return
+
+    # Filter to last 6 gameweeks
+    recent = matrix.loc[:, matrix.columns > matrix.columns.max() - 6]
+    bands = percentile_bands(recent)
+
+    fig = go.Figure()
+    add_percentile_bands(fig, bands, "pts")
+    fig.add_trace(go.Scattergl(
+        x=bands.index.tolist(),
+        y=bands["mean"],
+        mode="lines",
+        name="League Avg",
+        line=dict(color="#37003c", width=3, dash="dash"),
+    ))
+    add_highlighted_lines(fig, recent, highlighted, {s["entry"]: s["entry_name"] for s in standings}, "pts")
+
+    fig.update_layout(
+        template="plotly_white",
+        height=500,
+        hovermode="x unified",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        margin=dict(t=40, b=40, l=40, r=40),
+        xaxis_title="Gameweek",
+        yaxis_title="Points",
+    )
+    fig.update_xaxes(tickmode="linear", dtick=1)
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"Shaded bands show the spread of {len(recent):,} managers' weekly points.")
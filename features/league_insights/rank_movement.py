@@ -2,12 +2,29 @@
 
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
 
+from analytics.trends import build_gameweek_matrix, league_rank_matrix, sample_rows
+from config import CHART_MAX_POINTS
+from features.league_insights.large_league import add_highlighted_lines, is_large_league
 
-def render_rank_movement(context: dict, histories: dict) -> None:
-    """Display league rank movement chart (position within the mini-league per GW)."""
+
+def render_rank_movement(context: dict, histories: dict, highlighted: list = None) -> None:
+    """Display league rank movement chart (position within the mini-league per GW).
+
+    Large leagues get a rank heatmap, thinned to a fixed number of cells,
+    and a line chart of just the highlighted managers.
+
+    Args:
+        context: League context containing standings data.
+        histories: Dictionary of manager histories keyed by entry ID.
+        highlighted: Entry IDs drawn individually in large-league mode.
+    """
     standings = context["standings"]
+    if is_large_league(context):
+        _render_rank_heatmap(standings, histories, highlighted or [])
+        return
 
     # Build {gw: {team_name: total_points}} from cumulative history
     gw_totals: dict[int, dict[str, int]] = {}
@@ -67,3 +84,53 @@ def render_rank_movement(context: dict, histories: dict) -> None:
         margin=dict(t=20, b=40),
     )
     st.plotly_chart(fig, use_container_width=True)
+
+
+def _render_rank_heatmap(standings: list, histories: dict, highlighted: list) -> None:
+    """Large-league mode: heatmap of league positions plus highlighted lines."""
+    ranks = league_rank_matrix(build_gameweek_matrix(standings, histories, "total_points"))
+    if ranks.empty:
+        st.warning("No rank data available.")
+        return
+
+    # Filter to last 6 gameweeks
+    recent = ranks.loc[:, ranks.columns > ranks.columns.max() - 6]
+    names = {s["entry"]: s["entry_name"] for s in standings}
+    n_teams = len(ranks)
+
+    if highlighted:
+        fig = go.Figure()
+        add_highlighted_lines(fig, recent, highlighted, names, "")
+        fig.update_yaxes(autorange="reversed", title="League Position")
+        fig.update_xaxes(tickmode="linear", dtick=1, title="Gameweek")
+        fig.update_layout(
+            template="plotly_white",
+            height=380,
+            hovermode="x unified",
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+            margin=dict(t=20, b=40),
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    shown = sample_rows(recent, CHART_MAX_POINTS, keep=highlighted)
+    labels = {s["entry"]: f"{s['rank']}. {s['entry_name']}" for s in standings}
+    fig = go.Figure(go.Heatmap(
+        z=shown.to_numpy(),
+        x=shown.columns.tolist(),
+        y=[labels[e] for e in shown.index],
+        colorscale=[[0, "#37003c"], [0.5, "#c084fc"], [1, "#f3e8ff"]],
+        zmin=1,
+        zmax=n_teams,
+        colorbar=dict(title="Position"),
+        hovertemplate="%{y}<br>GW%{x}: position %{z:.0f}<extra></extra>",
+    ))
+    fig.update_yaxes(autorange="reversed", showticklabels=len(shown) <= 60)
+    fig.update_xaxes(tickmode="linear", dtick=1, title="Gameweek")
+    fig.update_layout(
+        template="plotly_white",
+        height=min(max(400, 12 * len(shown)), 900),
+        margin=dict(t=20, b=40),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    if len(shown) < n_teams:
+        st.caption(f"Showing {len(shown):,} of {n_teams:,} managers, evenly spaced by current league position.")
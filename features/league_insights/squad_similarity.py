@@ -0,0 +1,98 @@
+"""Squad similarity — how alike managers' teams are, groups and template distance."""
+
+import plotly.express as px
+import streamlit as st
+
+from analytics.similarity import DEFAULT_CLUSTERS, jaccard
+from config import LARGE_CHART_THRESHOLD
+from data_loader import load_squad_similarity
+from features.context import show_error
+from features.league_insights.large_league import is_large_league
+from features.ui import metric_card
+
+
+@st.fragment
+def render_squad_similarity(context: dict) -> None:
+    """Display squad similarity, manager groups and distance from the template.
+
+    Runs as a fragment, so changing the gameweek or group count reloads
+    only this section.
+
+    Args:
+        context: League context containing league ID, entry IDs and current GW.
+    """
+    current_gw = context["current_gw"]
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        gameweek = st.selectbox(
+            "Gameweek", options=list(range(current_gw, 0, -1)), key="similarity_gw",
+        )
+    with col2:
+        k = st.slider("Groups", min_value=2, max_value=8, value=DEFAULT_CLUSTERS, key="similarity_groups")
+
+    try:
+        report = load_squad_similarity(context["league_id"], gameweek, context["entry_ids"], k)
+    except Exception as e:
+        show_error(e)
+        return
+
+    table = report["table"]
+    if len(table) < 2:
+        st.info("Not enough squads to compare for this gameweek.")
+        return
+
+    closest = table.loc[table["Similarity %"].idxmax()]
+    template = table.loc[table["Template Distance"].idxmin()]
+    unique = table.loc[table["Avg Similarity %"].idxmin()]
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        metric_card("Avg Similarity", f"{table['Avg Similarity %'].mean():.0f}%", "shared players, any two squads")
+    with col2:
+        metric_card("Closest Pair", closest["Team"], f"{closest['Similarity %']:.0f}% like {closest['Nearest Rival']}")
+    with col3:
+        metric_card("Most Template", template["Team"], f"{(1 - template['Template Distance']) * 100:.0f}% template")
+    with col4:
+        metric_card("Most Unique", unique["Team"], f"{unique['Avg Similarity %']:.0f}% avg similarity", "positive")
+
+    st.markdown("**Groups** — managers with similar squads, and the players most of each group own")
+    st.dataframe(report["groups"], hide_index=True, width='stretch')
+
+    st.dataframe(
+        table,
+        hide_index=True,
+        width='stretch',
+        column_config={
+            "Similarity %": st.column_config.ProgressColumn("Similarity %", min_value=0, max_value=100, format="%.0f%%"),
+            "Avg Similarity %": st.column_config.NumberColumn("Avg Similarity %", format="%.1f%%"),
+            "Template Distance": st.column_config.NumberColumn(
+                "Template Distance", format="%.2f", help="0 = the league's most owned squad, 1 = no players in common",
+            ),
+        },
+    )
+    st.caption("Template: " + ", ".join(report["template"]))
+
+    if is_large_league(context):
+        st.caption(f"The pairwise heatmap is shown for up to {LARGE_CHART_THRESHOLD} managers.")
+        return
+
+    order = table.index.map({e: i for i, e in enumerate(report["entries"])}.get).to_numpy()
+    bits = report["bits"][order]
+    fig = px.imshow(
+        jaccard(bits, bits) * 100,
+        x=table["Team"].tolist(),
+        y=table["Team"].tolist(),
+        color_continuous_scale=["#ffffff", "#c084fc", "#7b2d8b", "#37003c"],
+        zmin=0,
+        zmax=100,
+        template="plotly_white",
+        aspect="auto",
+        labels=dict(color="Similarity %"),
+    )
+    fig.update_traces(hovertemplate="%{y} vs %{x}: %{z:.0f}%<extra></extra>")
+    fig.update_layout(
+        height=max(360, 26 * len(table)),
+        margin=dict(t=20, b=20, l=10, r=10),
+        xaxis=dict(showticklabels=False),
+    )
+    st.plotly_chart(fig, use_container_width=True)
@@ -1,7 +1,13 @@
 """Manager analysis feature modules."""
 
-from features.managers.point_distribution import render_point_distribution
+from features._lazy import lazy_exports
 
 __all__ = [
     "render_point_distribution",
+    "render_lineup_efficiency",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "render_point_distribution": ".point_distribution",
+    "render_lineup_efficiency": ".lineup_efficiency",
+})
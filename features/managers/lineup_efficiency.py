@@ -0,0 +1,77 @@
+"""Hindsight-optimal lineups and bench waste for every manager."""
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from analytics.lineups import compute_hindsight_lineups, summarize_lineup_efficiency
+from features.ui import metric_card
+
+
+def render_lineup_efficiency(
+    context: dict,
+    histories: dict,
+    season_picks: dict,
+    points_matrix: pd.DataFrame,
+) -> None:
+    """Display hindsight lineup efficiency for every manager.
+
+    Args:
+        context: League context containing standings and bootstrap data.
+        histories: Dictionary of manager histories keyed by entry ID.
+        season_picks: Nested dict {entry_id: {gameweek: picks or None}}.
+        points_matrix: Players × GW points matrix from load_points_matrix.
+    """
+    lineups = compute_hindsight_lineups(season_picks, histories, points_matrix, context["bootstrap_data"])
+    summary = summarize_lineup_efficiency(lineups, context["standings"])
+
+    if summary.empty:
+        st.warning("No lineup data available")
+        return
+
+    most_efficient = summary.iloc[0]
+    most_lost = summary.loc[summary["Pts Lost"].idxmax()]
+    league_efficiency = summary["Actual Pts"].sum() / max(summary["Optimal Pts"].sum(), 1) * 100
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        metric_card("League Efficiency", f"{league_efficiency:.1f}%", "of hindsight-optimal points")
+    with col2:
+        metric_card("Most Efficient", most_efficient["Team"], f"{most_efficient['Efficiency %']}%", "positive")
+    with col3:
+        metric_card("Most Points Left Out", most_lost["Team"], f"{most_lost['Pts Lost']} pts", "negative")
+    with col4:
+        metric_card("Total Points Left Out", f"{int(summary['Pts Lost'].sum())} pts", "across the league")
+
+    st.caption(
+        "*Optimal = best legal XI and captain each manager could have picked from their own squad, "
+        "with chips as played. Hits are not included.*"
+    )
+    st.dataframe(
+        summary,
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "Efficiency %": st.column_config.ProgressColumn(
+                "Efficiency %", min_value=0, max_value=100, format="%.1f%%"
+            ),
+            "Optimal Pts": st.column_config.NumberColumn("Optimal Pts", format="%d"),
+            "Actual Pts": st.column_config.NumberColumn("Actual Pts", format="%d"),
+            "Pts Lost": st.column_config.NumberColumn("Pts Lost", format="%d"),
+        },
+    )
+
+    fig = px.bar(
+        summary.sort_values("Pts Lost"),
+        x="Pts Lost", y="Team",
+        orientation="h",
+        template="plotly_white",
+        color_discrete_sequence=["#7b2d8b"],
+    )
+    fig.update_layout(
+        height=max(380, len(summary) * 26),
+        margin=dict(t=20, b=20, l=10, r=20),
+        yaxis_title="",
+        xaxis_title="Points Left Out vs Hindsight-Optimal",
+    )
+    st.plotly_chart(fig, use_container_width=True)
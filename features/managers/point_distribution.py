@@ -1,100 +1,84 @@
 """Point distribution by position display."""
 
-from collections import defaultdict
-
 import plotly.graph_objects as go
 import streamlit as st
 
-import fpl_api
-
+from data_loader import load_position_points
+from features.context import show_error
+from features.figure_cache import cached_figure
 from features.ui import section_header
 
 
-def _get_position_name(element_type: int) -> str:
-    """Get position name from element type.
-
-    Args:
-        element_type: Position type (1=GK, 2=DEF, 3=MID, 4=FWD).
-
-    Returns:
-        Position name.
-    """
-    positions = {
-        1: "Goalkeeper",
-        2: "Defense",
-        3: "Midfield",
-        4: "Attack"
-    }
-    return positions.get(element_type, "Unknown")
-
-
-def _calculate_position_points(entry_id: int, gameweek: int, bootstrap_data: dict) -> dict:
-    """Calculate points by position for a manager in a specific gameweek.
-
-    Args:
-        entry_id: Manager's entry ID.
-        gameweek: Gameweek number to analyze.
-        bootstrap_data: Bootstrap data containing player information.
-
-    Returns:
-        Dictionary with position names as keys and total points as values.
-    """
-    # Build player lookup with position info
-    player_lookup = {}
-    for element in bootstrap_data.get("elements", []):
-        player_lookup[element["id"]] = {
-            "element_type": element["element_type"],
-        }
-
-    position_points = defaultdict(int)
-
-    try:
-        # Get the manager's picks for this gameweek
-        picks_data = fpl_api.get_manager_picks(entry_id, gameweek)
-        picks = picks_data.get("picks", [])
-
-        # Get live gameweek data to get player points
-        live_data = fpl_api.get_live_gameweek(gameweek)
-
-        # Build a lookup for player points in this gameweek
-        player_gw_points = {}
-        for element_data in live_data.get("elements", []):
-            player_id = element_data["id"]
-            stats = element_data.get("stats", {})
-            player_gw_points[player_id] = stats.get("total_points", 0)
-
-        # Calculate points by position
-        for pick in picks:
-            player_id = pick["element"]
-            multiplier = pick.get("multiplier", 0)
-
-            # Get points from live data
-            player_points = player_gw_points.get(player_id, 0)
-            total_points = multiplier * player_points
-
-            # Get player position
-            player_info = player_lookup.get(player_id)
-            if player_info:
-                element_type = player_info["element_type"]
-                position_name = _get_position_name(element_type)
-                position_points[position_name] += total_points
-
-    except Exception as e:
-        # Return empty dict if data is not available
-        return {}
-
-    return dict(position_points)
+def _position_pie(position_points: dict) -> go.Figure:
+    """Build a donut chart of one manager's points by position."""
+    fig = go.Figure(data=[go.Pie(
+        labels=list(position_points.keys()),
+        values=list(position_points.values()),
+        hole=0.3,
+        marker=dict(
+            colors=['#37003c', '#7b2d8b', '#00ff87', '#c084fc']
+        ),
+    )])
+
+    fig.update_layout(
+        height=400,
+        showlegend=True,
+        margin=dict(t=20, b=20, l=20, r=20),
+        template="plotly_white",
+    )
+    return fig
+
+
+def _position_comparison(position_points_1: dict, position_points_2: dict, team1_name: str, team2_name: str) -> go.Figure:
+    """Build the grouped bar chart comparing two managers by position."""
+    positions = ["Goalkeeper", "Defense", "Midfield", "Attack"]
+
+    fig = go.Figure()
+
+    values_1 = [position_points_1.get(pos, 0) for pos in positions]
+    fig.add_trace(go.Bar(
+        name=team1_name,
+        x=positions,
+        y=values_1,
+        marker_color='#37003c',
+        text=values_1,
+        textposition='auto',
+    ))
+
+    values_2 = [position_points_2.get(pos, 0) for pos in positions]
+    fig.add_trace(go.Bar(
+        name=team2_name,
+        x=positions,
+        y=values_2,
+        marker_color='#00ff87',
+        text=values_2,
+        textposition='auto',
+    ))
+
+    fig.update_layout(
+        barmode='group',
+        xaxis_title="Position",
+        yaxis_title="Total Points",
+        height=400,
+        showlegend=True,
+        template="plotly_white",
+    )
+    return fig
 
 
+@st.fragment
 def render_point_distribution(context: dict) -> None:
     """Display point distribution by position analysis.
 
+    Runs as a fragment, so changing the gameweek or managers reloads only
+    this section.
+
     Args:
         context: League context containing standings and bootstrap data.
     """
     standings = context["standings"]
-    bootstrap_data = context["bootstrap_data"]
     current_gw = context["current_gw"]
+    data_version = context.get("data_version")
 
     team_options = {s["entry_name"]: s for s in standings}
 
@@ -122,13 +106,15 @@ def render_point_distribution(context: dict) -> None:
     # Calculate position points for both managers
     with st.spinner("Loading gameweek data..."):
         try:
-            position_points_1 = _calculate_position_points(team1["entry"], selected_gw, bootstrap_data)
-            position_points_2 = _calculate_position_points(team2["entry"], selected_gw, bootstrap_data)
+            by_manager = load_position_points(data_version, selected_gw, context["entry_ids"])
 
         except Exception as e:
-            st.error(f"Error calculating point distribution: {e}")
+            show_error(e)
             return
 
+    position_points_1 = by_manager.loc[team1["entry"]].to_dict() if team1["entry"] in by_manager.index else {}
+    position_points_2 = by_manager.loc[team2["entry"]].to_dict() if team2["entry"] in by_manager.index else {}
+
     if not position_points_1 and not position_points_2:
         st.warning("No point data available for the selected managers. This could mean the gameweek hasn't started yet.")
         return
@@ -144,22 +130,11 @@ def render_point_distribution(context: dict) -> None:
             st.markdown(f"**Total Points:** {total_points_1} pts")
 
             # Create pie chart
-            fig1 = go.Figure(data=[go.Pie(
-                labels=list(position_points_1.keys()),
-                values=list(position_points_1.values()),
-                hole=0.3,
-                marker=dict(
-                    colors=['#37003c', '#7b2d8b', '#00ff87', '#c084fc']
-                ),
-            )])
-
-            fig1.update_layout(
-                height=400,
-                showlegend=True,
-                margin=dict(t=20, b=20, l=20, r=20),
-                template="plotly_white",
+            fig1 = cached_figure(
+                "position_pie",
+                (team1["entry"], selected_gw, data_version),
+                lambda: _position_pie(position_points_1),
             )
-
             st.plotly_chart(fig1, key="pie_chart_team1")
 
             # Show breakdown
@@ -193,22 +168,11 @@ def render_point_distribution(context: dict) -> None:
             st.markdown(f"**Total Points:** {total_points_2} pts {diff_text}", unsafe_allow_html=True)
 
             # Create pie chart
-            fig2 = go.Figure(data=[go.Pie(
-                labels=list(position_points_2.keys()),
-                values=list(position_points_2.values()),
-                hole=0.3,
-                marker=dict(
-                    colors=['#37003c', '#7b2d8b', '#00ff87', '#c084fc']
-                ),
-            )])
-
-            fig2.update_layout(
-                height=400,
-                showlegend=True,
-                margin=dict(t=20, b=20, l=20, r=20),
-                template="plotly_white",
+            fig2 = cached_figure(
+                "position_pie",
+                (team2["entry"], selected_gw, data_version),
+                lambda: _position_pie(position_points_2),
             )
-
             st.plotly_chart(fig2, key="pie_chart_team2")
 
             # Show breakdown
@@ -227,37 +191,10 @@ def render_point_distribution(context: dict) -> None:
     section_header("Position Comparison", "Head-to-head breakdown by position")
 
     if position_points_1 and position_points_2:
-        positions = ["Goalkeeper", "Defense", "Midfield", "Attack"]
-
-        fig = go.Figure()
-
-        values_1 = [position_points_1.get(pos, 0) for pos in positions]
-        fig.add_trace(go.Bar(
-            name=team1_name,
-            x=positions,
-            y=values_1,
-            marker_color='#37003c',
-            text=values_1,
-            textposition='auto',
-        ))
-
-        values_2 = [position_points_2.get(pos, 0) for pos in positions]
-        fig.add_trace(go.Bar(
-            name=team2_name,
-            x=positions,
-            y=values_2,
-            marker_color='#00ff87',
-            text=values_2,
-            textposition='auto',
-        ))
-
-        fig.update_layout(
-            barmode='group',
-            xaxis_title="Position",
-            yaxis_title="Total Points",
-            height=400,
-            showlegend=True,
-            template="plotly_white",
+        fig = cached_figure(
+            "position_comparison",
+            (team1["entry"], team2["entry"], team1_name, team2_name, selected_gw, data_version),
+            lambda: _position_comparison(position_points_1, position_points_2, team1_name, team2_name),
         )
 
         st.plotly_chart(fig, use_container_width=True, key="bar_chart_comparison")
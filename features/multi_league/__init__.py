@@ -0,0 +1,17 @@
+"""Multi-league feature modules."""
+
+from features._lazy import lazy_exports
+
+__all__ = [
+    "render_combined_standings",
+    "render_league_overlap",
+    "render_multi_league_summary",
+    "render_shared_rivals",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "render_combined_standings": ".cross_league",
+    "render_league_overlap": ".cross_league",
+    "render_multi_league_summary": ".cross_league",
+    "render_shared_rivals": ".cross_league",
+})
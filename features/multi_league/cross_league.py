@@ -0,0 +1,101 @@
+"""Cross-league views — combined standings, league overlap and shared rivals."""
+
+from collections import Counter
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from analytics.leagues import (
+    build_combined_standings,
+    build_league_overlap,
+    build_shared_rivals,
+)
+from features.ui import metric_card
+
+# Fixed shared-rivals columns a league label must not shadow
+_RIVAL_COLUMNS = {"Team", "Manager", "Leagues"}
+
+
+def _league_labels(leagues: dict) -> dict:
+    """Map league IDs to display names, adding the ID where a name is ambiguous."""
+    counts = Counter(league["name"] for league in leagues.values())
+    return {
+        league_id: (
+            f"{league['name']} ({league_id})"
+            if counts[league["name"]] > 1 or league["name"] in _RIVAL_COLUMNS
+            else league["name"]
+        )
+        for league_id, league in leagues.items()
+    }
+
+
+def render_multi_league_summary(context: dict, membership: pd.DataFrame) -> None:
+    """Display headline counts for the loaded leagues."""
+    shared = int((membership.groupby("entry")["league"].nunique() > 1).sum()) if not membership.empty else 0
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        metric_card("Leagues", str(len(context["leagues"])))
+    with col2:
+        metric_card("Unique Managers", f"{len(context['entry_ids']):,}")
+    with col3:
+        metric_card("League Places", f"{len(membership):,}", "managers × leagues")
+    with col4:
+        metric_card("Shared Managers", f"{shared:,}", "in 2+ leagues", "positive" if shared else "neutral")
+
+
+def render_combined_standings(membership: pd.DataFrame, histories: dict) -> None:
+    """Display one standings table across every loaded league."""
+    combined = build_combined_standings(membership, histories)
+    if combined.empty:
+        st.info("No managers found in these leagues.")
+        return
+
+    st.dataframe(
+        combined,
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "Rank": st.column_config.NumberColumn("Rank", format="%d", width="small"),
+            "Total Pts": st.column_config.ProgressColumn(
+                "Total Pts", min_value=0, max_value=int(combined["Total Pts"].max() or 1), format="%d"
+            ),
+            "Overall Rank": st.column_config.NumberColumn("Overall Rank", format="%d"),
+        },
+    )
+
+
+def render_league_overlap(context: dict, membership: pd.DataFrame) -> None:
+    """Display a heatmap of managers shared between each pair of leagues."""
+    overlap = build_league_overlap(membership)
+    if overlap.shape[0] < 2:
+        st.info("Add a second league to see how they overlap.")
+        return
+    labels = _league_labels(context["leagues"])
+    overlap = overlap.rename(index=labels, columns=labels)
+
+    fig = px.imshow(
+        overlap,
+        text_auto=True,
+        color_continuous_scale=["#f3e8ff", "#7b2d8b", "#37003c"],
+        template="plotly_white",
+        aspect="auto",
+    )
+    fig.update_layout(
+        height=max(320, 60 * len(overlap)),
+        margin=dict(t=20, b=20, l=10, r=10),
+        xaxis_title="",
+        yaxis_title="",
+        coloraxis_showscale=False,
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def render_shared_rivals(context: dict, membership: pd.DataFrame) -> None:
+    """Display managers who appear in more than one league."""
+    rivals = build_shared_rivals(membership)
+    if rivals.empty:
+        st.info("No managers are shared between these leagues.")
+        return
+    st.dataframe(rivals.rename(columns=_league_labels(context["leagues"])), hide_index=True, use_container_width=True)
@@ -1,5 +1,17 @@
 """Player ownership feature modules."""
 
-from features.ownership.player_ownership_breakdown import render_player_ownership
+from features._lazy import lazy_exports
 
-__all__ = ["render_player_ownership"]
+__all__ = [
+    "render_gameweek_ownership",
+    "render_player_ownership",
+    "render_league_vs_global",
+    "render_manager_differentials",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "render_gameweek_ownership": ".player_ownership_breakdown",
+    "render_player_ownership": ".player_ownership_breakdown",
+    "render_league_vs_global": ".differentials",
+    "render_manager_differentials": ".differentials",
+})
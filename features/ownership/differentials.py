@@ -0,0 +1,81 @@
+"""League vs global ownership and each manager's differentials."""
+
+import streamlit as st
+
+from analytics.differentials import manager_differentials
+from data_loader import load_differentials
+from features.context import show_error
+
+_GAP_ROWS = 10
+
+_PERCENT = {
+    "League EO %": st.column_config.NumberColumn("League EO %", format="%.0f%%", help="Effective ownership: captains count twice"),
+    "League Owned %": st.column_config.NumberColumn("League Owned %", format="%.0f%%"),
+    "Global Owned %": st.column_config.NumberColumn("Global Owned %", format="%.1f%%"),
+    "Gap": st.column_config.NumberColumn("Gap", format="%+.0f pts", help="League owned % minus global owned %"),
+    "xP": st.column_config.NumberColumn("xP", format="%.1f"),
+    "Weight": st.column_config.NumberColumn("Weight", format="%.2f", help="Expected multiplier, including bench and vice-captain cover"),
+    "Swing": st.column_config.NumberColumn("Swing", format="%+.2f", help="Expected points gained on the average rival"),
+}
+
+
+def render_league_vs_global(context: dict) -> None:
+    """Display the players whose league ownership differs most from global ownership.
+
+    Args:
+        context: League context containing league ID, entry IDs and current GW.
+    """
+    differentials = load_differentials(context["league_id"], context["current_gw"], context["entry_ids"])
+    ownership = differentials["ownership"]
+    if ownership.empty or not ownership["League Owned %"].any():
+        st.info("No ownership data available for this gameweek.")
+        return
+
+    columns = ["Player", "Team", "Pos", "League Owned %", "Global Owned %", "Gap"]
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**League favourites** — owned here far more than worldwide")
+        st.dataframe(
+            ownership.nlargest(_GAP_ROWS, "Gap")[columns], hide_index=True, width='stretch', column_config=_PERCENT,
+        )
+    with col2:
+        st.markdown("**League blind spots** — popular worldwide, rare here")
+        st.dataframe(
+            ownership.nsmallest(_GAP_ROWS, "Gap")[columns], hide_index=True, width='stretch', column_config=_PERCENT,
+        )
+
+
+@st.fragment
+def render_manager_differentials(context: dict) -> None:
+    """Display one manager's players ranked by their swing against the league.
+
+    Runs as a fragment; every manager's swings are computed together and
+    cached, so switching manager only filters the cached table.
+
+    Args:
+        context: League context containing standings, entry IDs and current GW.
+    """
+    names = {s["entry"]: s["entry_name"] for s in context["standings"]}
+    entry_id = st.selectbox(
+        "Manager", options=list(names), format_func=names.get, key="differentials_manager",
+    )
+
+    try:
+        differentials = load_differentials(context["league_id"], context["current_gw"], context["entry_ids"])
+    except Exception as e:
+        show_error(e)
+        return
+
+    report = manager_differentials(differentials, entry_id)
+    if report["edges"].empty:
+        st.info("No picks available for this manager yet.")
+        return
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**Edges** — their players, by expected gain on the league")
+        st.dataframe(report["edges"], hide_index=True, width='stretch', column_config=_PERCENT)
+    with col2:
+        st.markdown("**Threats** — league-owned players they don't have")
+        st.dataframe(report["threats"], hide_index=True, width='stretch', column_config=_PERCENT)
+    st.caption("Swing uses next gameweek's expected points and the league's effective ownership of the managers shown.")
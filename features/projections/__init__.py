@@ -0,0 +1,17 @@
+"""Season projection feature modules."""
+
+from features._lazy import lazy_exports
+
+__all__ = [
+    "render_projection_summary",
+    "render_projection_table",
+    "render_position_heatmap",
+    "render_expected_points_table",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "render_projection_summary": ".title_odds",
+    "render_projection_table": ".title_odds",
+    "render_position_heatmap": ".title_odds",
+    "render_expected_points_table": ".next_gameweek",
+})
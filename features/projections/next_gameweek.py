@@ -0,0 +1,32 @@
+"""Next gameweek expected points from each manager's current squad."""
+
+import streamlit as st
+
+
+def render_expected_points_table(table) -> None:
+    """Display expected points and the projected league order after next gameweek.
+
+    Args:
+        table: Output of data_loader.load_expected_points.
+    """
+    if table.empty:
+        st.info("No picks available yet to project next gameweek.")
+        return
+
+    st.dataframe(
+        table[["xP Rank", "Team", "Captain", "xP", "Bench xP", "Total", "Pos", "Projected Pos", "Move"]],
+        hide_index=True,
+        width='stretch',
+        column_config={
+            "xP Rank": st.column_config.NumberColumn("xP Rank", format="%d"),
+            "xP": st.column_config.NumberColumn("xP", format="%.1f", help="Expected points next gameweek"),
+            "Bench xP": st.column_config.NumberColumn(
+                "Bench xP", format="%.1f", help="Expected points from automatic substitutions"
+            ),
+            "Total": st.column_config.NumberColumn("Total", format="%d"),
+            "Pos": st.column_config.NumberColumn("Pos", format="%d"),
+            "Projected Pos": st.column_config.NumberColumn("Projected Pos", format="%d"),
+            "Move": st.column_config.NumberColumn("Move", format="%+d"),
+        },
+    )
+    st.caption("Based on FPL's expected points for each player and chance of playing; chips are not assumed.")
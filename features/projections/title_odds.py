@@ -0,0 +1,76 @@
+"""Title and finishing-position odds from the season simulation."""
+
+import plotly.express as px
+import streamlit as st
+
+from analytics.projections import summarize_projections
+from features.ui import metric_card
+
+# Most managers drawn on the finishing-position heatmap
+HEATMAP_MAX_MANAGERS = 30
+
+
+def render_projection_summary(projections: dict, n_sims: int) -> None:
+    """Display headline odds for the title race.
+
+    Args:
+        projections: Output of data_loader.load_projections.
+        n_sims: Number of simulated seasons behind the odds.
+    """
+    table = summarize_projections(projections["inputs"], projections["probabilities"], projections["remaining"])
+    favourite = table.iloc[0]
+    contenders = int((table["Win %"] >= 5).sum())
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        metric_card("Favourite", favourite["Team"], f"{favourite['Win %']:.1f}% to win", "positive")
+    with col2:
+        metric_card("Title Contenders", str(contenders), "5%+ chance to win")
+    with col3:
+        metric_card("Gameweeks Left", str(projections["remaining"]))
+    with col4:
+        metric_card("Simulations", f"{n_sims:,}", "seasons played out")
+
+
+def render_projection_table(projections: dict) -> None:
+    """Display each manager's projected total and finishing odds."""
+    table = summarize_projections(projections["inputs"], projections["probabilities"], projections["remaining"])
+    st.dataframe(
+        table,
+        hide_index=True,
+        width='stretch',
+        column_config={
+            "Win %": st.column_config.ProgressColumn("Win %", min_value=0, max_value=100, format="%.1f%%"),
+            "Top 3 %": st.column_config.ProgressColumn("Top 3 %", min_value=0, max_value=100, format="%.1f%%"),
+            "Last %": st.column_config.NumberColumn("Last %", format="%.1f%%"),
+            "Expected Pos": st.column_config.NumberColumn("Expected Pos", format="%.1f"),
+            "Most Likely": st.column_config.NumberColumn("Most Likely", format="%d"),
+        },
+    )
+
+
+def render_position_heatmap(projections: dict) -> None:
+    """Display a heatmap of the probability of each manager finishing in each position."""
+    table = summarize_projections(projections["inputs"], projections["probabilities"], projections["remaining"])
+    shown = table.sort_values("Expected Pos").head(HEATMAP_MAX_MANAGERS)
+    rows = projections["inputs"].index.get_indexer(shown.index)
+    probabilities = projections["probabilities"][rows][:, :HEATMAP_MAX_MANAGERS] * 100
+
+    fig = px.imshow(
+        probabilities,
+        x=[str(p) for p in range(1, probabilities.shape[1] + 1)],
+        y=shown["Team"].tolist(),
+        color_continuous_scale=["#ffffff", "#c084fc", "#7b2d8b", "#37003c"],
+        zmin=0,
+        template="plotly_white",
+        aspect="auto",
+        labels=dict(x="Finishing position", y="", color="Chance %"),
+    )
+    fig.update_traces(hovertemplate="%{y}<br>Position %{x}: %{z:.1f}%<extra></extra>")
+    fig.update_layout(
+        height=max(320, 28 * len(shown)),
+        margin=dict(t=20, b=20, l=10, r=10),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    if len(table) > len(shown):
+        st.caption(f"Showing the {len(shown)} managers with the best expected finish.")
@@ -1,5 +1,15 @@
 """Standings feature module."""
 
-from .league_standings import render_standings, BASIC_COLUMNS, ALL_COLUMNS
+from features._lazy import lazy_exports
 
-__all__ = ["render_standings", "BASIC_COLUMNS", "ALL_COLUMNS"]
+__all__ = [
+    "render_standings",
+    "BASIC_COLUMNS",
+    "ALL_COLUMNS",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "render_standings": ".league_standings",
+    "BASIC_COLUMNS": ".league_standings",
+    "ALL_COLUMNS": ".league_standings",
+})
@@ -1,24 +1,17 @@
 """League standings table with configurable columns."""
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-import fpl_api
-from data_loader import get_rank_change_indicator
+from analytics.standings import ALL_COLUMNS, build_sort_orders, build_standings_table
+from config import STANDINGS_PAGE_THRESHOLD
 
 
 # Column presets
 BASIC_COLUMNS = ["Rank", "Change", "Chip", "Team", "Manager", "GW Pts", "Total Pts"]
-ALL_COLUMNS = [
-    "Rank", "Change", "Team", "Manager", "GW Pts", "Total Pts",
-    "Behind", "High", "Low", "Chips", "Chips Left",
-    "TF Season", "TF GW", "Hits Season", "Hits GW",
-    "Captain", "Capt Pts"
-]
 
-# All available chips in FPL (each can be used once per half-season)
-ALL_CHIPS = {"wildcard", "freehit", "bboost", "3xc"}
-FIRST_HALF_DEADLINE_GW = 19  # Chips must be used before GW20 for first half
+PAGE_SIZES = [25, 50, 100]
 
 
 def render_standings(
@@ -40,103 +33,28 @@ def render_standings(
         limit: Maximum number of rows to display. None for all rows.
     """
     all_standings = context["standings"]
-    bootstrap_data = context["bootstrap_data"]
-    current_gw = context["current_gw"]
-
     standings = all_standings[:limit] if limit else all_standings
 
     # Determine which columns to show
-    display_columns = columns if columns else ALL_COLUMNS
-
-    # Build player points lookup (needed for captain info)
-    player_points = {}
-    if "Captain" in display_columns or "Capt Pts" in display_columns:
-        for element in bootstrap_data.get("elements", []):
-            player_points[element["id"]] = element.get("event_points", 0)
-
-    # Get leader's total points for "Behind" column
-    leader_total = all_standings[0]["total"] if all_standings else 0
-
-    data = []
-    for s in standings:
-        entry_id = s["entry"]
-        history = (histories or {}).get(entry_id, {}) or {}
-        transfer_list = (transfers or {}).get(entry_id, [])
-        manager_picks = (picks or {}).get(entry_id, {}) or {}
-
-        row = {}
-
-        # Always compute these base values
-        row["Rank"] = s["rank"]
-        row["Change"] = get_rank_change_indicator(s["rank"], s["last_rank"])
-        row["Team"] = s["entry_name"]
-        row["Manager"] = s["player_name"]
-        row["GW Pts"] = s["event_total"]
-        row["Total Pts"] = s["total"]
-
-        # Chip (current GW only)
-        if "Chip" in display_columns:
-            row["Chip"] = _get_current_gw_chip(history.get("chips", []), current_gw)
-
-        # Chips (all season)
-        if "Chips" in display_columns:
-            row["Chips"] = _format_all_chips(history.get("chips", []))
-
-        # Points Behind Leader
-        if "Behind" in display_columns:
-            behind = leader_total - s["total"]
-            row["Behind"] = f"-{behind}" if behind > 0 else "0"
-
-        # High, Low - from history
-        gw_points = [gw.get("points", 0) for gw in history.get("current", [])]
-
-        if "High" in display_columns:
-            row["High"] = max(gw_points) if gw_points else 0
-
-        if "Low" in display_columns:
-            row["Low"] = min(gw_points) if gw_points else 0
-
-        # Chips Left
-        if "Chips Left" in display_columns:
-            row["Chips Left"] = _get_chips_remaining(history.get("chips", []))
-
-        # Transfer columns
-        if "TF Season" in display_columns:
-            row["TF Season"] = len(transfer_list)
-
-        if "TF GW" in display_columns:
-            row["TF GW"] = sum(1 for t in transfer_list if t.get("event") == current_gw)
-
-        # Hits columns
-        gw_history_data = history.get("current", [])
-
-        if "Hits Season" in display_columns:
-            row["Hits Season"] = sum(gw.get("event_transfers_cost", 0) for gw in gw_history_data)
-
-        if "Hits GW" in display_columns:
-            gw_history = next(
-                (gw for gw in gw_history_data if gw.get("event") == current_gw),
-                {}
-            )
-            row["Hits GW"] = gw_history.get("event_transfers_cost", 0)
-
-        # Captain info
-        if "Captain" in display_columns or "Capt Pts" in display_columns:
-            captain_name, captain_pts = _get_captain_info(
-                manager_picks, bootstrap_data, player_points
-            )
-            if "Captain" in display_columns:
-                row["Captain"] = captain_name
-            if "Capt Pts" in display_columns:
-                row["Capt Pts"] = captain_pts
-
-        data.append(row)
-
-    df = pd.DataFrame(data)
-
-    # Reorder columns to match display_columns order
-    ordered_cols = [col for col in display_columns if col in df.columns]
-    df = df[ordered_cols]
+    display_columns = tuple(columns if columns else ALL_COLUMNS)
+
+    cache_key = (
+        context.get("league_id", 0),
+        context.get("data_version", ""),
+        display_columns,
+        tuple(s["entry"] for s in standings),
+        (histories is not None, transfers is not None, picks is not None),
+        context["current_gw"],
+    )
+    df = _cached_standings_table(
+        *cache_key,
+        standings,
+        all_standings[0]["total"] if all_standings else 0,
+        histories,
+        transfers,
+        picks,
+        context["bootstrap_data"],
+    )
 
     # Compute max values for progress bar columns
     max_total = max((s["total"] for s in all_standings), default=2000)
@@ -161,6 +79,9 @@ def render_standings(
         "TF GW": st.column_config.NumberColumn("TF GW", format="%d"),
     }
 
+    if len(df) > STANDINGS_PAGE_THRESHOLD:
+        df = _render_page_controls(df, _cached_sort_orders(*cache_key, df))
+
     st.dataframe(
         df,
         column_config=column_config,
@@ -169,97 +90,74 @@ def render_standings(
     )
 
 
-def _get_current_gw_chip(chips: list, current_gw: int) -> str:
-    """Get chip used in current gameweek only."""
-    chip_abbrev = {
-        "wildcard": "WC",
-        "freehit": "FH",
-        "bboost": "BB",
-        "3xc": "TC",
-    }
-
-    for chip in chips:
-        if chip.get("event") == current_gw:
-            name = chip.get("name", "").lower()
-            return chip_abbrev.get(name, name.upper())
-
-    return "-"
-
-
-def _format_all_chips(chips: list) -> str:
-    """Format all chips used this season with GW numbers."""
-    if not chips:
-        return "-"
-
-    chip_abbrev = {
-        "wildcard": "WC",
-        "freehit": "FH",
-        "bboost": "BB",
-        "3xc": "TC",
-    }
-
-    chip_entries = []
-    for chip in chips:
-        name = chip.get("name", "").lower()
-        gw = chip.get("event", "?")
-        abbrev = chip_abbrev.get(name, name.upper())
-        chip_entries.append(f"{abbrev}({gw})")
-
-    return ", ".join(chip_entries) if chip_entries else "-"
-
-
-def _get_captain_info(
-    picks_data: dict,
-    bootstrap_data: dict,
-    player_points: dict,
-) -> tuple:
-    """Get captain name and points from picks data."""
-    if not picks_data:
-        return "-", 0
-
-    for pick in picks_data.get("picks", []):
-        if pick.get("is_captain"):
-            captain_id = pick["element"]
-            captain_name = fpl_api.get_player_name(captain_id, bootstrap_data)
-            captain_pts = player_points.get(captain_id, 0)
-            return captain_name, captain_pts
+def _render_page_controls(df: pd.DataFrame, orders: dict) -> pd.DataFrame:
+    """Render filter, sort and paging controls and return the visible page.
 
-    return "-", 0
-
-
-def _get_chips_remaining(used_chips: list) -> str:
-    """Get remaining chips by half (all chips can be used once per half)."""
-    chip_abbrev = {
-        "wildcard": "WC",
-        "freehit": "FH",
-        "bboost": "BB",
-        "3xc": "TC",
-    }
-    all_chip_names = ["wildcard", "freehit", "bboost", "3xc"]
-
-    # Track chips used in each half
-    first_half_used = set()
-    second_half_used = set()
-
-    for chip in used_chips:
-        name = chip.get("name", "").lower()
-        gw = chip.get("event", 0)
-        if gw <= FIRST_HALF_DEADLINE_GW:
-            first_half_used.add(name)
-        else:
-            second_half_used.add(name)
-
-    # Get remaining chips for each half
-    first_half_remaining = [chip_abbrev[c] for c in all_chip_names if c not in first_half_used]
-    second_half_remaining = [chip_abbrev[c] for c in all_chip_names if c not in second_half_used]
-
-    # Format output
-    first_str = ", ".join(first_half_remaining) if first_half_remaining else "-"
-    second_str = ", ".join(second_half_remaining) if second_half_remaining else "-"
-
-    if first_half_remaining == list(chip_abbrev.values()):
-        first_str = "All"
-    if second_half_remaining == list(chip_abbrev.values()):
-        second_str = "All"
-
-    return f"1st: {first_str} · 2nd: {second_str}"
+    Only the selected page is handed to st.dataframe, so the amount sent to
+    the browser does not grow with the league.
+    """
+    sortable = [col for col in df.columns if (col, False) in orders]
+    col_filter, col_sort, col_order, col_size, col_page = st.columns([3, 2, 2, 1, 1])
+    with col_filter:
+        query = st.text_input("Filter", placeholder="Team or manager", key="standings_filter")
+    with col_sort:
+        sort_by = st.selectbox("Sort by", sortable, index=0, key="standings_sort")
+    with col_order:
+        descending = st.selectbox(
+            "Order", ["Ascending", "Descending"], index=0, key="standings_order"
+        ) == "Descending"
+    with col_size:
+        page_size = st.selectbox("Rows", PAGE_SIZES, index=1, key="standings_page_size")
+
+    order = orders[(sort_by, descending)]
+    if query:
+        order = order[np.char.find(orders["search"][order], query.lower()) >= 0]
+
+    n_pages = max(1, -(-len(order) // page_size))
+    with col_page:
+        page = st.number_input("Page", min_value=1, max_value=n_pages, value=1, step=1, key="standings_page")
+    page = min(int(page), n_pages)
+
+    start = (page - 1) * page_size
+    visible = order[start:start + page_size]
+    st.caption(f"Showing {start + 1 if len(visible) else 0}–{start + len(visible)} of {len(order):,} managers")
+    return df.iloc[visible]
+
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _cached_sort_orders(
+    league_id: int,
+    data_version: str,
+    columns: tuple,
+    entry_ids: tuple,
+    sources: tuple,
+    current_gw: int,
+    _table: pd.DataFrame,
+) -> dict:
+    """Memoize build_sort_orders under the same key as the standings table."""
+    return build_sort_orders(_table)
+
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _cached_standings_table(
+    league_id: int,
+    data_version: str,
+    columns: tuple,
+    entry_ids: tuple,
+    sources: tuple,
+    current_gw: int,
+    _standings: list,
+    _leader_total: int,
+    _histories: dict,
+    _transfers: dict,
+    _picks: dict,
+    _bootstrap_data: dict,
+) -> pd.DataFrame:
+    """Memoize build_standings_table per league, data version, row range and column set.
+
+    Arguments with a leading underscore are not hashed by Streamlit; the
+    hashed arguments identify them.
+    """
+    return build_standings_table(
+        _standings, _histories, _transfers, _picks, _bootstrap_data, current_gw, list(columns), _leader_total
+    )
@@ -1,13 +1,19 @@
 """Transfer analysis feature modules."""
 
-from features.transfers.league_transfer_summary import render_league_transfer_summary
-from features.transfers.transfer_activity_by_gw import render_transfer_activity_by_gw
-from features.transfers.transfers_by_manager import render_transfers_by_manager
-from features.transfers.most_transferred_players import render_most_transferred_players
+from features._lazy import lazy_exports
 
 __all__ = [
     "render_league_transfer_summary",
     "render_transfer_activity_by_gw",
     "render_transfers_by_manager",
     "render_most_transferred_players",
+    "render_transfer_roi",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "render_league_transfer_summary": ".league_transfer_summary",
+    "render_transfer_activity_by_gw": ".transfer_activity_by_gw",
+    "render_transfers_by_manager": ".transfers_by_manager",
+    "render_most_transferred_players": ".most_transferred_players",
+    "render_transfer_roi": ".transfer_roi",
+})
@@ -1,22 +1,18 @@
 """Most transferred players display."""
 
-from collections import Counter
-
-import pandas as pd
 import plotly.express as px
 import streamlit as st
 
-import fpl_api
+from analytics.transfers import top_transferred
 
 
-def render_most_transferred_players(context: dict, transfers: dict) -> None:
+def render_most_transferred_players(context: dict, analysis: dict) -> None:
     """Display most transferred players in/out.
 
     Args:
-        context: League context containing bootstrap data.
-        transfers: Dictionary of manager transfers keyed by entry ID.
+        context: League context containing the current gameweek.
+        analysis: Output of data_loader.load_transfer_analysis.
     """
-    bootstrap_data = context["bootstrap_data"]
     current_gw = context["current_gw"]
 
     selected_gw = st.selectbox(
@@ -26,26 +22,13 @@ def render_most_transferred_players(context: dict, transfers: dict) -> None:
         key="transfers_gw_select",
     )
 
-    all_transfers_in = []
-    all_transfers_out = []
-
-    for entry_id, transfer_list in transfers.items():
-        for t in transfer_list:
-            if t.get("event") == selected_gw:
-                all_transfers_in.append(t.get("element_in"))
-                all_transfers_out.append(t.get("element_out"))
-
-    in_counts = Counter(all_transfers_in)
-    out_counts = Counter(all_transfers_out)
+    df_in = top_transferred(analysis["players"], selected_gw, "In")
+    df_out = top_transferred(analysis["players"], selected_gw, "Out")
 
     col1, col2 = st.columns(2)
 
     with col1:
-        top_in = in_counts.most_common(10)
-        in_data = [{"Player": fpl_api.get_player_name(pid, bootstrap_data), "Count": count}
-                   for pid, count in top_in if pid]
-        if in_data:
-            df_in = pd.DataFrame(in_data)
+        if not df_in.empty:
             fig_in = px.bar(
                 df_in.sort_values("Count"),
                 x="Count", y="Player",
@@ -65,11 +48,7 @@ def render_most_transferred_players(context: dict, transfers: dict) -> None:
             st.info("No transfers in for this gameweek")
 
     with col2:
-        top_out = out_counts.most_common(10)
-        out_data = [{"Player": fpl_api.get_player_name(pid, bootstrap_data), "Count": count}
-                    for pid, count in top_out if pid]
-        if out_data:
-            df_out = pd.DataFrame(out_data)
+        if not df_out.empty:
             fig_out = px.bar(
                 df_out.sort_values("Count"),
                 x="Count", y="Player",
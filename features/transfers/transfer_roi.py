@@ -0,0 +1,86 @@
+"""Transfer returns — points gained or lost by each transfer over the following gameweeks."""
+
+import pandas as pd
+import streamlit as st
+
+from analytics.transfers import DEFAULT_HORIZON, compute_transfer_roi
+from features.ui import metric_card
+
+
+def render_transfer_roi(context: dict, analysis: dict, points_matrix: pd.DataFrame) -> None:
+    """Display best and worst transfers by points gained over the following gameweeks.
+
+    Args:
+        context: League context containing standings and bootstrap data.
+        analysis: Output of load_transfer_analysis, whose transfers and
+            costs tables are scored.
+        points_matrix: Players × GW points matrix from load_points_matrix.
+    """
+    standings = context["standings"]
+    bootstrap_data = context["bootstrap_data"]
+
+    horizon = st.slider(
+        "Gameweeks to compare", min_value=1, max_value=8, value=DEFAULT_HORIZON, key="transfer_roi_horizon"
+    )
+
+    roi = compute_transfer_roi(analysis["transfers"], analysis["costs"], points_matrix, horizon)
+    if roi.empty:
+        st.info("No transfers to score yet")
+        return
+
+    names = {el["id"]: el["web_name"] for el in bootstrap_data.get("elements", [])}
+    teams = {s["entry"]: s["entry_name"] for s in standings}
+    table = pd.DataFrame({
+        "Team": roi["entry"].map(teams),
+        "GW": roi["event"],
+        "GWs": roi["gameweeks"],
+        "In": roi["element_in"].map(names).fillna("Unknown"),
+        "Out": roi["element_out"].map(names).fillna("Unknown"),
+        "In Pts": roi["in_points"],
+        "Out Pts": roi["out_points"],
+        "Hit": roi["hit"].round(1),
+        "Net Gain": roi["gain"].round(1),
+    })
+
+    by_manager = (
+        table.groupby("Team")
+        .agg(Transfers=("Net Gain", "size"), **{"Net Gain": ("Net Gain", "sum")})
+        .reset_index()
+        .sort_values("Net Gain", ascending=False)
+    )
+    best = table.loc[table["Net Gain"].idxmax()]
+    worst = table.loc[table["Net Gain"].idxmin()]
+    top_manager = by_manager.iloc[0]
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        metric_card("Best Transfer", f"{best['In']} for {best['Out']}", f"{best['Net Gain']:+g} pts · {best['Team']}", "positive")
+    with col2:
+        metric_card("Worst Transfer", f"{worst['In']} for {worst['Out']}", f"{worst['Net Gain']:+g} pts · {worst['Team']}", "negative")
+    with col3:
+        metric_card("Best Transfer Manager", top_manager["Team"], f"{top_manager['Net Gain']:+.0f} pts net")
+    with col4:
+        league_net = table["Net Gain"].sum()
+        metric_card("League Net Gain", f"{league_net:+.0f} pts", f"{len(table)} transfers", "positive" if league_net > 0 else "negative")
+
+    st.caption(
+        f"*Net Gain = points scored by the player in minus the player out over up to {horizon} gameweek(s) "
+        "from the transfer, less any hit. Recent transfers cover only the gameweeks played so far and "
+        "Free Hit transfers count for one gameweek only; GWs shows how many each was scored over.*"
+    )
+
+    col_best, col_worst = st.columns(2)
+    with col_best:
+        st.markdown("**Best Transfers**")
+        st.dataframe(table.nlargest(10, "Net Gain"), hide_index=True, width='stretch')
+    with col_worst:
+        st.markdown("**Worst Transfers**")
+        st.dataframe(table.nsmallest(10, "Net Gain"), hide_index=True, width='stretch')
+
+    st.markdown("**Net Gain by Manager**")
+    st.dataframe(
+        by_manager,
+        hide_index=True,
+        width='stretch',
+        column_config={"Net Gain": st.column_config.NumberColumn("Net Gain", format="%+.1f")},
+    )
@@ -1,7 +1,16 @@
 """FPL API client with caching."""
 
+import hashlib
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
 import requests
-import streamlit as st
+
+from cache import Unavailable, cached
+from config import API_RATE_LIMIT, MAX_FETCH_WORKERS, MAX_STANDINGS_PAGES, STORE_ONLY
 
 BASE_URL = "https://fantasy.premierleague.com/api"
 
@@ -11,8 +20,37 @@ class GameUpdatingError(Exception):
     pass
 
 
+class DataNotSyncedError(Unavailable):
+    """Raised in store-only mode when the sync daemon has not stored the data yet."""
+    pass
+
+
+class _RateLimiter:
+    """Spaces out requests so the whole process stays under a fixed rate."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until this caller's request slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_rate_limiter = _RateLimiter(API_RATE_LIMIT)
+
+
 def _make_request(url: str, timeout: int = 10) -> requests.Response:
     """Make a request and handle game updating state."""
+    if STORE_ONLY:
+        raise DataNotSyncedError(f"{url} has not been synced to the local store yet.")
+    _rate_limiter.wait()
     response = requests.get(url, timeout=timeout)
     try:
         response.raise_for_status()
@@ -23,15 +61,40 @@ def _make_request(url: str, timeout: int = 10) -> requests.Response:
     return response
 
 
-@st.cache_data(ttl=300)
-def get_league_standings(league_id: int) -> dict:
-    """Fetch league standings."""
+@cached(ttl=300)
+def get_league_standings(league_id: int, page: int = 1) -> dict:
+    """Fetch one page (50 managers) of league standings."""
     url = f"{BASE_URL}/leagues-classic/{league_id}/standings/"
+    if page > 1:
+        url += f"?page_standings={page}"
     response = _make_request(url)
     return response.json()
 
 
-@st.cache_data(ttl=3600)
+@cached(ttl=300)
+def get_full_league_standings(league_id: int, max_pages: int = MAX_STANDINGS_PAGES) -> dict:
+    """Fetch every page of league standings, up to ``max_pages``.
+
+    Later pages are requested a batch at a time on the fetch pool until one
+    reports no next page. The result has the same shape as a single page,
+    with every page's rows in ``standings.results``.
+    """
+    data = get_league_standings(league_id)
+    results = list(data.get("standings", {}).get("results", []))
+    has_next = data.get("standings", {}).get("has_next", False)
+    page = 1
+    while has_next and page < max_pages:
+        batch = list(range(page + 1, min(page + MAX_FETCH_WORKERS, max_pages) + 1))
+        for next_page in fetch_many(get_league_standings, [(league_id, p) for p in batch]):
+            if not has_next:
+                break
+            results.extend(next_page.get("standings", {}).get("results", []))
+            has_next = next_page.get("standings", {}).get("has_next", False)
+        page = batch[-1]
+    return {**data, "standings": {**data.get("standings", {}), "has_next": has_next, "results": results}}
+
+
+@cached(ttl=3600)
 def get_bootstrap_data() -> dict:
     """Fetch bootstrap data (players, teams, gameweeks)."""
     url = f"{BASE_URL}/bootstrap-static/"
@@ -39,34 +102,45 @@ def get_bootstrap_data() -> dict:
     return response.json()
 
 
-@st.cache_data(ttl=300, max_entries=1000)
+@cached(ttl=300, max_entries=5000)
 def get_manager_entry(entry_id: int) -> dict:
     """Fetch manager's entry info (includes free transfers)."""
     url = f"{BASE_URL}/entry/{entry_id}/"
     return _make_request(url).json()
 
 
-@st.cache_data(ttl=300, max_entries=1000)
+@cached(ttl=300, max_entries=5000)
 def get_manager_history(entry_id: int) -> dict:
     """Fetch manager's gameweek history."""
     url = f"{BASE_URL}/entry/{entry_id}/history/"
     return _make_request(url).json()
 
 
-@st.cache_data(ttl=300, max_entries=1000)
+@cached(ttl=300, max_entries=5000)
 def get_manager_transfers(entry_id: int) -> list:
     """Fetch manager's transfer history."""
     url = f"{BASE_URL}/entry/{entry_id}/transfers/"
     return _make_request(url).json()
 
 
-@st.cache_data(ttl=300, max_entries=2000)
+@cached(ttl=300, max_entries=2000)
 def get_manager_picks(entry_id: int, gameweek: int) -> dict:
     """Fetch manager's picks for a specific gameweek."""
     url = f"{BASE_URL}/entry/{entry_id}/event/{gameweek}/picks/"
     return _make_request(url).json()
 
 
+@cached()
+def get_finished_manager_picks(entry_id: int, gameweek: int) -> dict:
+    """Fetch manager's picks for a gameweek whose points are final.
+
+    Like get_finished_live_gameweek, these never change and are cached
+    without expiry, bounded only by the cache's size budget.
+    """
+    url = f"{BASE_URL}/entry/{entry_id}/event/{gameweek}/picks/"
+    return _make_request(url).json()
+
+
 def get_current_gameweek(bootstrap_data: dict) -> int:
     """Get the current gameweek number."""
     events = bootstrap_data.get("events", [])
@@ -80,6 +154,62 @@ def get_current_gameweek(bootstrap_data: dict) -> int:
     return 1
 
 
+def _latest_started_event(bootstrap_data: dict, now: datetime) -> dict | None:
+    """Return the latest event whose deadline has passed, or None before GW1."""
+    latest = None
+    for event in bootstrap_data.get("events", []):
+        deadline = event.get("deadline_time")
+        if deadline and datetime.fromisoformat(deadline.replace("Z", "+00:00")) <= now:
+            latest = event
+    return latest
+
+
+def get_gameweek_version(bootstrap_data: dict) -> str:
+    """Return a token that changes at each deadline and when a gameweek is checked.
+
+    Unlike get_data_version it does not roll during a live gameweek, so data
+    that is expensive to refetch (element summaries) is fetched once per
+    gameweek and once more when its points become final.
+    """
+    latest = _latest_started_event(bootstrap_data, datetime.now(timezone.utc))
+    if latest is None:
+        return "pre-season"
+    if latest.get("data_checked"):
+        return f"gw{latest['id']}-final"
+    return f"gw{latest['id']}"
+
+
+def get_data_version(bootstrap_data: dict, live_ttl: int = 300) -> str:
+    """Return a token that changes whenever gameweek results may have changed.
+
+    Points, picks and standings are settled between a gameweek's data being
+    checked and the next deadline, so the token holds steady for that whole
+    window. From a deadline until the gameweek is checked it rolls every
+    ``live_ttl`` seconds. Deadlines are compared with the clock, so a stale
+    bootstrap still rolls over on time.
+
+    Prices, ownership, form and transfers keep moving after the check; key
+    data derived from them on get_bootstrap_version or a short TTL instead.
+    """
+    now = datetime.now(timezone.utc)
+    latest = _latest_started_event(bootstrap_data, now)
+    if latest is None:
+        return "pre-season"
+    if latest.get("data_checked"):
+        return f"gw{latest['id']}-final"
+    return f"gw{latest['id']}-live-{int(now.timestamp() // live_ttl)}"
+
+
+def get_bootstrap_version(bootstrap_data: dict) -> str:
+    """Return a fingerprint of the bootstrap's players and gameweeks.
+
+    It changes whenever a refetched bootstrap carries new prices, ownership,
+    form, transfer counts or gameweek figures.
+    """
+    payload = pickle.dumps((bootstrap_data.get("elements"), bootstrap_data.get("events")))
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
 def get_player_name(player_id: int, bootstrap_data: dict) -> str:
     """Get player name from ID."""
     elements = bootstrap_data.get("elements", [])
@@ -89,8 +219,74 @@ def get_player_name(player_id: int, bootstrap_data: dict) -> str:
     return "Unknown"
 
 
-@st.cache_data(ttl=300)
+def get_player_names(bootstrap_data: dict) -> dict:
+    """Get a player ID → name lookup for every player."""
+    return {player["id"]: player["web_name"] for player in bootstrap_data.get("elements", [])}
+
+
+@cached(ttl=300)
 def get_live_gameweek(gameweek: int) -> dict:
     """Fetch live data for a specific gameweek (player performance)."""
     url = f"{BASE_URL}/event/{gameweek}/live/"
     return _make_request(url).json()
+
+
+@cached(max_entries=64)
+def get_finished_live_gameweek(gameweek: int) -> dict:
+    """Fetch live data for a gameweek whose points are final.
+
+    Once FPL has checked a gameweek's data it never changes, so it is cached
+    without expiry.
+    """
+    url = f"{BASE_URL}/event/{gameweek}/live/"
+    return _make_request(url).json()
+
+
+def fetch_many(fetch, args: list, max_workers: int = MAX_FETCH_WORKERS) -> list:
+    """Call ``fetch(*arg)`` for every tuple in ``args`` on a thread pool.
+
+    Results are returned in the same order as ``args``; the first exception
+    raised by any call is re-raised.
+    """
+    if not args:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(args))) as pool:
+        return list(pool.map(lambda a: fetch(*a), args))
+
+
+@cached(ttl=86400, max_entries=2000)
+def get_element_summary(element_id: int, gameweek_version: str) -> dict:
+    """Fetch a player's per-gameweek history and upcoming fixtures.
+
+    ``gameweek_version`` (from get_gameweek_version) is part of the cache key,
+    so entries expire at the next deadline or when the gameweek is checked
+    instead of on every live refresh.
+    """
+    url = f"{BASE_URL}/element-summary/{element_id}/"
+    return _make_request(url).json()
+
+
+def get_element_summaries(element_ids: list, gameweek_version: str) -> dict:
+    """Fetch element summaries for many players concurrently.
+
+    Requests share the global rate limit. Players whose summary cannot be
+    fetched are left out of the result, except that Unavailable (not synced
+    yet in store-only mode) is re-raised rather than returning a partial set.
+
+    Returns:
+        Dictionary of element summaries keyed by element ID.
+    """
+    def fetch(element_id: int):
+        try:
+            return get_element_summary(element_id, gameweek_version)
+        except Unavailable:
+            raise
+        except Exception:
+            return None
+
+    results = fetch_many(fetch, [(element_id,) for element_id in element_ids])
+    return {
+        element_id: summary
+        for element_id, summary in zip(element_ids, results)
+        if summary is not None
+    }
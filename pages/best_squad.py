@@ -2,12 +2,15 @@
 
 import streamlit as st
 
-from data_loader import show_error
-from fpl_api import get_bootstrap_data, get_live_gameweek, get_current_gameweek, GameUpdatingError
+from data_loader import load_points_matrix
+from features.context import show_error
+from fpl_api import get_bootstrap_data, get_current_gameweek, GameUpdatingError
 from features.best_squad import render_best_squad
 
+_PERIOD_OPTIONS = ["Single GW", "GW Range", "Last 6", "Season"]
+
 st.header("Best Squad")
-st.caption("*Top performing FPL players in football formation*")
+st.caption("*Highest-scoring legal squad — £100m budget, max 3 players per club*")
 
 try:
     # Load bootstrap data (no league context needed)
@@ -15,19 +18,39 @@ try:
         bootstrap_data = get_bootstrap_data()
         current_gw = get_current_gameweek(bootstrap_data)
 
-    # Gameweek selector
-    selected_gw = st.selectbox(
-        "Select Gameweek",
-        options=list(range(1, current_gw + 1)),
-        index=current_gw - 1,
-    )
-
-    # Load live gameweek data
+    period = st.radio("Period", _PERIOD_OPTIONS, horizontal=True, key="best_squad_period")
+
+    if period == "Single GW":
+        # Gameweek selector
+        selected_gw = st.selectbox(
+            "Select Gameweek",
+            options=list(range(1, current_gw + 1)),
+            index=current_gw - 1,
+        )
+        start_gw, end_gw = selected_gw, selected_gw
+    elif period == "GW Range":
+        start_gw, end_gw = st.select_slider(
+            "Select Gameweeks",
+            options=list(range(1, current_gw + 1)),
+            value=(max(1, current_gw - 5), current_gw),
+        )
+    elif period == "Last 6":
+        start_gw, end_gw = max(1, current_gw - 5), current_gw
+    else:
+        start_gw, end_gw = 1, current_gw
+
+    # Multi-GW periods share one season matrix, so changing the range is a slice
     with st.spinner("Loading player performances..."):
-        live_data = get_live_gameweek(selected_gw)
+        if start_gw == end_gw:
+            points_matrix = load_points_matrix((start_gw,))
+        else:
+            points_matrix = load_points_matrix(tuple(range(1, current_gw + 1)))
+        player_points = points_matrix.loc[:, start_gw:end_gw].sum(axis=1)
+
+    period_label = f"GW {start_gw}" if start_gw == end_gw else f"GW {start_gw}–{end_gw}"
 
     # Render formation
-    render_best_squad(bootstrap_data, live_data, selected_gw)
+    render_best_squad(bootstrap_data, player_points, period_label)
 
 except GameUpdatingError:
     st.warning("The FPL game is currently being updated. Please try again later.")
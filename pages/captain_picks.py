@@ -2,7 +2,8 @@
 
 import streamlit as st
 
-from data_loader import get_league_context, load_manager_histories, show_error
+from data_loader import load_manager_histories
+from features.context import get_league_context, show_error
 from features.captain import render_captain_picks
 from features.ui import page_header
 from fpl_api import GameUpdatingError
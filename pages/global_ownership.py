@@ -2,7 +2,7 @@
 
 import streamlit as st
 
-from data_loader import get_global_context, show_error
+from features.context import get_global_context, show_error
 from features.global_stats import render_global_ownership
 from features.ui import page_header
 from fpl_api import GameUpdatingError
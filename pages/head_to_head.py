@@ -2,11 +2,13 @@
 
 import streamlit as st
 
-from data_loader import get_league_context, load_manager_histories, show_error
+from data_loader import load_head_to_head, load_manager_histories
+from features.context import get_league_context, show_error
 from features.head_to_head import (
     render_team_comparison,
     render_season_trajectory,
     render_gameweek_breakdown,
+    render_head_to_head_table,
 )
 from features.ui import page_header, section_header
 from fpl_api import GameUpdatingError
@@ -27,6 +29,9 @@ try:
         section_header("Gameweek Breakdown", "Points scored each gameweek")
         render_gameweek_breakdown(team1_name, team2_name, history1, history2)
 
+    section_header("League H2H Table", "Every gameweek as a match against each other manager shown")
+    render_head_to_head_table(context, load_head_to_head(entry_ids))
+
 except GameUpdatingError:
     st.warning("The FPL game is currently being updated. Please try again later.")
 except Exception as e:
@@ -2,26 +2,33 @@
 
 import streamlit as st
 
-from data_loader import get_league_context, load_manager_histories, show_error
+from data_loader import load_manager_histories
+from features.context import get_league_context, show_error
 from features.league_insights import (
     render_points_per_gameweek,
     render_rank_movement,
+    render_squad_similarity,
+    select_highlighted_managers,
 )
 from features.ui import page_header, section_header
 from fpl_api import GameUpdatingError
 
-page_header("League Insights", eyebrow="League", subtitle="Points trends and rank movement over recent gameweeks")
+page_header("League Insights", eyebrow="League", subtitle="Points trends, rank movement and squad similarity")
 
 try:
     context = get_league_context()
     entry_ids = context["entry_ids"]
     histories = load_manager_histories(entry_ids)
+    highlighted = select_highlighted_managers(context)
 
     section_header("Points per Gameweek", "Weekly performance (dashed line = league average)")
-    render_points_per_gameweek(context, histories)
+    render_points_per_gameweek(context, histories, highlighted)
 
     section_header("Rank Movement", "How league positions have changed over recent gameweeks")
-    render_rank_movement(context, histories)
+    render_rank_movement(context, histories, highlighted)
+
+    section_header("Squad Similarity", "How many players managers' squads share, and who sticks closest to the template")
+    render_squad_similarity(context)
 
 except GameUpdatingError:
     st.warning("The FPL game is currently being updated. Please try again later.")
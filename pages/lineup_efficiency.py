@@ -0,0 +1,32 @@
+"""Lineup Efficiency page - points left on the bench vs hindsight-optimal lineups."""
+
+import streamlit as st
+
+from data_loader import (
+    load_manager_histories,
+    load_points_matrix,
+    load_season_picks,
+)
+from features.context import get_league_context, show_error
+from features.managers import render_lineup_efficiency
+from features.ui import page_header
+from fpl_api import GameUpdatingError
+
+page_header("Lineup Efficiency", eyebrow="League", subtitle="Points left on the bench compared with the best XI and captain in hindsight")
+
+try:
+    context = get_league_context()
+    entry_ids = context["entry_ids"]
+    gameweeks = tuple(range(1, context["current_gw"] + 1))
+
+    with st.spinner("Loading season lineups..."):
+        histories = load_manager_histories(entry_ids)
+        season_picks = load_season_picks(entry_ids, gameweeks)
+        points_matrix = load_points_matrix(gameweeks)
+
+    render_lineup_efficiency(context, histories, season_picks, points_matrix)
+
+except GameUpdatingError:
+    st.warning("The FPL game is currently being updated. Please try again later.")
+except Exception as e:
+    show_error(e)
@@ -0,0 +1,59 @@
+"""Multi-League page - several leagues analyzed together."""
+
+import streamlit as st
+
+from analytics.leagues import build_membership
+from data_loader import load_manager_histories
+from features.context import get_multi_league_context, show_error
+from features.multi_league import (
+    render_combined_standings,
+    render_league_overlap,
+    render_multi_league_summary,
+    render_shared_rivals,
+)
+from features.ui import page_header, section_header
+from fpl_api import GameUpdatingError
+
+_MAX_LEAGUES = 10
+
+page_header("Multi-League", eyebrow="League", subtitle="Combine your mini-leagues and see who you meet in more than one")
+
+if "multi_league_ids" not in st.session_state:
+    st.session_state.multi_league_ids = str(st.session_state.get("league_id") or "")
+
+league_input = st.text_input(
+    "League IDs",
+    placeholder="e.g. 314, 271828, 161803",
+    help=f"Comma-separated, up to {_MAX_LEAGUES} leagues",
+    key="multi_league_ids",
+)
+league_ids = tuple(dict.fromkeys(
+    int(part) for part in league_input.replace(" ", "").split(",")
+    if part.isdigit() and 1 <= int(part) <= 99_999_999
+))[:_MAX_LEAGUES]
+
+if not league_ids:
+    st.info("Enter one or more league IDs to compare.")
+    st.stop()
+
+try:
+    context = get_multi_league_context(league_ids)
+    with st.spinner(f"Loading {len(context['entry_ids']):,} managers..."):
+        histories = load_manager_histories(context["entry_ids"])
+    membership = build_membership(context["leagues"])
+
+    render_multi_league_summary(context, membership)
+
+    section_header("Combined Standings", "Every manager once, ranked on season points")
+    render_combined_standings(membership, histories)
+
+    section_header("League Overlap", "Managers each pair of leagues has in common")
+    render_league_overlap(context, membership)
+
+    section_header("Shared Rivals", "Managers in more than one of your leagues, with their rank in each")
+    render_shared_rivals(context, membership)
+
+except GameUpdatingError:
+    st.warning("The FPL game is currently being updated. Please try again later.")
+except Exception as e:
+    show_error(e)
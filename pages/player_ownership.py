@@ -2,26 +2,26 @@
 
 import streamlit as st
 
-from data_loader import get_league_context, load_manager_picks, show_error
-from features.ownership import render_player_ownership
-from features.ui import page_header
+from features.context import get_league_context, show_error
+from features.ownership import (
+    render_gameweek_ownership,
+    render_league_vs_global,
+    render_manager_differentials,
+)
+from features.ui import page_header, section_header
 from fpl_api import GameUpdatingError
 
 page_header("Player Ownership", eyebrow="League", subtitle="Players owned by managers in the league")
 
 try:
     context = get_league_context()
-    entry_ids = context["entry_ids"]
-    current_gw = context["current_gw"]
+    render_gameweek_ownership(context)
 
-    selected_gw = st.selectbox(
-        "Select Gameweek",
-        options=list(range(1, current_gw + 1)),
-        index=current_gw - 1,
-    )
+    section_header("League vs Global", "Where the league's squads differ from the rest of the game")
+    render_league_vs_global(context)
 
-    picks_data = load_manager_picks(entry_ids, selected_gw)
-    render_player_ownership(context, picks_data, selected_gw)
+    section_header("Differentials", "Each manager's players ranked by how far they can move them up the league next gameweek")
+    render_manager_differentials(context)
 
 except GameUpdatingError:
     st.warning("The FPL game is currently being updated. Please try again later.")
@@ -2,7 +2,7 @@
 
 import streamlit as st
 
-from data_loader import get_league_context, show_error
+from features.context import get_league_context, show_error
 from features.managers import render_point_distribution
 from features.ui import page_header
 from fpl_api import GameUpdatingError
@@ -0,0 +1,48 @@
+"""Season Projections page."""
+
+import streamlit as st
+
+from analytics.projections import DEFAULT_SIMULATIONS
+from data_loader import load_expected_points, load_projections
+from features.context import get_league_context, show_error
+from features.projections import (
+    render_expected_points_table,
+    render_position_heatmap,
+    render_projection_summary,
+    render_projection_table,
+)
+from features.ui import page_header, section_header
+from fpl_api import GameUpdatingError
+
+page_header("Projections", eyebrow="League", subtitle="Simulated odds for how the league finishes")
+
+try:
+    context = get_league_context()
+    projections = load_projections(context["league_id"], context["current_gw"], context["entry_ids"])
+
+    if projections["remaining"] == 0:
+        st.info("Every gameweek has started — the final standings are on the Standings page.")
+    elif projections["inputs"].empty:
+        st.info("No managers to project.")
+    else:
+        render_projection_summary(projections, DEFAULT_SIMULATIONS)
+
+        section_header("Next Gameweek", "Expected points from each manager's current squad, captain and bench")
+        render_expected_points_table(
+            load_expected_points(context["league_id"], context["current_gw"], context["entry_ids"])
+        )
+
+        section_header(
+            "Finishing Odds",
+            f"{DEFAULT_SIMULATIONS:,} simulated seasons from current squads, expected points and each manager's week-to-week variance",
+        )
+        render_projection_table(projections)
+
+        section_header("Finishing Positions", "Chance of each manager finishing in each position")
+        render_position_heatmap(projections)
+        st.caption("Odds are among the managers currently shown — change the range in the sidebar to widen the race.")
+
+except GameUpdatingError:
+    st.warning("The FPL game is currently being updated. Please try again later.")
+except Exception as e:
+    show_error(e)
@@ -3,12 +3,11 @@
 import streamlit as st
 
 from data_loader import (
-    get_league_context,
     load_manager_histories,
     load_manager_picks,
     load_manager_transfers,
-    show_error,
 )
+from features.context import get_league_context, show_error
 from features.standings import render_standings
 from features.ui import page_header
 from fpl_api import GameUpdatingError
@@ -2,12 +2,14 @@
 
 import streamlit as st
 
-from data_loader import get_league_context, load_manager_histories, load_manager_transfers, show_error
+from data_loader import load_points_matrix, load_transfer_analysis
+from features.context import get_league_context, show_error
 from features.transfers import (
     render_league_transfer_summary,
     render_transfer_activity_by_gw,
     render_transfers_by_manager,
     render_most_transferred_players,
+    render_transfer_roi,
 )
 from features.ui import page_header, section_header
 from fpl_api import GameUpdatingError
@@ -18,19 +20,24 @@ try:
     context = get_league_context()
     entry_ids = context["entry_ids"]
 
-    histories = load_manager_histories(entry_ids)
-    transfers = load_manager_transfers(entry_ids)
+    analysis = load_transfer_analysis(
+        context["league_id"], context["data_version"], entry_ids, context["current_gw"]
+    )
 
-    render_league_transfer_summary(context, histories, transfers)
+    render_league_transfer_summary(analysis)
 
     section_header("Activity by Gameweek", "Transfer volume across the season")
-    render_transfer_activity_by_gw(context, histories, transfers)
+    render_transfer_activity_by_gw(analysis)
 
     section_header("Transfers by Manager", "Individual manager transfer records")
-    render_transfers_by_manager(context, histories, transfers)
+    render_transfers_by_manager(analysis)
 
     section_header("Most Transferred Players", "Popular ins and outs in the league")
-    render_most_transferred_players(context, transfers)
+    render_most_transferred_players(context, analysis)
+
+    section_header("Transfer Returns", "Points gained or lost by each transfer in the following gameweeks")
+    points_matrix = load_points_matrix(tuple(range(1, context["current_gw"] + 1)))
+    render_transfer_roi(context, analysis, points_matrix)
 
 except GameUpdatingError:
     st.warning("The FPL game is currently being updated. Please try again later.")
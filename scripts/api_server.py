@@ -0,0 +1,287 @@
+"""Serve the app's league statistics as a read-only JSON API.
+
+Endpoints (all GET, JSON):
+
+    /health
+    /leagues/<id>                          league name, gameweek, data version
+    /leagues/<id>/standings?top=50         standings with chips, hits and captains
+    /leagues/<id>/captains?gw=<n>&top=50   captain picks and what they scored
+    /leagues/<id>/ownership?gw=<n>&top=50&limit=50
+                                           league effective vs global ownership
+
+``top`` is how many managers from the top of the league to include; ``gw``
+defaults to the current gameweek. Responses come from the same loaders and
+shared cache as the app. Each one is kept in memory under its path, query
+and the FPL data version, so repeated requests are served without
+recomputing until the data can have changed; they carry an ETag (answered
+with 304 Not Modified) and are gzipped for clients that accept it. Run from
+the repository root:
+
+    python scripts/api_server.py                    # FPL_API_HOST:FPL_API_PORT
+    python scripts/api_server.py --host 0.0.0.0 --port 8080
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import fpl_api  # noqa: E402
+from analytics.captains import summarize_captains  # noqa: E402
+from analytics.standings import ALL_COLUMNS, build_standings_table  # noqa: E402
+from config import API_CACHE_MAX_BYTES, API_HOST, API_PORT  # noqa: E402
+from data_loader import (  # noqa: E402
+    load_all_data,
+    load_differentials,
+    load_manager_histories,
+    load_manager_picks,
+    load_manager_transfers,
+    load_points_matrix,
+)
+
+DEFAULT_TOP = 50
+MAX_TOP = 1000
+# Seconds the bootstrap (and so the data version) is reused between requests
+_BOOTSTRAP_TTL = 30
+# Responses smaller than this are sent uncompressed
+_GZIP_MIN_BYTES = 1024
+
+
+class ResponseCache:
+    """LRU map of request key → (ETag, body, gzipped body), bounded by size."""
+
+    def __init__(self, max_bytes: int = API_CACHE_MAX_BYTES):
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple, entry: tuple) -> None:
+        size = len(entry[1]) + len(entry[2])
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old[1]) + len(old[2])
+            if size > self._max_bytes:
+                return
+            self._entries[key] = entry
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted[1]) + len(evicted[2])
+
+
+class BadRequest(ValueError):
+    """Raised for malformed or out-of-range query parameters."""
+
+
+_responses = ResponseCache()
+_bootstrap_lock = threading.Lock()
+_bootstrap = {"data": None, "at": 0.0}
+
+
+def _current_bootstrap() -> dict:
+    """Return bootstrap data, refetched from the shared cache at most every _BOOTSTRAP_TTL seconds."""
+    with _bootstrap_lock:
+        if _bootstrap["data"] is None or time.monotonic() - _bootstrap["at"] > _BOOTSTRAP_TTL:
+            _bootstrap["data"] = fpl_api.get_bootstrap_data()
+            _bootstrap["at"] = time.monotonic()
+        return _bootstrap["data"]
+
+
+def _int_param(query: dict, name: str, default: int, low: int, high: int) -> int:
+    """Read an integer query parameter, raising BadRequest when it is invalid."""
+    values = query.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[-1])
+    except ValueError:
+        raise BadRequest(f"{name} must be an integer") from None
+    if not low <= value <= high:
+        raise BadRequest(f"{name} must be between {low} and {high}")
+    return value
+
+
+def _records(df: pd.DataFrame) -> list:
+    """Convert a DataFrame to JSON-ready records, with NaN as null."""
+    return json.loads(df.to_json(orient="records", date_format="iso"))
+
+
+def _league(league_id: int, query: dict) -> tuple:
+    """Load a league's standings and the managers selected by ``top``."""
+    standings_data, bootstrap_data = load_all_data(league_id)
+    standings = standings_data.get("standings", {}).get("results", [])
+    top = _int_param(query, "top", DEFAULT_TOP, 1, MAX_TOP)
+    return standings_data, bootstrap_data, standings[:top]
+
+
+def _gameweek(query: dict, bootstrap_data: dict) -> int:
+    current_gw = fpl_api.get_current_gameweek(bootstrap_data)
+    return _int_param(query, "gw", current_gw, 1, current_gw)
+
+
+def league_summary(league_id: int, query: dict) -> dict:
+    standings_data, bootstrap_data, _ = _league(league_id, query)
+    return {
+        "name": standings_data.get("league", {}).get("name", ""),
+        "managers": len(standings_data.get("standings", {}).get("results", [])),
+        "gameweek": fpl_api.get_current_gameweek(bootstrap_data),
+    }
+
+
+def league_standings(league_id: int, query: dict) -> dict:
+    _, bootstrap_data, standings = _league(league_id, query)
+    entry_ids = tuple(s["entry"] for s in standings)
+    current_gw = fpl_api.get_current_gameweek(bootstrap_data)
+    table = build_standings_table(
+        standings,
+        load_manager_histories(entry_ids),
+        load_manager_transfers(entry_ids),
+        load_manager_picks(entry_ids, current_gw),
+        bootstrap_data,
+        current_gw,
+        ALL_COLUMNS,
+    )
+    table.insert(0, "entry", entry_ids)
+    return {"gameweek": current_gw, "standings": _records(table)}
+
+
+def league_captains(league_id: int, query: dict) -> dict:
+    _, bootstrap_data, standings = _league(league_id, query)
+    gameweek = _gameweek(query, bootstrap_data)
+    points = load_points_matrix((gameweek,))
+    captains = summarize_captains(
+        load_manager_picks(tuple(s["entry"] for s in standings), gameweek),
+        points[gameweek].to_dict() if gameweek in points else {},
+        fpl_api.get_player_names(bootstrap_data),
+    )
+    return {"gameweek": gameweek, "captains": _records(captains)}
+
+
+def league_ownership(league_id: int, query: dict) -> dict:
+    _, bootstrap_data, standings = _league(league_id, query)
+    gameweek = _gameweek(query, bootstrap_data)
+    limit = _int_param(query, "limit", 50, 1, 1000)
+    ownership = load_differentials(league_id, gameweek, tuple(s["entry"] for s in standings))["ownership"]
+    owned = ownership[ownership["League Owned %"] > 0].nlargest(limit, "League EO %")
+    return {"gameweek": gameweek, "ownership": _records(owned.reset_index())}
+
+
+ROUTES = [
+    (re.compile(r"/leagues/(\d+)"), league_summary),
+    (re.compile(r"/leagues/(\d+)/standings"), league_standings),
+    (re.compile(r"/leagues/(\d+)/captains"), league_captains),
+    (re.compile(r"/leagues/(\d+)/ownership"), league_ownership),
+]
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = "FPLLeagueAPI/1.0"
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/") or "/"
+        if path == "/health":
+            self._send_json(HTTPStatus.OK, {"status": "ok"})
+            return
+
+        for pattern, handler in ROUTES:
+            match = pattern.fullmatch(path)
+            if match:
+                break
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"no such endpoint: {path}"})
+            return
+
+        try:
+            data_version = fpl_api.get_data_version(_current_bootstrap())
+            query = parse_qs(url.query)
+            key = (path, tuple(sorted((k, tuple(v)) for k, v in query.items())), data_version)
+            entry = _responses.get(key)
+            if entry is None:
+                league_id = int(match.group(1))
+                payload = {"league_id": league_id, "data_version": data_version, **handler(league_id, query)}
+                body = json.dumps(payload, separators=(",", ":")).encode()
+                etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+                entry = (etag, body, gzip.compress(body, 6) if len(body) >= _GZIP_MIN_BYTES else b"")
+                _responses.put(key, entry)
+        except BadRequest as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            return
+        except (fpl_api.GameUpdatingError, fpl_api.DataNotSyncedError) as e:
+            self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(e)})
+            return
+        except Exception as e:
+            self.log_error("%s failed: %r", path, e)
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "internal error"})
+            return
+
+        etag, body, gzipped = entry
+        if etag in [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        use_gzip = bool(gzipped) and "gzip" in self.headers.get("Accept-Encoding", "")
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(gzipped if use_gzip else body)))
+        self.end_headers()
+        self.wfile.write(gzipped if use_gzip else body)
+
+    def _send_json(self, status: HTTPStatus, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=API_HOST, help=f"interface to bind (default: {API_HOST})")
+    parser.add_argument("--port", type=int, default=API_PORT, help=f"port to listen on (default: {API_PORT})")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), ApiHandler)
+    server.daemon_threads = True
+    print(f"Serving on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark cold start and time-to-first-render for the app and each page.
+
+Every measurement runs in a fresh interpreter so nothing is already
+imported. For each script it reports the time to import Streamlit (the
+floor every page pays), the first render (page imports plus rendering),
+a warm rerun in the same process (rendering alone), and how many modules
+the page pulled in. Without --league the pages stop at the welcome screen,
+which isolates import cost. Run from the repository root:
+
+    python scripts/bench_imports.py
+    python scripts/bench_imports.py --league 314 --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Runs inside the child interpreter; prints one JSON line
+_PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import streamlit
+from streamlit.testing.v1 import AppTest
+streamlit_s = time.perf_counter() - start
+before = set(sys.modules)
+
+at = AppTest.from_file({script!r}, default_timeout=600)
+if {league}:
+    at.session_state["league_id"] = {league}
+start = time.perf_counter()
+at.run()
+first_s = time.perf_counter() - start
+loaded = set(sys.modules) - before
+start = time.perf_counter()
+at.run()
+rerun_s = time.perf_counter() - start
+
+print(json.dumps({{
+    "streamlit_s": streamlit_s,
+    "first_s": first_s,
+    "rerun_s": rerun_s,
+    "modules": len(loaded),
+    "heavy": sorted(m for m in ("pandas", "numpy", "plotly.express", "plotly.graph_objects", "analytics") if m in loaded),
+    "exceptions": len(at.exception),
+}}))
+"""
+
+
+def measure(script: Path, league: int) -> dict:
+    """Run one cold-start measurement of a script in a fresh interpreter."""
+    probe = _PROBE.format(root=str(ROOT), script=str(script), league=league)
+    result = subprocess.run(
+        [sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--league", type=int, default=0, help="league ID to render against")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per script; the median is reported")
+    parser.add_argument("scripts", nargs="*", help="scripts to measure (default: app.py and every page)")
+    args = parser.parse_args()
+
+    scripts = [ROOT / s for s in args.scripts] or [ROOT / "app.py", *sorted((ROOT / "pages").glob("*.py"))]
+    print(f"{'script':<28}{'streamlit':>10}{'first':>9}{'rerun':>9}{'modules':>9}  heavy imports")
+    for script in scripts:
+        runs = [measure(script, args.league) for _ in range(args.repeat)]
+        median = {key: statistics.median(run[key] for run in runs) for key in ("streamlit_s", "first_s", "rerun_s")}
+        last = runs[-1]
+        note = " (raised)" if last["exceptions"] else ""
+        print(
+            f"{str(script.relative_to(ROOT)):<28}{median['streamlit_s']:>9.2f}s{median['first_s']:>8.2f}s"
+            f"{median['rerun_s']:>8.2f}s{last['modules']:>9}  {', '.join(last['heavy']) or '-'}{note}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""Export league reports to CSV, Parquet or JSON without the app.
+
+For each league, writes one file per table into <out>/<league_id>/:
+
+    standings         the Standings page table, every column
+    histories         every manager's gameweek history rows
+    season            managers × gameweeks points and league rank, wide
+    ownership         league effective ownership vs global ownership
+    captaincy         captain, vice-captain and chip per manager per gameweek
+    transfers         every transfer, one row each
+    transfer_summary  transfers, hits and points gained per manager
+
+plus a manifest.json naming the league, gameweek and data version.
+Managers are fetched concurrently through the shared cache, so finished
+gameweeks are fetched once and reruns only pick up what changed; with
+FPL_STORE_ONLY=1 the export reads only what the sync daemon stored. Run
+from the repository root:
+
+    python scripts/export_report.py 314 1234
+    python scripts/export_report.py 314 --format parquet --out /srv/reports --top 500
+"""
+
+import argparse
+import importlib.util
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import fpl_api  # noqa: E402
+from analytics import (  # noqa: E402
+    build_gameweek_costs,
+    build_gameweek_matrix,
+    build_standings_table,
+    build_transfers_table,
+    compute_differentials,
+    compute_transfer_roi,
+    count_hit_costs,
+    league_rank_matrix,
+)
+from analytics.standings import ALL_COLUMNS  # noqa: E402
+from data_loader import (  # noqa: E402
+    load_all_data,
+    load_manager_histories,
+    load_manager_transfers,
+    load_points_matrix,
+    load_season_picks,
+)
+
+FORMATS = ("csv", "parquet", "json")
+
+
+def _log(message: str, error: bool = False) -> None:
+    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} {message}", file=sys.stderr if error else sys.stdout)
+
+
+def build_histories(histories: dict) -> pd.DataFrame:
+    """Stack every manager's ``current`` history rows with an entry column."""
+    frames = [
+        pd.DataFrame(history["current"]).assign(entry=entry_id)
+        for entry_id, history in histories.items()
+        if history and history.get("current")
+    ]
+    if not frames:
+        return pd.DataFrame(columns=["entry", "event"])
+    df = pd.concat(frames, ignore_index=True)
+    return df[["entry", *[c for c in df.columns if c != "entry"]]]
+
+
+def build_season(standings: list, histories: dict) -> pd.DataFrame:
+    """Lay out points and league rank per gameweek as one wide row per manager."""
+    points = build_gameweek_matrix(standings, histories, "points")
+    if points.empty:
+        return pd.DataFrame(columns=["entry"])
+    ranks = league_rank_matrix(build_gameweek_matrix(standings, histories, "total_points"))
+    season = pd.concat([
+        points.add_prefix("points_gw"),
+        ranks.add_prefix("rank_gw"),
+    ], axis=1).astype("Int64")
+    season.columns = [str(c) for c in season.columns]
+    return season.rename_axis("entry").reset_index()
+
+
+def build_captaincy(season_picks: dict, bootstrap_data: dict) -> pd.DataFrame:
+    """List each manager's captain, vice-captain and chip for every gameweek picked."""
+    names = fpl_api.get_player_names(bootstrap_data)
+    rows = []
+    for entry_id, by_gw in season_picks.items():
+        for gw, picks in sorted(by_gw.items()):
+            if not picks or not picks.get("picks"):
+                continue
+            captain = next((p for p in picks["picks"] if p.get("is_captain")), {})
+            vice = next((p for p in picks["picks"] if p.get("is_vice_captain")), {})
+            rows.append({
+                "entry": entry_id,
+                "event": gw,
+                "captain": captain.get("element"),
+                "captain_name": names.get(captain.get("element"), ""),
+                "multiplier": captain.get("multiplier", 0),
+                "vice_captain": vice.get("element"),
+                "vice_captain_name": names.get(vice.get("element"), ""),
+                "chip": picks.get("active_chip") or "",
+            })
+    return pd.DataFrame(rows, columns=[
+        "entry", "event", "captain", "captain_name", "multiplier", "vice_captain", "vice_captain_name", "chip",
+    ])
+
+
+def build_transfer_summary(standings: list, transfers: pd.DataFrame, costs: pd.DataFrame, roi: pd.DataFrame) -> pd.DataFrame:
+    """Count each manager's transfers and hits and total the points they gained."""
+    summary = pd.DataFrame({
+        "entry": [s["entry"] for s in standings],
+        "team": [s["entry_name"] for s in standings],
+    }).set_index("entry")
+    summary["transfers"] = transfers.groupby("entry").size()
+    summary["hit_points"] = count_hit_costs(costs)
+    summary["roi_gain"] = roi.groupby("entry")["gain"].sum()
+    return summary.fillna({"transfers": 0, "hit_points": 0, "roi_gain": 0}).astype(
+        {"transfers": int, "hit_points": int}
+    ).reset_index()
+
+
+def build_league_report(league_id: int, top: int = None) -> tuple:
+    """Collect every table of one league's report.
+
+    Returns:
+        (tables, manifest): dict of table name → DataFrame, and report metadata.
+    """
+    standings_data, bootstrap_data = load_all_data(league_id)
+    standings = standings_data.get("standings", {}).get("results", [])[:top]
+    entry_ids = tuple(s["entry"] for s in standings)
+    current_gw = fpl_api.get_current_gameweek(bootstrap_data)
+    gameweeks = tuple(range(1, current_gw + 1))
+
+    histories = load_manager_histories(entry_ids)
+    transfers = load_manager_transfers(entry_ids)
+    season_picks = load_season_picks(entry_ids, gameweeks)
+    current_picks = {entry_id: by_gw.get(current_gw) for entry_id, by_gw in season_picks.items()}
+    transfers_table = build_transfers_table(transfers)
+    costs = build_gameweek_costs(histories)
+    roi = compute_transfer_roi(transfers_table, costs, load_points_matrix(gameweeks))
+
+    tables = {
+        "standings": build_standings_table(
+            standings, histories, transfers, current_picks, bootstrap_data, current_gw, ALL_COLUMNS,
+        ),
+        "histories": build_histories(histories),
+        "season": build_season(standings, histories),
+        "ownership": compute_differentials(current_picks, bootstrap_data)["ownership"].reset_index(),
+        "captaincy": build_captaincy(season_picks, bootstrap_data),
+        "transfers": transfers_table,
+        "transfer_summary": build_transfer_summary(standings, transfers_table, costs, roi),
+    }
+    manifest = {
+        "league_id": league_id,
+        "league_name": standings_data.get("league", {}).get("name", ""),
+        "gameweek": current_gw,
+        "data_version": fpl_api.get_data_version(bootstrap_data),
+        "managers": len(entry_ids),
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "tables": sorted(tables),
+    }
+    return tables, manifest
+
+
+def write_table(df: pd.DataFrame, path: Path, fmt: str) -> None:
+    """Write one table in the requested format."""
+    if fmt == "parquet":
+        df.to_parquet(path.with_suffix(".parquet"), index=False)
+    elif fmt == "json":
+        df.to_json(path.with_suffix(".json"), orient="records", date_format="iso")
+    else:
+        df.to_csv(path.with_suffix(".csv"), index=False)
+
+
+def export_league(league_id: int, out: Path, fmt: str, top: int = None) -> None:
+    """Build one league's report and write it under ``out/<league_id>/``."""
+    started = time.perf_counter()
+    tables, manifest = build_league_report(league_id, top)
+    directory = out / str(league_id)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, df in tables.items():
+        write_table(df, directory / name, fmt)
+    (directory / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    _log(f"league {league_id}: {manifest['managers']} managers, GW{manifest['gameweek']} "
+         f"in {time.perf_counter() - started:.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("leagues", type=int, nargs="+", help="classic league IDs")
+    parser.add_argument("--out", type=Path, default=Path("reports"), help="output directory (default: reports)")
+    parser.add_argument("--format", choices=FORMATS, default="csv", help="file format (default: csv)")
+    parser.add_argument("--top", type=int, default=None, help="only the top N managers of each league")
+    args = parser.parse_args()
+
+    if args.format == "parquet" and not (
+        importlib.util.find_spec("pyarrow") or importlib.util.find_spec("fastparquet")
+    ):
+        parser.error("Parquet output needs pyarrow: pip install pyarrow")
+
+    failed = 0
+    for league_id in args.leagues:
+        try:
+            export_league(league_id, args.out, args.format, args.top)
+        except Exception as e:
+            failed += 1
+            _log(f"league {league_id} failed: {e}", error=True)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Record bootstrap snapshots for price and ownership history.
+
+Appends the current player prices, ownership and gameweek transfers to the
+snapshot store on a fixed interval. Run from the repository root:
+
+    python scripts/snapshot_bootstrap.py             # every hour, forever
+    python scripts/snapshot_bootstrap.py --once      # a single snapshot
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import fpl_api  # noqa: E402
+from config import SNAPSHOT_STORE_PATH  # noqa: E402
+from snapshot_store import SnapshotStore  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--interval", type=int, default=3600, help="seconds between snapshots")
+    parser.add_argument("--once", action="store_true", help="take one snapshot and exit")
+    parser.add_argument("--path", default=SNAPSHOT_STORE_PATH, help="snapshot store file")
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.path)
+    while True:
+        started = time.time()
+        try:
+            fpl_api.get_bootstrap_data.clear()
+            bootstrap_data = fpl_api.get_bootstrap_data()
+            store.append(bootstrap_data, timestamp=started)
+            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} recorded {len(bootstrap_data.get('elements', []))} players")
+        except Exception as e:
+            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} snapshot failed: {e}", file=sys.stderr)
+        if args.once:
+            break
+        time.sleep(max(args.interval - (time.time() - started), 0))
+
+
+if __name__ == "__main__":
+    main()
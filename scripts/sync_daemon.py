@@ -0,0 +1,163 @@
+"""Keep the shared cache warm so the app never waits on the FPL API.
+
+Each pass refreshes bootstrap and live data and every player's element
+summary, then the standings, entries, histories, transfers and picks of
+every synced league: those in FPL_SYNC_LEAGUES or given with --league,
+plus any opened in the app recently. Passes run every
+couple of minutes while a gameweek is live, more often as a deadline nears,
+and hourly otherwise.
+
+Run the app with FPL_STORE_ONLY=1 and a shared cache backend (sqlite or
+redis) to have pages read only what this daemon stores. Run from the
+repository root:
+
+    python scripts/sync_daemon.py                   # sync forever
+    python scripts/sync_daemon.py --league 314 --once
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import fpl_api  # noqa: E402
+from config import (  # noqa: E402
+    MAX_STANDINGS_PAGES,
+    SYNC_DEADLINE_INTERVAL,
+    SYNC_IDLE_INTERVAL,
+    SYNC_LEAGUES,
+    SYNC_LIVE_INTERVAL,
+)
+from data_loader import final_gameweeks, get_recent_league_ids  # noqa: E402
+
+# The daemon is the one process that talks to the API, even if the app's
+# store-only setting is exported in its environment
+fpl_api.STORE_ONLY = False
+
+
+def _log(message: str, error: bool = False) -> None:
+    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} {message}", file=sys.stderr if error else sys.stdout)
+
+
+def _deadlines(bootstrap_data: dict) -> list:
+    """Return (gameweek, deadline datetime) for every scheduled gameweek."""
+    return [
+        (event["id"], datetime.fromisoformat(event["deadline_time"].replace("Z", "+00:00")))
+        for event in bootstrap_data.get("events", [])
+        if event.get("deadline_time")
+    ]
+
+
+def next_interval(bootstrap_data: dict) -> float:
+    """Seconds until the next pass, based on where we are in the gameweek cycle."""
+    now = datetime.now(timezone.utc)
+    started = [gw for gw, deadline in _deadlines(bootstrap_data) if deadline <= now]
+    if started and started[-1] not in final_gameweeks(bootstrap_data):
+        return SYNC_LIVE_INTERVAL
+
+    upcoming = [deadline for _, deadline in _deadlines(bootstrap_data) if deadline > now]
+    if not upcoming:
+        return SYNC_IDLE_INTERVAL
+    # Wake just after the deadline so the new picks are stored straight away
+    until = (upcoming[0] - now).total_seconds() + 60
+    if until < 24 * 3600:
+        return min(SYNC_DEADLINE_INTERVAL, until)
+    return min(SYNC_IDLE_INTERVAL, until)
+
+
+def sync_standings(league_id: int) -> list:
+    """Refresh every standings page of a league and return its managers' entry IDs."""
+    page, has_next = 0, True
+    while has_next and page < MAX_STANDINGS_PAGES:
+        page += 1
+        data = fpl_api.get_league_standings.refresh(league_id, page)
+        has_next = data.get("standings", {}).get("has_next", False)
+    standings = fpl_api.get_full_league_standings.refresh(league_id)
+    return [s["entry"] for s in standings.get("standings", {}).get("results", [])]
+
+
+def sync_manager(entry_id: int, pending: list, final: set) -> bool:
+    """Refresh one manager's entry, history, transfers and picks. Returns False on failure."""
+    try:
+        fpl_api.get_manager_entry.refresh(entry_id)
+        history = fpl_api.get_manager_history.refresh(entry_id)
+        fpl_api.get_manager_transfers.refresh(entry_id)
+        played = {row["event"] for row in history.get("current", [])}
+        for gw in pending:
+            if gw in played:
+                fpl_api.get_manager_picks.refresh(entry_id, gw)
+        # Final picks are stored without expiry, so only new ones are fetched
+        for gw in sorted(final & played):
+            fpl_api.get_finished_manager_picks(entry_id, gw)
+        return True
+    except Exception:
+        return False
+
+
+def sync_element_summaries(bootstrap_data: dict) -> None:
+    """Store every player's element summary for the current gameweek version.
+
+    Summaries are keyed by gameweek version, the same token the app reads
+    them with, so only the first pass after a deadline or after a gameweek
+    is checked fetches them.
+    """
+    gameweek_version = fpl_api.get_gameweek_version(bootstrap_data)
+    element_ids = [element["id"] for element in bootstrap_data.get("elements", [])]
+    summaries = fpl_api.get_element_summaries(element_ids, gameweek_version)
+    if len(summaries) < len(element_ids):
+        _log(f"{len(element_ids) - len(summaries)} element summaries failed", error=True)
+
+
+def sync_pass(league_ids: list) -> dict:
+    """Run one full refresh and return the bootstrap data it fetched."""
+    bootstrap_data = fpl_api.get_bootstrap_data.refresh()
+    final = final_gameweeks(bootstrap_data)
+    now = datetime.now(timezone.utc)
+    # Gameweeks past their deadline whose points may still change
+    pending = [gw for gw, deadline in _deadlines(bootstrap_data) if deadline <= now and gw not in final]
+
+    fpl_api.fetch_many(fpl_api.get_live_gameweek.refresh, [(gw,) for gw in pending])
+    fpl_api.fetch_many(fpl_api.get_finished_live_gameweek, [(gw,) for gw in sorted(final)])
+    sync_element_summaries(bootstrap_data)
+
+    entry_ids = set()
+    for league_id in league_ids:
+        try:
+            entry_ids.update(sync_standings(league_id))
+        except Exception as e:
+            _log(f"league {league_id} failed: {e}", error=True)
+
+    results = fpl_api.fetch_many(sync_manager, [(entry_id, pending, final) for entry_id in sorted(entry_ids)])
+    failed = results.count(False)
+    _log(
+        f"synced {len(league_ids)} leagues, {len(entry_ids)} managers"
+        + (f" ({failed} failed)" if failed else "")
+        + (f", GW{pending[-1]} live" if pending else "")
+    )
+    return bootstrap_data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--league", type=int, action="append", default=[], help="league ID to sync (repeatable)")
+    parser.add_argument("--once", action="store_true", help="run a single pass and exit")
+    args = parser.parse_args()
+
+    while True:
+        league_ids = sorted(set(SYNC_LEAGUES) | set(args.league) | set(get_recent_league_ids()))
+        try:
+            interval = next_interval(sync_pass(league_ids))
+        except Exception as e:
+            _log(f"sync failed: {e}", error=True)
+            interval = SYNC_LIVE_INTERVAL
+        if args.once:
+            break
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Append-only store of bootstrap snapshots for price and ownership history.
+
+The bootstrap endpoint only describes the present, so the snapshotter
+(scripts/snapshot_bootstrap.py) records its player fields on a schedule.
+Snapshots are written as blocks to a single file::
+
+    FPLSNAP1 | block | block | ...
+
+Each block is a fixed header followed by a zlib-compressed payload of int32
+columns. A keyframe block holds the element IDs and the absolute values; every
+other block holds only the change in each value since the previous snapshot,
+which is mostly zeros and compresses to a few hundred bytes. A new keyframe
+starts whenever the set of players changes.
+"""
+
+import struct
+import time
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from config import SNAPSHOT_STORE_PATH
+
+MAGIC = b"FPLSNAP1"
+
+# Stored columns, in payload order. Ownership is kept in hundredths of a percent.
+COLUMNS = ("now_cost", "selected_by_percent", "transfers_in_event", "transfers_out_event")
+_SCALES = {"selected_by_percent": 100}
+
+# timestamp, player count, payload bytes, flags
+_HEADER = struct.Struct("<qIIB")
+_KEYFRAME = 0x01
+
+
+class SnapshotStore:
+    """Append and query bootstrap snapshots in a single file.
+
+    Appends are meant to come from a single writer process; any number of
+    readers may query the file while it grows.
+    """
+
+    def __init__(self, path: str | Path = SNAPSHOT_STORE_PATH):
+        self.path = Path(path)
+        self._valid_bytes = 0
+        self._last = None
+
+    def append(self, bootstrap_data: dict, timestamp: float | None = None) -> None:
+        """Record the player fields of one bootstrap response.
+
+        Args:
+            bootstrap_data: Bootstrap data containing the elements list.
+            timestamp: Unix time of the snapshot. Defaults to now.
+        """
+        elements = sorted(bootstrap_data.get("elements", []), key=lambda el: el["id"])
+        ids = np.array([el["id"] for el in elements], dtype=np.int32)
+        values = np.array(
+            [[round(float(el.get(col) or 0) * _SCALES.get(col, 1)) for el in elements] for col in COLUMNS],
+            dtype=np.int32,
+        ).reshape(len(COLUMNS), len(ids))
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        last = self._last if self._last is not None else self._last_snapshot()
+        if last is not None and np.array_equal(last[0], ids):
+            flags, payload = 0, values - last[1]
+        else:
+            flags, payload = _KEYFRAME, np.vstack([ids, values])
+
+        data = zlib.compress(payload.astype("<i4").tobytes())
+        header = _HEADER.pack(int(timestamp if timestamp is not None else time.time()), len(ids), len(data), flags)
+        with open(self.path, "r+b" if self.path.exists() else "wb") as f:
+            # Drop any partially written tail so the new block stays aligned
+            f.truncate(self._valid_bytes)
+            f.seek(self._valid_bytes)
+            if self._valid_bytes == 0:
+                f.write(MAGIC)
+            f.write(header + data)
+            self._valid_bytes = f.tell()
+        self._last = (ids, values)
+
+    def player_series(self, element_ids: list) -> pd.DataFrame:
+        """Return the recorded price, ownership and transfer series for players.
+
+        Args:
+            element_ids: FPL element IDs to extract.
+
+        Returns:
+            DataFrame with one row per player per snapshot: timestamp (UTC),
+            element, price (£m), ownership (%), transfers_in, transfers_out
+            and net_transfers, sorted by element then time.
+        """
+        wanted = np.unique(np.asarray(list(element_ids), dtype=np.int32))
+        frames = []
+        for timestamps, ids, keyframe, deltas in self._segments():
+            rows = np.searchsorted(ids, wanted).clip(0, max(len(ids) - 1, 0))
+            present = ids[rows] == wanted if len(ids) else np.zeros(len(wanted), dtype=bool)
+            if not present.any():
+                continue
+            rows = rows[present]
+            # Absolute values are the keyframe plus the running sum of deltas
+            steps = np.stack([keyframe[:, rows]] + [d[:, rows] for d in deltas])
+            frames.append(_to_frame(timestamps, ids[rows], np.cumsum(steps, axis=0)))
+
+        if not frames:
+            return pd.DataFrame(
+                columns=["timestamp", "element", "price", "ownership", "transfers_in", "transfers_out", "net_transfers"]
+            )
+        return pd.concat(frames, ignore_index=True).sort_values(["element", "timestamp"]).reset_index(drop=True)
+
+    def _blocks(self):
+        """Yield (timestamp, count, flags, payload array) for every complete block."""
+        self._valid_bytes = 0
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{self.path} is not a snapshot store")
+            self._valid_bytes = len(MAGIC)
+            while True:
+                header = f.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    return
+                timestamp, count, size, flags = _HEADER.unpack(header)
+                data = f.read(size)
+                if len(data) < size:
+                    return  # partially written tail from an interrupted append
+                self._valid_bytes = f.tell()
+                rows = len(COLUMNS) + (1 if flags & _KEYFRAME else 0)
+                payload = np.frombuffer(zlib.decompress(data), dtype="<i4").reshape(rows, count)
+                yield timestamp, count, flags, payload
+
+    def _segments(self):
+        """Yield (timestamps, ids, keyframe values, delta arrays) per keyframe run."""
+        timestamps, ids, keyframe, deltas = [], None, None, []
+        for timestamp, _, flags, payload in self._blocks():
+            if flags & _KEYFRAME:
+                if ids is not None:
+                    yield np.array(timestamps), ids, keyframe, deltas
+                timestamps, ids, keyframe, deltas = [timestamp], payload[0], payload[1:], []
+            elif ids is not None:
+                timestamps.append(timestamp)
+                deltas.append(payload)
+        if ids is not None:
+            yield np.array(timestamps), ids, keyframe, deltas
+
+    def _last_snapshot(self):
+        """Return (ids, absolute values) of the newest snapshot, or None."""
+        last = None
+        for _, ids, keyframe, deltas in self._segments():
+            last = (ids, np.sum([keyframe] + deltas, axis=0, dtype=np.int32))
+        return last
+
+
+def _to_frame(timestamps: np.ndarray, ids: np.ndarray, series: np.ndarray) -> pd.DataFrame:
+    n_snapshots, _, n_players = series.shape
+    values = dict(zip(COLUMNS, series.transpose(1, 0, 2).reshape(len(COLUMNS), -1)))
+    return pd.DataFrame({
+        "timestamp": pd.to_datetime(np.repeat(timestamps, n_players), unit="s", utc=True),
+        "element": np.tile(ids, n_snapshots),
+        "price": values["now_cost"] / 10,
+        "ownership": values["selected_by_percent"] / _SCALES["selected_by_percent"],
+        "transfers_in": values["transfers_in_event"],
+        "transfers_out": values["transfers_out_event"],
+        "net_transfers": values["transfers_in_event"] - values["transfers_out_event"],
+    })